@@ -44,12 +44,15 @@ INSTALLED_APPS = [
     ]
 
 MIDDLEWARE = [
+    'core.instrumentation.SQLInstrumentationMiddleware',  # [신규] 요청별 SQL 계측 (SQL_INSTRUMENTATION)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'core.snapshot.SnapshotReadMiddleware',  # [신규] 조회 요청은 읽기 전용 스냅샷에서 (SNAPSHOT_ENABLED)
+    'core.profiling.ProfilingMiddleware',  # [신규] 요청 프로파일링 (PROFILING_ENABLED, 인증 뒤에 위치)
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -82,8 +85,20 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    },
+    # [신규] 조회 API 용 읽기 전용 스냅샷 (core/snapshot.py, python manage.py publish_snapshot 으로 게시)
+    'snapshot': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': (BASE_DIR / 'snapshot.sqlite3').as_uri() + '?mode=ro&immutable=1',
+        'OPTIONS': {'init_command': 'PRAGMA mmap_size=268435456'},  # 256MB
+        'TEST': {'MIRROR': 'default'},
+    },
 }
+DATABASE_ROUTERS = ['core.snapshot.SnapshotRouter']
+
+# [신규] 켜면 GET 조회 요청(관리자 화면 제외)이 게시된 스냅샷에서 읽습니다. 적재/관리자 쓰기는 default 그대로.
+SNAPSHOT_ENABLED = False
+SNAPSHOT_DB_PATH = BASE_DIR / 'snapshot.sqlite3'
 
 
 # Password validation
@@ -123,3 +138,38 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# [신규] 배치 시뮬레이션 프로세스 수 (None 이면 CPU 수)
+SIMULATION_WORKERS = None
+
+# [신규] 데이터 버전 파일 위치 (ETag/조건부 GET, core/versioning.py)
+DATA_VERSION_DIR = BASE_DIR / 'data_versions'
+
+# [신규] 조회 API 응답 캐시 (core/response_cache.py)
+# 키에 데이터 버전이 들어가므로 만료 시간 없이 보관합니다. 여러 프로세스가 함께 쓰려면
+# 'django.core.cache.backends.filebased.FileBasedCache' + LOCATION 경로로 바꾸면 됩니다.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'responses',
+        'TIMEOUT': None,
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    },
+}
+RESPONSE_CACHE_ALIAS = 'responses'
+
+# [신규] 요청별 SQL 계측 (core/instrumentation.py)
+# 켜면 응답에 Server-Timing / X-DB-Queries 헤더를 붙이고, 느린 요청과 N+1 의심 쿼리를 'core.sql' 로거에 남깁니다.
+SQL_INSTRUMENTATION = False
+SQL_SLOW_REQUEST_MS = 500
+SQL_N_PLUS_ONE_THRESHOLD = 5  # 같은 모양의 쿼리가 이 횟수를 넘으면 N+1 로 봅니다.
+
+# [신규] 요청 프로파일링 (core/profiling.py)
+# 켜면 X-Profile: <PROFILING_TOKEN> 헤더 또는 스태프의 ?profile=1 요청을 cProfile 로 실행하고,
+# 보고서를 PROFILE_DIR 에 저장합니다. (관리자 화면 '프로파일 보고서 목록'에서 확인)
+PROFILING_ENABLED = False
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')  # 비워두면 헤더 방식은 쓰지 않음
+PROFILE_DIR = BASE_DIR / 'profiles'
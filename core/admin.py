@@ -1,3 +1,36 @@
 from django.contrib import admin
+from django.utils.html import format_html
+from .models import ProfileReport
+from .profiling import read_report
 
-# Register your models here.
+
+@admin.register(ProfileReport)
+class ProfileReportAdmin(admin.ModelAdmin):
+    """[신규] 요청 프로파일링 보고서 (읽기 전용)"""
+    list_display = ['created_at', 'method', 'path', 'status_code', 'duration_ms', 'query_count', 'serializer_ms', 'orm_ms', 'render_ms']
+    list_filter = ['method', 'status_code']
+    search_fields = ['path', 'name']
+    date_hierarchy = 'created_at'
+    fields = [
+        ('method', 'path', 'status_code'),
+        ('duration_ms', 'query_count', 'sql_ms'),
+        ('serializer_ms', 'orm_ms', 'render_ms'),
+        'name', 'created_at', 'report',
+    ]
+    readonly_fields = [
+        'method', 'path', 'status_code', 'duration_ms', 'query_count', 'sql_ms',
+        'serializer_ms', 'orm_ms', 'render_ms', 'name', 'created_at', 'report',
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def report(self, obj):
+        text = read_report(obj.name)
+        if text is None:
+            return "📭 보고서 파일이 없습니다. (PROFILE_DIR 에서 지워짐)"
+        return format_html('<pre style="white-space: pre; overflow-x: auto; font-size: 12px;">{}</pre>', text)
+    report.short_description = "보고서"
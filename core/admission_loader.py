@@ -0,0 +1,149 @@
+"""
+대학 입시 결과(03_admission.json) 일괄 적재
+
+파일을 bulk_loader.iter_array 로 스트리밍하며 BATCH_SIZE 개씩 처리합니다. 배치 하나마다
+1. 참조하는 학과를 계열/대학/최종 정보(effective_info)와 함께 한 번에 읽고 (in_bulk + select_related),
+2. 학과별 최종 정보를 한 번만 해석하고 (effective_info.resolve_many),
+3. DepartmentAdmission 을 (대학, 계열, 학과명) 키로 bulk upsert 한 뒤 id 를 한 번에 다시 읽고,
+4. AdmissionResult 를 (학과, 연도) 키로 bulk upsert 합니다.
+쿼리 수는 배치 크기에만 비례하고 행 수/연도 수와 상관없으며, 같은 파일을 다시 불러와도 행이 늘지 않습니다.
+
+- 전체 적재는 한 트랜잭션입니다.
+- bulk 저장은 시그널을 보내지 않으므로 끝나면 core 데이터 버전을 직접 올립니다.
+"""
+import time
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from . import versioning
+from .bulk_loader import iter_array
+from .models import DepartmentAdmission, AdmissionResult
+
+BATCH_SIZE = 500
+
+RESULT_FIELDS = [
+    'quota',
+    'korean_grade', 'korean_percentile',
+    'math_grade', 'math_percentile',
+    'english_grade',
+    'inquiry_grade', 'inquiry_percentile',
+]
+# quota 는 recruit_count 가 없으면 0 으로 저장하므로 제외
+REQUIRED_FIELDS = ['year'] + RESULT_FIELDS[1:]
+
+
+@dataclass
+class AdmissionLoadStats:
+    started: float = field(default_factory=time.perf_counter)
+    items: int = 0
+    saved: int = 0
+    batches: int = 0
+    errors: list = field(default_factory=list)  # [(학과 pk, 사유), ...]
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def _result_values(fields):
+    """픽스처 fields → AdmissionResult 필드 값 (recruit_count 는 quota, None 이면 0)"""
+    quota = fields.get('recruit_count', fields.get('quota'))
+    values = {name: fields.get(name) for name in RESULT_FIELDS}
+    values['quota'] = quota if quota is not None else 0
+    return values
+
+
+def _flush(items, stats):
+    from universities.effective_info import resolve_many
+    from universities.models import UniversityDepartment
+
+    # 1. 학과를 한 번에 읽기
+    departments = UniversityDepartment.objects.select_related(
+        'division__university', 'effective_info'
+    ).in_bulk({item['fields'].get('department') for item in items} - {None})
+
+    rows = []
+    for item in items:
+        fields = item.get('fields', {})
+        department_pk = fields.get('department')
+        if department_pk is None:
+            stats.errors.append((None, "'department' 값이 없습니다."))
+        elif department_pk not in departments:
+            stats.errors.append((department_pk, "UniversityDepartment 가 DB에 없습니다."))
+        elif missing := [name for name in REQUIRED_FIELDS if fields.get(name) is None]:
+            stats.errors.append((department_pk, f"값이 없습니다: {', '.join(missing)}"))
+        else:
+            rows.append((departments[department_pk], fields))
+    if not rows:
+        return
+
+    # 2. 학과별 최종 정보 (학과당 한 번)
+    used = {dept.pk: dept for dept, _ in rows}
+    final_infos = resolve_many(used.values())
+
+    # 3. DepartmentAdmission upsert → 키별 id
+    def key(dept):
+        return (dept.division.university.name, dept.division.name, dept.name)
+
+    admissions = {}
+    for dept in used.values():
+        info = final_infos[dept.pk]
+        university, division, department = key(dept)
+        admissions[key(dept)] = DepartmentAdmission(
+            university=university, division=division, department=department,
+            recruitment_group=dept.recruitment_group,
+            standards_json=info['standards'],
+            scoring_json=info['scores'],
+        )
+    DepartmentAdmission.objects.bulk_create(
+        admissions.values(), update_conflicts=True,
+        unique_fields=['university', 'division', 'department'],
+        update_fields=['recruitment_group', 'standards_json', 'scoring_json'],
+    )
+    admission_ids = {
+        (university, division, department): pk
+        for pk, university, division, department in DepartmentAdmission.objects.filter(
+            university__in={k[0] for k in admissions}, department__in={k[2] for k in admissions},
+        ).values_list('pk', 'university', 'division', 'department')
+    }
+
+    # 4. AdmissionResult upsert (같은 배치 안에서 학과/연도가 겹치면 뒤의 항목이 이깁니다)
+    results = {}
+    for dept, fields in rows:
+        admission_id = admission_ids[key(dept)]
+        results[(admission_id, fields['year'])] = AdmissionResult(
+            department_id=admission_id, year=fields['year'], **_result_values(fields),
+        )
+    AdmissionResult.objects.bulk_create(
+        results.values(), update_conflicts=True,
+        unique_fields=['department', 'year'], update_fields=RESULT_FIELDS,
+    )
+    stats.saved += len(results)
+
+
+def load(fp, batch_size=BATCH_SIZE, progress=None):
+    """
+    열린 JSON 파일(fp)의 입시 결과를 한 트랜잭션으로 불러옵니다.
+    progress(stats) 는 배치마다 호출됩니다.
+    """
+    stats = AdmissionLoadStats()
+    with transaction.atomic():
+        batch = []
+        for item in iter_array(fp):
+            batch.append(item)
+            stats.items += 1
+            if len(batch) >= batch_size:
+                _flush(batch, stats)
+                stats.batches += 1
+                batch = []
+                if progress:
+                    progress(stats)
+        if batch:
+            _flush(batch, stats)
+            stats.batches += 1
+            if progress:
+                progress(stats)
+        if stats.saved:
+            versioning.bump(versioning.CORE)
+    return stats
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # 검색/자동완성 색인 갱신용 시그널 연결
+        from . import signals  # noqa: F401
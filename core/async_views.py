@@ -0,0 +1,153 @@
+"""
+비동기(ASGI) 조회 API — /api/async/...
+
+동기 API 와 같은 응답을 async 뷰로 제공합니다. uvicorn/daphne 같은 ASGI 서버(Kimi_no_daigaku/asgi.py)에서 실행하면
+DB 응답을 기다리거나 큰 목록을 만드는 동안에도 같은 프로세스가 다른 요청을 받을 수 있습니다.
+- /api/async/search/              = /api/search/ (?stream=1 제외)
+- /api/async/highschools/         = /api/highschools/ (?region=)
+- /api/async/highschools/regions/ = /api/highschools/regions/
+- /api/async/universities/        = /api/universities/ (page_size/cursor, fields, expand)
+
+특성화고 목록은 서로 의존하지 않는 쿼리 3개를 지역 조건만으로 만들어 차례로 읽습니다. (학교 id 를 기다렸다가 넘기지 않음)
+대학 목록은 동기 API 의 prefetch 와 serializer 를 그대로 써서 응답 형식이 어긋나지 않게 합니다.
+Django async ORM 은 한 요청의 쿼리를 같은 DB 스레드에서 하나씩 실행하므로 요청 안의 쿼리가 동시에 돌지는 않지만,
+기다리는 동안 이벤트 루프는 다른 요청을 처리합니다.
+ETag(304), 응답 캐시, 읽기 전용 스냅샷 라우팅은 동기 API 와 똑같이 적용됩니다.
+"""
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch, aprefetch_related_objects
+from django.http import HttpResponse, JsonResponse
+from highschools.models import HighSchool, HighSchoolDepartment
+from highschools.views import filter_regions, matching_regions
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+from universities.models import University
+from universities.pagination import UniversityCursorPagination
+from universities.serializers import UniversitySerializer
+from universities.views import _parse_csv_param, catalog_expand, catalog_final_infos, catalog_prefetches
+
+from . import response_cache, search, versioning
+from .models import DepartmentAdmission, AdmissionResult
+from .views import _department_item, _search_filters, _search_json
+
+
+async def _alist(queryset):
+    return [item async for item in queryset]
+
+
+# -----------------------------------------------------------
+# 학과 검색
+# -----------------------------------------------------------
+@versioning.conditional(versioning.CORE)
+@response_cache.cache_response(versioning.CORE)
+async def department_search_api(request):
+    """
+    학과 검색 API (비동기)
+    GET /api/async/search/?university=경희대&department=정치외교&q=기준학과명
+    SQLite 에서는 동기 API 와 같은 SQL 한 문장(검색 + 입결 + JSON)을 DB 스레드에서 실행합니다.
+    """
+    univ_query = request.GET.get('university', '').strip()
+    dept_query = request.GET.get('department', '').strip()
+    free_query = request.GET.get('q', '').strip()
+
+    if search.read_connection().vendor == 'sqlite':
+        body = await sync_to_async(_search_json)(univ_query, dept_query, free_query)
+        return HttpResponse(body, content_type='application/json')
+
+    queryset = DepartmentAdmission.objects.filter(
+        _search_filters(univ_query, dept_query, free_query)
+    ).prefetch_related(
+        Prefetch('results', queryset=AdmissionResult.objects.order_by('-year'))
+    ).order_by('id')
+    return JsonResponse([_department_item(dept) async for dept in queryset], safe=False)
+
+
+# -----------------------------------------------------------
+# 특성화고
+# -----------------------------------------------------------
+@versioning.conditional(versioning.HIGHSCHOOLS)
+@response_cache.cache_response(versioning.HIGHSCHOOLS)
+async def highschool_list_api(request):
+    """
+    특성화고 및 학과 목록 (비동기)
+    GET /api/async/highschools/?region=서울특별시교육청 (앞부분 또는 이름 중간 일치, highschools.views.matching_regions)
+    학교, 학과, 학과별 기준학과를 지역 조건만으로 조회합니다. (쿼리 3번, 같은 DB 스레드에서 차례로 실행)
+    """
+    region = request.GET.get('region', '').strip()
+    schools = HighSchool.objects.order_by('id')
+    departments = HighSchoolDepartment.objects.order_by('school_id', 'name')  # (학교, 학과명) 유니크 인덱스 순서
+    standards = HighSchoolDepartment.standard_departments.through.objects.order_by(
+        'highschooldepartment_id', 'standarddepartment_id'
+    )
+    if region:
+        # 교육청 목록 캐시(_all_regions)가 비어 있으면 동기 ORM 으로 읽으므로 DB 스레드에서 구합니다.
+        regions = await sync_to_async(matching_regions)(region)
+        schools = filter_regions(schools, regions)
+        departments = filter_regions(departments, regions, field='school__region')
+        standards = filter_regions(standards, regions, field='highschooldepartment__school__region')
+
+    schools = await _alist(schools.values('id', 'region', 'name'))
+    departments = await _alist(departments.values('id', 'school_id', 'name'))
+    standards = await _alist(standards.values_list('highschooldepartment_id', 'standarddepartment__name'))
+
+    names_by_department = defaultdict(list)
+    for department_id, name in standards:
+        names_by_department[department_id].append(name)
+    departments_by_school = defaultdict(list)
+    for dept in departments:
+        departments_by_school[dept['school_id']].append({
+            'id': dept['id'], 'name': dept['name'], 'standard_departments': names_by_department[dept['id']],
+        })
+    return JsonResponse([
+        {**school, 'departments': departments_by_school[school['id']]} for school in schools
+    ], safe=False)
+
+
+@versioning.conditional(versioning.HIGHSCHOOLS)
+@response_cache.cache_response(versioning.HIGHSCHOOLS)
+async def highschool_regions_api(request):
+    """시도교육청 목록 (비동기) GET /api/async/highschools/regions/"""
+    regions = HighSchool.objects.values_list('region', flat=True).distinct().order_by('region')
+    return JsonResponse(await _alist(regions), safe=False)
+
+
+# -----------------------------------------------------------
+# 대학 카탈로그
+# -----------------------------------------------------------
+def _serialize_universities(universities, context):
+    """동기 API(UniversityViewSet)와 같은 직렬화 (학과 최종 정보가 없는 학과는 resolve_many 로 계산)"""
+    if 'divisions.departments' in context['expand']:
+        context['final_infos'] = catalog_final_infos(universities)
+    return UniversitySerializer(universities, many=True, context=context).data
+
+
+@versioning.conditional(versioning.UNIVERSITIES, versioning.HIGHSCHOOLS)
+@response_cache.cache_response(versioning.UNIVERSITIES, versioning.HIGHSCHOOLS)
+async def university_list_api(request):
+    """
+    대학 입시 정보 (비동기) GET /api/async/universities/
+    /api/universities/ 와 같은 파라미터(page_size/cursor, fields, expand)와 같은 JSON 형식입니다. (?stream=1, format 제외)
+    prefetch 와 직렬화는 동기 API 의 catalog_prefetches / UniversitySerializer 를 그대로 사용합니다.
+    """
+    drf_request = Request(request)
+    expand = catalog_expand(drf_request)
+    queryset = University.objects.all()
+    paginator = UniversityCursorPagination()
+    paginated = paginator.is_requested(drf_request)
+    try:
+        if paginated:
+            universities = await sync_to_async(paginator.paginate_queryset)(queryset, drf_request)
+        else:
+            universities = await _alist(queryset)
+    except APIException as exc:  # 잘못된 cursor (404)
+        return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+
+    await aprefetch_related_objects(universities, *catalog_prefetches(expand))
+    context = {'request': drf_request, 'fields': _parse_csv_param(drf_request, 'fields'), 'expand': expand}
+    data = await sync_to_async(_serialize_universities)(universities, context)
+    if paginated:
+        data = {'next': paginator.get_next_link(), 'previous': paginator.get_previous_link(), 'results': data}
+    return JsonResponse(data, safe=False, encoder=JSONEncoder)
@@ -0,0 +1,334 @@
+"""
+초성 자동완성 (메모리 prefix trie)
+
+대학, 대학 학과, 특성화고, 기준학과 이름을 두 가지 키로 색인합니다.
+- 음절 키: '경희대학교'
+- 초성 키: 'ㄱㅎㄷㅎㄱ'
+"ㄱㅎㄷ", "경희", "경ㅎ" 처럼 음절과 초성이 섞인 입력도 찾을 수 있습니다.
+
+처음 조회할 때 한 번만 DB 에서 읽어 만들고, 이후에는 core/signals.py 가
+저장/삭제가 커밋될 때마다 해당 항목만 넣고 빼므로 조회 시에는 DB 를 사용하지 않습니다.
+색인은 만들 때의 데이터 버전(universities, highschools)과 함께 보관합니다. 버전이 바뀌었으면
+- 이 프로세스가 올린 버전뿐이면(위의 커밋 후 갱신으로 이미 반영됨) 버전만 새로 기록하고,
+- 다른 워커/명령(import_highschools, load_fixtures 등 bulk_create 적재)이 올렸으면 다음 조회 때 다시 만듭니다.
+"""
+import heapq
+import threading
+from bisect import insort
+from collections import deque
+
+from . import versioning
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JAMO_CONSONANTS = set(CHOSEONG)
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG_STEP = 21 * 28
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+TOP_K = MAX_LIMIT
+
+# trie 노드의 예약 키 (자식 노드 키는 항상 한 글자이므로 겹치지 않습니다)
+_ENTRIES = '_entries'  # 이 노드에서 끝나는 항목 집합
+_TOP = '_top'  # 이 노드 아래 항목 중 짧은 이름 순 상위 TOP_K 개 (정렬된 (길이, 키, 항목) 목록)
+
+
+def to_choseong(text):
+    """'경희대' → 'ㄱㅎㄷ' (한글 음절이 아닌 글자는 그대로 둡니다)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // CHOSEONG_STEP])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def normalize(text):
+    return ''.join(str(text).split()).lower()
+
+
+def matches_mixed(query, name):
+    """음절/초성이 섞인 검색어가 name 의 앞부분과 맞는지 확인합니다."""
+    if len(query) > len(name):
+        return False
+    for q_ch, n_ch in zip(query, name):
+        if q_ch in JAMO_CONSONANTS:
+            if to_choseong(n_ch) != q_ch:
+                return False
+        elif q_ch != n_ch:
+            return False
+    return True
+
+
+class PrefixTrie:
+    """
+    dict 노드 기반 trie
+    - 각 노드에 하위 항목 중 짧은 이름 순 상위 TOP_K 개를 미리 정렬해 두므로,
+      짧은 접두어(예: 'ㄱ')도 하위 트리를 훑지 않고 바로 답할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, key, entry):
+        rank = (len(key), key, entry)
+        node = self.root
+        for ch in key:
+            node = node.setdefault(ch, {})
+            top = node.setdefault(_TOP, [])
+            if len(top) < TOP_K:
+                insort(top, rank)
+            elif rank < top[-1]:
+                insort(top, rank)
+                top.pop()
+        node.setdefault(_ENTRIES, set()).add(entry)
+
+    def remove(self, key, entry):
+        rank = (len(key), key, entry)
+        path = [self.root]
+        for ch in key:
+            node = path[-1].get(ch)
+            if node is None:
+                return
+            path.append(node)
+        entries = path[-1].get(_ENTRIES)
+        if entries is None or entry not in entries:
+            return
+        entries.discard(entry)
+        if not entries:
+            del path[-1][_ENTRIES]
+
+        for depth, node in enumerate(path[1:], start=1):
+            top = node[_TOP]
+            if rank in top:
+                was_full = len(top) == TOP_K
+                top.remove(rank)
+                if was_full:
+                    # 상위 목록 밖에 있던 항목으로 다시 채웁니다.
+                    node[_TOP] = heapq.nsmallest(TOP_K, self._iter_ranks(node, key[:depth]))
+
+        # 비어 있는 노드 정리
+        for ch, parent, node in zip(reversed(key), reversed(path[:-1]), reversed(path[1:])):
+            if any(k != _TOP for k in node):
+                break
+            del parent[ch]
+
+    @staticmethod
+    def _iter_ranks(node, prefix):
+        """node(키 prefix) 아래의 모든 항목을 (길이, 키, 항목) 형태로 돌려줍니다."""
+        stack = [(node, prefix)]
+        while stack:
+            node, key = stack.pop()
+            for k, child in node.items():
+                if k == _ENTRIES:
+                    for entry in child:
+                        yield (len(key), key, entry)
+                elif k != _TOP:
+                    stack.append((child, key + k))
+
+    def iter_prefix(self, prefix):
+        """prefix 로 시작하는 항목을 짧은 이름부터 돌려줍니다."""
+        if not prefix:
+            return
+        node = self.root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return
+        top = node.get(_TOP, [])
+        for rank in top:
+            yield rank[2]
+        if len(top) < TOP_K:
+            return
+        # 상위 목록으로 부족한 경우(종류 필터 등)에만 나머지 하위 트리를 훑습니다.
+        seen = {rank[2] for rank in top}
+        queue = deque([node])
+        while queue:
+            node = queue.popleft()
+            for k, child in node.items():
+                if k == _ENTRIES:
+                    yield from (entry for entry in child if entry not in seen)
+                elif k != _TOP:
+                    queue.append(child)
+
+
+class AutocompleteIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = {}  # (type, id) → (정규화된 이름, 응답용 dict)
+        self._syllables = PrefixTrie()
+        self._choseong = PrefixTrie()
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, kind, pk, name, label=None):
+        entry = (kind, pk)
+        key = normalize(name)
+        with self._lock:
+            self._remove_locked(entry)
+            self._names[entry] = (key, {'type': kind, 'id': pk, 'name': name, 'label': label or name})
+            self._syllables.insert(key, entry)
+            self._choseong.insert(to_choseong(key), entry)
+
+    def remove(self, kind, pk):
+        with self._lock:
+            self._remove_locked((kind, pk))
+
+    def _remove_locked(self, entry):
+        old = self._names.pop(entry, None)
+        if old is not None:
+            key = old[0]
+            self._syllables.remove(key, entry)
+            self._choseong.remove(to_choseong(key), entry)
+
+    def search(self, query, kinds=None, limit=DEFAULT_LIMIT):
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+
+        has_jamo = any(ch in JAMO_CONSONANTS for ch in query)
+        results = []
+        with self._lock:
+            if has_jamo:
+                candidates = self._choseong.iter_prefix(to_choseong(query))
+            else:
+                candidates = self._syllables.iter_prefix(query)
+            for entry in candidates:
+                if kinds and entry[0] not in kinds:
+                    continue
+                key, item = self._names[entry]
+                if has_jamo and not matches_mixed(query, key):
+                    continue
+                results.append(item)
+                if len(results) >= limit:
+                    break
+        return results
+
+
+# -----------------------------------------------------------
+# 색인 대상 모델
+# -----------------------------------------------------------
+def _load_universities():
+    from universities.models import University
+    for pk, name in University.objects.values_list('id', 'name'):
+        yield pk, name, name
+
+
+def _load_departments(queryset=None):
+    from universities.models import UniversityDepartment
+    queryset = queryset if queryset is not None else UniversityDepartment.objects.all()
+    rows = queryset.values_list('id', 'name', 'recruitment_group', 'division__university__name')
+    for pk, name, group, university in rows:
+        yield pk, name, f"{university} {name} ({group})"
+
+
+def _load_highschools():
+    from highschools.models import HighSchool
+    for pk, name, region in HighSchool.objects.values_list('id', 'name', 'region'):
+        yield pk, name, f"{name} ({region})"
+
+
+def _load_standards():
+    from highschools.models import StandardDepartment
+    for pk, name in StandardDepartment.objects.values_list('id', 'name'):
+        yield pk, name, name
+
+
+LOADERS = {
+    'university': _load_universities,
+    'department': _load_departments,
+    'highschool': _load_highschools,
+    'standard': _load_standards,
+}
+
+_index = None  # (만들 때의 데이터 버전, 색인)
+_index_lock = threading.Lock()
+SCOPES = (versioning.UNIVERSITIES, versioning.HIGHSCHOOLS)
+
+
+def build_index():
+    index = AutocompleteIndex()
+    for kind, loader in LOADERS.items():
+        for pk, name, label in loader():
+            index.add(kind, pk, name, label)
+    return index
+
+
+def _versions():
+    return tuple(versioning.get_version(scope) for scope in SCOPES)
+
+
+def _only_local_changes(built, versions):
+    """색인을 만든 뒤의 버전 변경이 모두 이 프로세스의 것(커밋 후 갱신으로 반영됨)인지"""
+    return all(
+        versioning.only_written_here(scope, since, current)
+        for scope, since, current in zip(SCOPES, built, versions)
+    )
+
+
+def get_index():
+    global _index
+    versions = _versions()
+    cached = _index
+    if cached is None or cached[0] != versions:
+        with _index_lock:
+            if _index is None:
+                _index = (versions, build_index())
+            elif _index[0] != versions:
+                index = _index[1] if _only_local_changes(_index[0], versions) else build_index()
+                _index = (versions, index)
+            cached = _index
+    return cached[1]
+
+
+def invalidate():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def _loaded_index():
+    """이미 만들어진 색인만 반환합니다. (아직 없으면 처음 조회할 때 DB 에서 읽으므로 갱신할 필요 없음)"""
+    cached = _index
+    return cached[1] if cached is not None else None
+
+
+def update_university(university):
+    index = _loaded_index()
+    if index is None:
+        return
+    index.add('university', university.pk, university.name)
+    # 학과 표시명에 대학명이 들어가므로 소속 학과도 다시 넣습니다.
+    from universities.models import UniversityDepartment
+    for pk, name, label in _load_departments(UniversityDepartment.objects.filter(division__university=university)):
+        index.add('department', pk, name, label)
+
+
+def update_department(department):
+    index = _loaded_index()
+    if index is None:
+        return
+    from universities.models import UniversityDepartment
+    for pk, name, label in _load_departments(UniversityDepartment.objects.filter(pk=department.pk)):
+        index.add('department', pk, name, label)
+
+
+def update_highschool(school):
+    index = _loaded_index()
+    if index is not None:
+        index.add('highschool', school.pk, school.name, f"{school.name} ({school.region})")
+
+
+def update_standard(standard):
+    index = _loaded_index()
+    if index is not None:
+        index.add('standard', standard.pk, standard.name)
+
+
+def remove(kind, pk):
+    index = _loaded_index()
+    if index is not None:
+        index.remove(kind, pk)
@@ -0,0 +1,387 @@
+"""
+합성 데이터 벤치마크 (python manage.py benchmark)
+
+시드를 고정한 합성 데이터로 세 가지 적재 스크립트와 주요 조회 API 를 측정하고 결과를 JSON 으로 남깁니다.
+커밋마다 같은 시드/규모로 돌린 JSON 을 비교하면 성능 회귀를 찾을 수 있습니다.
+
+규모(scale=1.0 기준):
+- 대학 500, 계열 5천(대학당 10), 학과 5만(계열당 10), 입결 10개 연도(50만)
+- 특성화고 5천, 고교 학과 10만(학교당 20), 기준학과 80
+
+순서:
+1. 합성 입력 파일 생성 (픽스처 JSON, 03_admission 형식 JSON, 시도교육청 엑셀)
+2. 적재 시간 측정: load_base_data(load_fixtures) → load_university_data(load_admissions) → import_data(import_highschools)
+3. API 측정: 요청마다 응답 캐시를 비우고 지연 시간(p50/p99)과 쿼리 수, 응답 크기를 기록
+4. 실행 계획 점검: 같은 API 의 쿼리에 인덱스 없는 전체 스캔이 있는지 (core/query_plans.py)
+
+DB 는 호출하는 쪽(관리 명령)에서 별도 테스트 DB 로 바꾼 뒤 실행해야 합니다.
+"""
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+import django
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+DEFAULT_SEED = 20251130
+DEFAULT_SCALE = 0.1
+DEFAULT_REPEAT = 30
+WARMUP = 2
+
+UNIVERSITIES = 500
+DIVISIONS_PER_UNIVERSITY = 10
+DEPARTMENTS_PER_DIVISION = 10
+YEARS = 10
+FIRST_YEAR = 2016
+HIGHSCHOOLS = 5000
+DEPARTMENTS_PER_HIGHSCHOOL = 20
+STANDARDS = 80
+
+SYLLABLES = '가경고광국남단대동명부서성세숙신아양연영우원이인전정제조중진청충한해홍화'
+DIVISION_NAMES = ['인문계열', '사회계열', '자연계열', '공학계열', '의약계열', '교육계열', '예체능계열', '경상계열', '농생명계열', '융합계열']
+DEPARTMENT_NAMES = [
+    '컴퓨터공학과', '소프트웨어학과', '전자공학과', '기계공학과', '건축학과', '경영학과', '회계학과', '경제학과',
+    '행정학과', '정치외교학과', '국어국문학과', '영어영문학과', '수학과', '물리학과', '화학과', '생명과학과',
+    '간호학과', '디자인학과', '관광경영학과', '호텔조리학과', '미디어학과', '식품영양학과', '토목공학과', '화학공학과',
+]
+STANDARD_WORDS = [
+    '정보컴퓨터', '경영·사무', '재무·회계', '방송·통신', '조리·식음료', '관광·레저', '인쇄·출판', '건축·토목',
+    '기계', '전기', '전자', '화학공업', '디자인', '문화콘텐츠', '보건간호', '미용', '농업', '수산', '해양', '자동차',
+]
+REGIONS = [
+    '서울특별시교육청', '부산광역시교육청', '대구광역시교육청', '인천광역시교육청', '광주광역시교육청', '대전광역시교육청',
+    '울산광역시교육청', '세종특별자치시교육청', '경기도교육청', '강원특별자치도교육청', '충청북도교육청', '충청남도교육청',
+    '전북특별자치도교육청', '전라남도교육청', '경상북도교육청', '경상남도교육청', '제주특별자치도교육청',
+]
+# 경기/서울처럼 큰 지역에 학교가 몰리도록 가중치를 둡니다.
+REGION_WEIGHTS = [12, 6, 4, 5, 3, 3, 2, 1, 20, 3, 3, 4, 4, 4, 5, 6, 1]
+ENGLISH_TABLES = [
+    {str(g): p for g, p in zip(range(1, 10), points)}
+    for points in ([100, 98, 95, 90, 85, 80, 75, 70, 60], [100, 95, 90, 80, 70, 60, 50, 40, 30], [0, -1, -2, -3, -4, -5, -6, -7, -8])
+]
+
+
+def percentile(values, p):
+    """최근접 순위(nearest-rank) 백분위수"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * p // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+@dataclass
+class SyntheticCatalog:
+    """시드가 같으면 항상 같은 데이터를 만드는 합성 카탈로그"""
+    seed: int = DEFAULT_SEED
+    scale: float = DEFAULT_SCALE
+    sizes: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        rng = random.Random(self.seed)
+        self.n_universities = max(1, round(UNIVERSITIES * self.scale))
+        self.n_highschools = max(1, round(HIGHSCHOOLS * self.scale))
+        self.standards = [f'{word}과' for word in STANDARD_WORDS]
+        while len(self.standards) < STANDARDS:
+            self.standards.append(f'{rng.choice(STANDARD_WORDS)}{len(self.standards)}과')
+        self.university_names = self._unique_names(rng, self.n_universities, '대학교')
+        self.highschool_names = self._unique_names(rng, self.n_highschools, '고등학교', middle=('정보', '공업', '상업', '과학', '디자인', '마이스터'))
+        self.highschool_regions = rng.choices(REGIONS, weights=REGION_WEIGHTS, k=self.n_highschools)
+
+    @staticmethod
+    def _unique_names(rng, count, suffix, middle=('',)):
+        names, seen = [], set()
+        while len(names) < count:
+            name = ''.join(rng.choices(SYLLABLES, k=rng.choice((2, 3)))) + rng.choice(middle) + suffix
+            if name in seen:
+                name = f'{name[:-len(suffix)]}{len(names)}{suffix}'
+            seen.add(name)
+            names.append(name)
+        return names
+
+    # -------------------------------------------------------
+    # 입력 파일
+    # -------------------------------------------------------
+    def iter_base_objects(self):
+        """load_fixtures 용 픽스처 객체 (기준학과, 대학, 계열, 학과, universities 입결)"""
+        rng = random.Random(self.seed + 1)
+        for pk, name in enumerate(self.standards, start=1):
+            yield {'model': 'highschools.standarddepartment', 'pk': pk, 'fields': {'name': name}}
+
+        division_pk = department_pk = result_pk = 0
+        for university_pk, name in enumerate(self.university_names, start=1):
+            yield {'model': 'universities.university', 'pk': university_pk, 'fields': {'name': name, 'logo_image': ''}}
+            for division_name in DIVISION_NAMES[:DIVISIONS_PER_UNIVERSITY]:
+                division_pk += 1
+                yield {'model': 'universities.universitydivision', 'pk': division_pk, 'fields': {
+                    'university': university_pk, 'name': division_name,
+                    'korean_score': rng.choice((20.0, 25.0, 30.0, 35.0)),
+                    'math_score': rng.choice((20.0, 25.0, 30.0, 35.0)),
+                    'inquiry_score': rng.choice((20.0, 25.0, 30.0)),
+                    'english_method': rng.choice(('ADD', 'SUB')),
+                    'english_grade_points': rng.choice(ENGLISH_TABLES),
+                    'naesin_reflection_score': rng.choice((0.0, 10.0, 20.0)),
+                    'eligible_standard_departments': sorted(rng.sample(range(1, len(self.standards) + 1), rng.randint(3, 6))),
+                }}
+                for department_name in rng.sample(DEPARTMENT_NAMES, DEPARTMENTS_PER_DIVISION):
+                    department_pk += 1
+                    overrides = rng.random() < 0.3
+                    yield {'model': 'universities.universitydepartment', 'pk': department_pk, 'fields': {
+                        'division': division_pk, 'name': department_name,
+                        'recruitment_group': rng.choice(('가군', '나군', '다군')),
+                        'korean_score': rng.choice((25.0, 30.0)) if overrides else None,
+                        'eligible_standard_departments': (
+                            sorted(rng.sample(range(1, len(self.standards) + 1), rng.randint(1, 3))) if overrides else []
+                        ),
+                    }}
+                    for year in range(FIRST_YEAR, FIRST_YEAR + YEARS):
+                        result_pk += 1
+                        yield {'model': 'universities.admissionresult', 'pk': result_pk, 'fields': {
+                            'department': department_pk, 'year': year, **self._result_fields(rng),
+                        }}
+
+    def iter_admission_items(self):
+        """load_admissions 용 03_admission.json 형식 항목 (학과 × 연도)"""
+        rng = random.Random(self.seed + 2)
+        n_departments = self.n_universities * DIVISIONS_PER_UNIVERSITY * DEPARTMENTS_PER_DIVISION
+        for department_pk in range(1, n_departments + 1):
+            for year in range(FIRST_YEAR, FIRST_YEAR + YEARS):
+                yield {'model': 'universities.admissionresult', 'fields': {
+                    'department': department_pk, 'year': year, **self._result_fields(rng),
+                }}
+
+    @staticmethod
+    def _result_fields(rng):
+        grade = lambda: float(rng.randint(1, 6))  # noqa: E731
+        pct = lambda: float(rng.randint(50, 99))  # noqa: E731
+        return {
+            'recruit_count': rng.choice((None, rng.randint(1, 40))),
+            'korean_grade': grade(), 'korean_percentile': pct(),
+            'math_grade': grade(), 'math_percentile': pct(),
+            'english_grade': grade(),
+            'inquiry_grade': grade(), 'inquiry_percentile': pct(),
+        }
+
+    def write_json(self, path, objects):
+        """객체를 하나씩 써서 큰 파일도 메모리에 모두 올리지 않습니다."""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[\n')
+            for obj in objects:
+                f.write(',\n' if count else '')
+                f.write(json.dumps(obj, ensure_ascii=False))
+                count += 1
+            f.write('\n]\n')
+        return count
+
+    def write_highschool_workbook(self, path):
+        """시도교육청별 시트를 가진 기준학과 엑셀 (importing.HEADER_ROW 위치에 컬럼명)"""
+        from openpyxl import Workbook
+        from highschools.importing import HEADER_ROW
+
+        rng = random.Random(self.seed + 3)
+        by_region = {region: [] for region in REGIONS}
+        for name, region in zip(self.highschool_names, self.highschool_regions):
+            by_region[region].append(name)
+
+        workbook = Workbook(write_only=True)
+        rows = 0
+        for region, schools in by_region.items():
+            if not schools:
+                continue
+            sheet = workbook.create_sheet(region)
+            for _ in range(HEADER_ROW):
+                sheet.append([])
+            sheet.append(['시 · 도 구분', '학교명', '학과명', '교육과정의 기준학과명(최대2개)', None])
+            for school in schools:
+                for i in range(DEPARTMENTS_PER_HIGHSCHOOL):
+                    standards = rng.sample(self.standards, rng.randint(1, 2)) + [None]
+                    sheet.append([region, school, f'{rng.choice(STANDARD_WORDS)}{i + 1}과', standards[0], standards[1]])
+                    rows += 1
+        workbook.save(path)
+        return rows
+
+
+# -----------------------------------------------------------
+# 측정
+# -----------------------------------------------------------
+def _timed_command(name, *args, **options):
+    started = time.perf_counter()
+    call_command(name, *args, stdout=io.StringIO(), stderr=io.StringIO(), **options)
+    return round(time.perf_counter() - started, 3)
+
+
+def run_loaders(catalog, workdir, workers=None, log=print):
+    results = {}
+
+    log("📝 합성 입력 파일 생성 중...")
+    base_path = os.path.join(workdir, '01_base_data.json')
+    admission_path = os.path.join(workdir, '03_admission.json')
+    workbook_path = os.path.join(workdir, 'highschools.xlsx')
+    started = time.perf_counter()
+    base_objects = catalog.write_json(base_path, catalog.iter_base_objects())
+    admission_items = catalog.write_json(admission_path, catalog.iter_admission_items())
+    workbook_rows = catalog.write_highschool_workbook(workbook_path)
+    results['generate'] = {'seconds': round(time.perf_counter() - started, 3)}
+
+    log(f"⏳ load_base_data: 픽스처 {base_objects:,}개")
+    results['load_base_data'] = {
+        'command': 'load_fixtures', 'objects': base_objects, 'seconds': _timed_command('load_fixtures', base_path),
+    }
+    log(f"⏳ load_university_data: 입결 {admission_items:,}개")
+    results['load_university_data'] = {
+        'command': 'load_admissions', 'objects': admission_items, 'seconds': _timed_command('load_admissions', admission_path),
+    }
+    log(f"⏳ import_data: 엑셀 {workbook_rows:,}행")
+    results['import_data'] = {
+        'command': 'import_highschools', 'objects': workbook_rows,
+        'seconds': _timed_command('import_highschools', workbook_path, workers=workers),
+    }
+    for result in results.values():
+        if 'objects' in result:
+            result['objects_per_second'] = round(result['objects'] / result['seconds']) if result['seconds'] else None
+    return results
+
+
+def measure(client, url, repeat=DEFAULT_REPEAT, warmup=WARMUP):
+    """
+    url 을 repeat 번 요청해 지연 시간(ms) p50/p99 와 쿼리 수, 응답 크기를 구합니다.
+    요청마다 응답 캐시를 비우므로 캐시가 아닌 실제 처리 시간을 잽니다.
+    """
+    from . import response_cache
+
+    timings, queries, sizes, status = [], [], [], None
+    for i in range(warmup + repeat):
+        response_cache.get_cache().clear()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(url)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            elapsed = (time.perf_counter() - started) * 1000
+        if i < warmup:
+            continue
+        timings.append(elapsed)
+        queries.append(len(captured))
+        sizes.append(len(body))
+        status = response.status_code
+    return {
+        'url': url,
+        'status': status,
+        'repeat': repeat,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'queries_min': min(queries),
+        'queries_max': max(queries),
+        'bytes': max(sizes),
+    }
+
+
+def endpoint_urls(catalog):
+    """측정할 조회 API (이름 → 주소). 검색어/지역은 시드로 고릅니다."""
+    from urllib.parse import urlencode
+
+    rng = random.Random(catalog.seed + 4)
+    region = max(REGIONS, key=catalog.highschool_regions.count)  # 가장 큰 지역 (보통 경기)
+    university = rng.choice(catalog.university_names)
+    return {
+        'universities_page': '/api/universities/?page_size=20',
+        'universities_page_no_history': '/api/universities/?page_size=20&expand=divisions.departments',
+        'universities_names': '/api/universities/?fields=id,name&page_size=200',
+        'highschools_region': '/api/highschools/?' + urlencode({'region': region}),
+        'highschools_rows': '/api/highschools/rows/?' + urlencode({'region': region, 'page_size': 100}),
+        'search_university': '/api/search/?' + urlencode({'university': university}),
+        'search_standard': '/api/search/?' + urlencode({'q': rng.choice(catalog.standards)}),
+        'search_short_term': '/api/search/?' + urlencode({'department': '경영'}),
+    }
+
+
+def run_endpoints(catalog, repeat=DEFAULT_REPEAT, log=print):
+    client = Client()
+    results = {}
+    for name, url in endpoint_urls(catalog).items():
+        results[name] = measure(client, url, repeat=repeat)
+        log(f"⏱️ {name}: p50 {results[name]['p50_ms']}ms · p99 {results[name]['p99_ms']}ms · 쿼리 {results[name]['queries_max']}")
+    return results
+
+
+def table_sizes():
+    from django.apps import apps
+
+    labels = [
+        'universities.University', 'universities.UniversityDivision', 'universities.UniversityDepartment',
+        'universities.AdmissionResult', 'highschools.HighSchool', 'highschools.HighSchoolDepartment',
+        'highschools.StandardDepartment', 'core.DepartmentAdmission', 'core.AdmissionResult',
+    ]
+    return {label: apps.get_model(label).objects.count() for label in labels}
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_query_plans(catalog, log=print):
+    """주요 API 의 실행 계획 점검 (core/query_plans.py). 결과에는 계획 대신 전체 스캔 목록만 남깁니다."""
+    from . import query_plans
+
+    results = query_plans.check(catalog)
+    for name, table, _ in query_plans.regressions(results):
+        log(f"⚠️ 실행 계획 회귀: {name} 에서 {table} 전체 스캔")
+    return {
+        name: {key: value for key, value in result.items() if key != 'plans'}
+        for name, result in results.items()
+    }
+
+
+def run(seed=DEFAULT_SEED, scale=DEFAULT_SCALE, repeat=DEFAULT_REPEAT, workdir=None, workers=None, log=print):
+    """벤치마크 전체 실행 → JSON 으로 저장할 수 있는 dict"""
+    catalog = SyntheticCatalog(seed=seed, scale=scale)
+    started = time.time()
+    loaders = run_loaders(catalog, workdir, workers=workers, log=log)
+    return {
+        'benchmark': {'seed': seed, 'scale': scale, 'repeat': repeat, 'started_at': round(started)},
+        'environment': environment(),
+        'sizes': table_sizes(),
+        'loaders': loaders,
+        'endpoints': run_endpoints(catalog, repeat=repeat, log=log),
+        'query_plans': run_query_plans(catalog, log=log),
+    }
+
+
+def compare(baseline, current):
+    """두 결과의 주요 지표 비교 → [(항목, 기준값, 현재값, 변화율 %), ...]"""
+    rows = []
+    for name, result in current.get('loaders', {}).items():
+        before = baseline.get('loaders', {}).get(name, {}).get('seconds')
+        rows.append((f'loaders.{name}.seconds', before, result.get('seconds')))
+    for name, result in current.get('endpoints', {}).items():
+        old = baseline.get('endpoints', {}).get(name, {})
+        for metric in ('p50_ms', 'p99_ms', 'queries_max'):
+            rows.append((f'endpoints.{name}.{metric}', old.get(metric), result.get(metric)))
+    return [
+        (key, before, after, round((after - before) / before * 100, 1) if before else None)
+        for key, before, after in rows
+    ]
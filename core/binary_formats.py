@@ -0,0 +1,274 @@
+"""
+MessagePack / CBOR 인코더·디코더 (외부 패키지 없이 API 응답에 필요한 타입만)
+
+카탈로그 API 의 ?format=msgpack, ?format=cbor 응답(core/renderers.py)에 사용합니다.
+지원 타입: None, bool, int(64비트 범위), float(64비트), str, bytes, list/tuple, dict
+- 정수는 값에 맞는 가장 짧은 형식, 실수는 항상 float64 로 씁니다. (JSON 과 같은 값이 나오도록)
+- 디코더는 위 인코더가 만드는 형식과 float32 만 읽습니다. (테스트와 클라이언트 확인용)
+Decimal, datetime 같은 값은 호출하는 쪽에서 JSON 과 같은 기본 타입으로 바꿔서 넘겨야 합니다.
+"""
+import struct
+
+_INT_RANGES = (
+    # (최솟값, 최댓값, msgpack 형식 바이트, struct 형식)
+    (0, 0xFF, 0xCC, '>B'),
+    (0, 0xFFFF, 0xCD, '>H'),
+    (0, 0xFFFFFFFF, 0xCE, '>I'),
+    (0, 0xFFFFFFFFFFFFFFFF, 0xCF, '>Q'),
+    (-0x80, 0x7F, 0xD0, '>b'),
+    (-0x8000, 0x7FFF, 0xD1, '>h'),
+    (-0x80000000, 0x7FFFFFFF, 0xD2, '>i'),
+    (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF, 0xD3, '>q'),
+)
+
+
+def _unsupported(value):
+    return TypeError(f"{type(value).__name__} 값은 인코딩할 수 없습니다: {value!r}")
+
+
+# -----------------------------------------------------------
+# MessagePack
+# -----------------------------------------------------------
+def _msgpack_length(out, length, fix_base, fix_limit, codes):
+    """길이 머리: fix 형식(fix_limit 미만) 또는 8/16/32비트 (codes 에 None 이면 그 크기 없음)"""
+    if length < fix_limit:
+        out.append(fix_base | length)
+        return
+    for code, limit, fmt in zip(codes, (0xFF, 0xFFFF, 0xFFFFFFFF), ('>B', '>H', '>I')):
+        if code is not None and length <= limit:
+            out.append(code)
+            out += struct.pack(fmt, length)
+            return
+    raise ValueError(f"너무 긴 값입니다: {length}")
+
+
+def _msgpack_encode(out, value):
+    if value is None:
+        out.append(0xC0)
+    elif value is True or value is False:
+        out.append(0xC3 if value else 0xC2)
+    elif isinstance(value, int):
+        if 0 <= value <= 0x7F:
+            out.append(value)
+        elif -32 <= value < 0:
+            out.append(value & 0xFF)
+        else:
+            for low, high, code, fmt in _INT_RANGES:
+                if low <= value <= high:
+                    out.append(code)
+                    out += struct.pack(fmt, value)
+                    break
+            else:
+                raise _unsupported(value)
+    elif isinstance(value, float):
+        out.append(0xCB)
+        out += struct.pack('>d', value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        _msgpack_length(out, len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        _msgpack_length(out, len(value), 0, 0, (0xC4, 0xC5, 0xC6))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _msgpack_length(out, len(value), 0x90, 16, (None, 0xDC, 0xDD))
+        for item in value:
+            _msgpack_encode(out, item)
+    elif isinstance(value, dict):
+        _msgpack_length(out, len(value), 0x80, 16, (None, 0xDE, 0xDF))
+        for key, item in value.items():
+            _msgpack_encode(out, key)
+            _msgpack_encode(out, item)
+    else:
+        raise _unsupported(value)
+
+
+def msgpack_dumps(value):
+    out = bytearray()
+    _msgpack_encode(out, value)
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def read(self, size):
+        if self.pos + size > len(self.data):
+            raise ValueError("데이터가 중간에 끝났습니다.")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def unpack(self, fmt):
+        return struct.unpack(fmt, self.read(struct.calcsize(fmt)))[0]
+
+    def byte(self):
+        return self.read(1)[0]
+
+
+_MSGPACK_FIXED = {
+    0xCC: '>B', 0xCD: '>H', 0xCE: '>I', 0xCF: '>Q',
+    0xD0: '>b', 0xD1: '>h', 0xD2: '>i', 0xD3: '>q',
+    0xCA: '>f', 0xCB: '>d',
+}
+_MSGPACK_SIZED = {
+    # 형식 바이트 → (길이 struct 형식, 종류)
+    0xD9: ('>B', 'str'), 0xDA: ('>H', 'str'), 0xDB: ('>I', 'str'),
+    0xC4: ('>B', 'bin'), 0xC5: ('>H', 'bin'), 0xC6: ('>I', 'bin'),
+    0xDC: ('>H', 'array'), 0xDD: ('>I', 'array'),
+    0xDE: ('>H', 'map'), 0xDF: ('>I', 'map'),
+}
+
+
+def _msgpack_decode(reader):
+    code = reader.byte()
+    if code <= 0x7F:
+        return code
+    if code >= 0xE0:
+        return code - 0x100
+    if code == 0xC0:
+        return None
+    if code in (0xC2, 0xC3):
+        return code == 0xC3
+    if code in _MSGPACK_FIXED:
+        return reader.unpack(_MSGPACK_FIXED[code])
+    if 0xA0 <= code <= 0xBF:
+        kind, length = 'str', code & 0x1F
+    elif 0x90 <= code <= 0x9F:
+        kind, length = 'array', code & 0x0F
+    elif 0x80 <= code <= 0x8F:
+        kind, length = 'map', code & 0x0F
+    elif code in _MSGPACK_SIZED:
+        fmt, kind = _MSGPACK_SIZED[code]
+        length = reader.unpack(fmt)
+    else:
+        raise ValueError(f"지원하지 않는 MessagePack 형식입니다: 0x{code:02x}")
+
+    if kind == 'str':
+        return str(reader.read(length), 'utf-8')
+    if kind == 'bin':
+        return bytes(reader.read(length))
+    if kind == 'array':
+        return [_msgpack_decode(reader) for _ in range(length)]
+    return {_msgpack_decode(reader): _msgpack_decode(reader) for _ in range(length)}
+
+
+def msgpack_loads(data):
+    reader = _Reader(data)
+    value = _msgpack_decode(reader)
+    if reader.pos != len(reader.data):
+        raise ValueError("값 뒤에 남은 데이터가 있습니다.")
+    return value
+
+
+# -----------------------------------------------------------
+# CBOR (RFC 8949)
+# -----------------------------------------------------------
+# major type (6: 태그는 쓰지 않음)
+_UINT, _NEGINT, _BYTES, _TEXT, _ARRAY, _MAP, _SIMPLE = 0, 1, 2, 3, 4, 5, 7
+
+
+def _cbor_head(out, major, argument):
+    if argument < 24:
+        out.append(major << 5 | argument)
+    elif argument <= 0xFF:
+        out.append(major << 5 | 24)
+        out.append(argument)
+    elif argument <= 0xFFFF:
+        out.append(major << 5 | 25)
+        out += struct.pack('>H', argument)
+    elif argument <= 0xFFFFFFFF:
+        out.append(major << 5 | 26)
+        out += struct.pack('>I', argument)
+    elif argument <= 0xFFFFFFFFFFFFFFFF:
+        out.append(major << 5 | 27)
+        out += struct.pack('>Q', argument)
+    else:
+        raise ValueError(f"64비트를 넘는 값입니다: {argument}")
+
+
+def _cbor_encode(out, value):
+    if value is None:
+        out.append(0xF6)
+    elif value is True or value is False:
+        out.append(0xF5 if value else 0xF4)
+    elif isinstance(value, int):
+        if value >= 0:
+            _cbor_head(out, _UINT, value)
+        else:
+            _cbor_head(out, _NEGINT, -1 - value)
+    elif isinstance(value, float):
+        out.append(0xFB)
+        out += struct.pack('>d', value)
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        _cbor_head(out, _TEXT, len(data))
+        out += data
+    elif isinstance(value, (bytes, bytearray)):
+        _cbor_head(out, _BYTES, len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        _cbor_head(out, _ARRAY, len(value))
+        for item in value:
+            _cbor_encode(out, item)
+    elif isinstance(value, dict):
+        _cbor_head(out, _MAP, len(value))
+        for key, item in value.items():
+            _cbor_encode(out, key)
+            _cbor_encode(out, item)
+    else:
+        raise _unsupported(value)
+
+
+def cbor_dumps(value):
+    out = bytearray()
+    _cbor_encode(out, value)
+    return bytes(out)
+
+
+_CBOR_ARGUMENT = {24: '>B', 25: '>H', 26: '>I', 27: '>Q'}
+_CBOR_SIMPLE = {20: False, 21: True, 22: None}
+
+
+def _cbor_decode(reader):
+    initial = reader.byte()
+    major, info = initial >> 5, initial & 0x1F
+    if major == _SIMPLE:
+        if info in _CBOR_SIMPLE:
+            return _CBOR_SIMPLE[info]
+        if info == 26:
+            return reader.unpack('>f')
+        if info == 27:
+            return reader.unpack('>d')
+        raise ValueError(f"지원하지 않는 CBOR 값입니다: 0x{initial:02x}")
+
+    if info < 24:
+        argument = info
+    elif info in _CBOR_ARGUMENT:
+        argument = reader.unpack(_CBOR_ARGUMENT[info])
+    else:
+        raise ValueError(f"지원하지 않는 CBOR 길이입니다: 0x{initial:02x}")  # 길이 미정 형식 등
+
+    if major == _UINT:
+        return argument
+    if major == _NEGINT:
+        return -1 - argument
+    if major == _BYTES:
+        return bytes(reader.read(argument))
+    if major == _TEXT:
+        return str(reader.read(argument), 'utf-8')
+    if major == _ARRAY:
+        return [_cbor_decode(reader) for _ in range(argument)]
+    if major == _MAP:
+        return {_cbor_decode(reader): _cbor_decode(reader) for _ in range(argument)}
+    raise ValueError(f"지원하지 않는 CBOR 태그입니다: 0x{initial:02x}")
+
+
+def cbor_loads(data):
+    reader = _Reader(data)
+    value = _cbor_decode(reader)
+    if reader.pos != len(reader.data):
+        raise ValueError("값 뒤에 남은 데이터가 있습니다.")
+    return value
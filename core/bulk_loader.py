@@ -0,0 +1,243 @@
+"""
+대용량 픽스처 스트리밍 로더 (Django JSON 픽스처 형식)
+
+json.load 로 파일 전체를 읽는 대신, 파일을 조각(CHUNK_SIZE)씩 읽으며 JSONDecoder.raw_decode 로
+배열 원소를 하나씩 꺼냅니다. 원소는 BATCH_SIZE 개씩 모아서
+1. Django 기본 역직렬화기(python Deserializer)로 모델 인스턴스와 M2M 값으로 바꾸고,
+2. 모델 의존 순서(FK 대상 먼저)대로 bulk_create(같은 pk 는 덮어쓰기) 하고,
+3. M2M 은 through 테이블 행을 지운 뒤 bulk_create 로 다시 넣습니다.
+메모리에는 배치 하나만 올라가므로 파일 크기와 상관없이 메모리 사용량이 일정합니다.
+
+- 전체 로드는 한 트랜잭션입니다. FK 제약은 커밋 시점에 검사되므로(DEFERRABLE) 배치 사이 순서는 상관없고,
+  PRAGMA foreign_keys 를 끌 필요가 없습니다.
+- bulk 저장은 시그널을 보내지 않으므로, 로드가 끝나면 학과 최종 정보(DepartmentEffectiveInfo)를 다시 계산하고
+  데이터 버전/자동완성 색인을 직접 갱신합니다.
+- loaddata 와 같이 모델에 없는 필드는 오류입니다. (ignorenonexistent=True 일 때만 건너뜀)
+- 아직 저장되지 않은 객체를 가리키는 natural key 참조(forward reference)는 모든 파일을 읽은 뒤
+  loaddata 처럼 save_deferred_fields() 로 채웁니다.
+"""
+import json
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.color import no_style
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import connection, transaction
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_OBJECT_SIZE = 64 << 20  # 원소 하나가 이보다 크면 잘못된 파일로 봅니다.
+BATCH_SIZE = 2000
+PROGRESS_EVERY = 10000
+
+# 앱 → 데이터 버전 scope (core/versioning.py)
+APP_SCOPES = {'universities': 'universities', 'highschools': 'highschools', 'core': 'core'}
+
+
+class FixtureError(ValueError):
+    """픽스처 파일 형식 오류"""
+
+
+def iter_array(fp, chunk_size=CHUNK_SIZE):
+    """JSON 배열 파일에서 원소를 하나씩 읽습니다. (파일 전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        data = fp.read(chunk_size)
+        eof = not data
+        buffer, pos = buffer[pos:] + data, 0
+
+    def peek():
+        """공백을 건너뛴 다음 글자 (파일 끝이면 '')"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            read_more()
+
+    if peek() != '[':
+        raise FixtureError("JSON 배열로 시작하지 않습니다.")
+    pos += 1
+    while True:
+        ch = peek()
+        if ch == ']':
+            return
+        if ch == ',':
+            pos += 1
+            continue
+        if ch == '':
+            raise FixtureError("배열이 닫히기 전에 파일이 끝났습니다.")
+        while True:
+            try:
+                obj, pos = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError as e:
+                # 원소가 조각 경계에 걸친 경우: 더 읽어서 다시 시도
+                if eof or len(buffer) - pos > MAX_OBJECT_SIZE:
+                    raise FixtureError(f"JSON 형식 오류: {e}")
+                read_more()
+        yield obj
+
+
+def dependency_order(models):
+    """FK/OneToOne 대상 모델이 먼저 오도록 정렬합니다. (자기 참조와 목록 밖 모델은 무시)"""
+    models = list(models)
+    ordered, visiting = [], set()
+
+    def visit(model):
+        if model in ordered or model in visiting:
+            return
+        visiting.add(model)
+        for field in model._meta.concrete_fields:
+            target = field.related_model if field.is_relation else None
+            if target is not None and target is not model and target in models:
+                visit(target)
+        visiting.discard(model)
+        ordered.append(model)
+
+    for model in models:
+        visit(model)
+    return ordered
+
+
+def _upsert(model, instances):
+    """pk 가 같은 행은 덮어쓰고(loaddata 와 같은 동작), 없으면 추가합니다."""
+    opts = model._meta
+    with_pk = [obj for obj in instances if obj.pk is not None]
+    without_pk = [obj for obj in instances if obj.pk is None]
+    update_fields = [f.name for f in opts.concrete_fields if not f.primary_key]
+    if with_pk:
+        if update_fields:
+            model._base_manager.bulk_create(
+                with_pk, update_conflicts=True, unique_fields=[opts.pk.name], update_fields=update_fields,
+            )
+        else:
+            model._base_manager.bulk_create(with_pk, ignore_conflicts=True)
+    if without_pk:
+        model._base_manager.bulk_create(without_pk)
+
+
+def _replace_m2m(model, objects):
+    """M2M 값을 through 테이블 일괄 삭제 + bulk_create 로 교체합니다."""
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        if not through._meta.auto_created:
+            continue
+        source = field.m2m_field_name() + '_id'
+        target = field.m2m_reverse_field_name() + '_id'
+        owners = [obj.object.pk for obj in objects if field.name in obj.m2m_data]
+        if not owners:
+            continue
+        through._base_manager.filter(**{f'{source}__in': owners}).delete()
+        through._base_manager.bulk_create([
+            through(**{source: obj.object.pk, target: target_pk})
+            for obj in objects if field.name in obj.m2m_data
+            for target_pk in dict.fromkeys(obj.m2m_data[field.name])
+        ])
+
+
+class LoadStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.by_model = defaultdict(int)
+
+    @property
+    def total(self):
+        return sum(self.by_model.values())
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+
+def _deserialize(raw_objects, ignorenonexistent):
+    try:
+        return list(PythonDeserializer(
+            raw_objects, ignorenonexistent=ignorenonexistent, handle_forward_references=True,
+        ))
+    except (DeserializationError, FieldDoesNotExist) as e:
+        raise FixtureError(str(e))
+
+
+def _flush(raw_objects, stats, ignorenonexistent=False):
+    """배치 하나를 저장합니다. → natural key 참조를 아직 풀지 못한 객체 목록"""
+    deserialized = _deserialize(raw_objects, ignorenonexistent)
+    by_model = defaultdict(list)
+    for obj in deserialized:
+        by_model[type(obj.object)].append(obj)
+    for model in dependency_order(by_model):
+        objects = by_model[model]
+        _upsert(model, [obj.object for obj in objects])
+        _replace_m2m(model, objects)
+        stats.by_model[model._meta.label] += len(objects)
+    return [obj for obj in deserialized if obj.deferred_fields]
+
+
+def _save_deferred(deferred):
+    """뒤에 나온 객체를 가리키던 natural key 참조를 채웁니다. (loaddata 와 같은 방식, 객체마다 저장)"""
+    for obj in deferred:
+        try:
+            obj.save_deferred_fields()
+        except DeserializationError as e:
+            raise FixtureError(str(e))
+
+
+def _after_load(loaded_models):
+    """시그널 대신 직접 실행하는 후처리 (트랜잭션 안)"""
+    from core import autocomplete, changelog, versioning
+
+    app_labels = {model._meta.app_label for model in loaded_models}
+    if 'universities' in app_labels or 'highschools' in app_labels:
+        from universities import effective_info
+        effective_info.refresh_all()
+        # 무엇이 바뀌었는지 기록하지 않으므로 델타 동기화 클라이언트는 스냅샷을 다시 받습니다.
+        changelog.reset()
+    versioning.bump(*(APP_SCOPES[label] for label in app_labels if label in APP_SCOPES))
+    transaction.on_commit(autocomplete.invalidate)
+
+    # pk 를 직접 넣었으므로 (PostgreSQL 등) 시퀀스를 맞춥니다. SQLite 는 빈 목록입니다.
+    statements = connection.ops.sequence_reset_sql(no_style(), list(loaded_models))
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def load(paths, batch_size=BATCH_SIZE, progress=None, progress_every=PROGRESS_EVERY, ignorenonexistent=False):
+    """
+    픽스처 파일들을 한 트랜잭션으로 불러옵니다.
+    progress(stats) 는 progress_every 개마다 호출됩니다.
+    ignorenonexistent=True 이면 모델에 없는 필드/모델을 건너뜁니다. (loaddata --ignorenonexistent)
+    """
+    stats = LoadStats()
+    next_report = progress_every
+    deferred = []
+    with transaction.atomic():
+        for path in paths:
+            with open(path, encoding='utf-8') as fp:
+                batch = []
+                for raw in iter_array(fp):
+                    batch.append(raw)
+                    if len(batch) >= batch_size:
+                        deferred += _flush(batch, stats, ignorenonexistent)
+                        batch = []
+                    if progress and stats.total >= next_report:
+                        progress(stats)
+                        next_report = stats.total + progress_every
+                if batch:
+                    deferred += _flush(batch, stats, ignorenonexistent)
+        _save_deferred(deferred)
+        loaded_models = {apps.get_model(label) for label in stats.by_model}
+        if loaded_models:
+            _after_load(loaded_models)
+    return stats
@@ -0,0 +1,212 @@
+"""
+변경 기록(ChangeLog)과 델타 동기화 ("버전 N 이후 바뀐 것만")
+
+대학/특성화고 모델이 저장·삭제될 때마다 ChangeLog 에 한 행씩 남깁니다. 행 id 가 곧 버전이며 계속 커집니다.
+클라이언트는 마지막으로 받은 버전을 보내고(/api/changes/?since=N) 그 뒤의 변경만 받아 로컬 사본에 적용합니다.
+- 변경 항목의 데이터는 기록 시점이 아니라 조회 시점의 현재 값입니다. (같은 객체가 여러 번 바뀌어도 한 번만 전송)
+- 시그널 없이 일괄 저장하는 경우는 record_many() 로 직접 남기거나, 무엇이 바뀌었는지 모르면 reset() 합니다.
+- ManyToMany 로 가리켜지던 객체를 지우면 through 행이 m2m_changed 없이 지워지므로, 가리키던 객체를 지우기 전에
+  모아 두었다가 수정으로 기록합니다. (예: 기준학과 삭제 → 그 기준학과를 쓰던 고교 학과/대학 계열/학과)
+- 오래된 기록은 compact() 로 지웁니다. since 가 지워진 구간(floor) 이전이면 전체 스냅샷을 돌려줍니다.
+- reset()/compact() 는 floor 를 표시하는 행(action=reset)을 남깁니다. object_pk 에 floor 버전을 저장합니다.
+
+참고: 버전은 커밋 순서가 아니라 행 추가 순서입니다. SQLite 는 쓰기가 한 번에 하나라 두 순서가 같습니다.
+"""
+from collections import defaultdict
+
+from django.apps import apps
+from django.core import serializers
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 5000
+
+M2M_ACTIONS = ('post_add', 'post_remove', 'post_clear')
+
+# ChangeLog.action 값 (models 를 import 하지 않고 쓰기 위해)
+CREATE, UPDATE, DELETE, RESET = 'create', 'update', 'delete', 'reset'
+
+
+def _model():
+    from .models import ChangeLog
+    return ChangeLog
+
+
+# -----------------------------------------------------------
+# 기록
+# -----------------------------------------------------------
+def record(instance, action):
+    ChangeLog = _model()
+    ChangeLog.objects.create(model=instance._meta.label_lower, object_pk=instance.pk, action=action)
+
+
+def record_many(model, pks, action=None):
+    """시그널 없는 일괄 저장 뒤에 직접 호출합니다."""
+    ChangeLog = _model()
+    action = action or UPDATE
+    label = model._meta.label_lower
+    ChangeLog.objects.bulk_create([ChangeLog(model=label, object_pk=pk, action=action) for pk in pks])
+
+
+def reset():
+    """
+    무엇이 바뀌었는지 모르는 일괄 작업 뒤에 호출합니다.
+    지금까지의 버전을 가진 클라이언트는 모두 전체 스냅샷을 다시 받습니다.
+    """
+    ChangeLog = _model()
+    marker = ChangeLog.objects.create(model='', object_pk=0, action=RESET)
+    ChangeLog.objects.filter(pk=marker.pk).update(object_pk=marker.pk)
+
+
+def compact(before_version):
+    """before_version 이하의 기록을 지우고, 그 이전 버전의 클라이언트는 스냅샷을 받도록 floor 를 올립니다."""
+    ChangeLog = _model()
+    before_version = min(before_version, latest_version())
+    if before_version <= floor():
+        return 0
+    with transaction.atomic():
+        deleted, _ = ChangeLog.objects.filter(pk__lte=before_version).delete()
+        ChangeLog.objects.create(model='', object_pk=before_version, action=RESET)
+    return deleted
+
+
+def latest_version():
+    return _model().objects.aggregate(version=Max('pk'))['version'] or 0
+
+
+def floor():
+    """이 버전보다 오래된 클라이언트는 변경 목록 대신 스냅샷을 받아야 합니다."""
+    ChangeLog = _model()
+    return ChangeLog.objects.filter(action=RESET).aggregate(floor=Max('object_pk'))['floor'] or 0
+
+
+# -----------------------------------------------------------
+# 시그널 연결 (각 앱의 signals.py 에서 호출)
+# -----------------------------------------------------------
+TRACKED_MODELS = []
+
+
+def connect(*models):
+    """models 의 저장/삭제와 ManyToMany 변경을 기록하도록 연결합니다."""
+    def saved(sender, instance, created, raw=False, **kwargs):
+        record(instance, CREATE if created else UPDATE)
+
+    def deleting(sender, instance, **kwargs):
+        instance._changelog_m2m_owners = _m2m_owners(instance)
+
+    def deleted(sender, instance, **kwargs):
+        record(instance, DELETE)
+        for model, pks in getattr(instance, '_changelog_m2m_owners', ()):
+            record_many(model, pks)
+
+    for model in models:
+        if model not in TRACKED_MODELS:
+            TRACKED_MODELS.append(model)
+        label = model._meta.label_lower
+        post_save.connect(saved, sender=model, weak=False, dispatch_uid=f'changelog_save_{label}')
+        pre_delete.connect(deleting, sender=model, weak=False, dispatch_uid=f'changelog_deleting_{label}')
+        post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=f'changelog_delete_{label}')
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                _m2m_handler(model), sender=field.remote_field.through, weak=False,
+                dispatch_uid=f'changelog_m2m_{label}_{field.name}',
+            )
+
+
+def _m2m_owners(instance):
+    """instance 를 ManyToMany 로 가리키는 추적 모델 객체 → [(모델, [pk, ...])] (삭제 시 through 행이 함께 지워짐)"""
+    owners = []
+    for model in TRACKED_MODELS:
+        for field in model._meta.local_many_to_many:
+            if not isinstance(instance, field.related_model):
+                continue
+            pks = list(field.remote_field.through.objects.filter(
+                **{field.m2m_reverse_field_name(): instance.pk}
+            ).values_list(field.m2m_field_name(), flat=True))
+            if pks:
+                owners.append((model, pks))
+    return owners
+
+
+def _m2m_handler(model):
+    """M2M 변경은 소유(정방향) 객체의 수정으로 기록합니다."""
+    def changed(sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in M2M_ACTIONS:
+            return
+        if not reverse:
+            record(instance, UPDATE)
+        elif pk_set:
+            record_many(model, pk_set)
+        else:
+            reset()  # 반대쪽에서 clear() 한 경우: 어떤 객체가 바뀌었는지 알 수 없음
+    return changed
+
+
+# -----------------------------------------------------------
+# 조회
+# -----------------------------------------------------------
+def _serialize(objects):
+    """Django 픽스처와 같은 {"model", "pk", "fields"} 형식 (M2M 은 pk 목록)"""
+    return serializers.serialize('python', objects)
+
+
+def _queryset(model):
+    """M2M 값을 객체마다 조회하지 않도록 prefetch 합니다."""
+    queryset = model._default_manager.order_by('pk')
+    if model._meta.many_to_many:
+        queryset = queryset.prefetch_related(*(field.name for field in model._meta.many_to_many))
+    return queryset
+
+
+def changes_since(since, limit=DEFAULT_LIMIT):
+    """
+    since 이후 변경 (최대 limit 개 기록) → (마지막 버전, 더 있는지, 변경 목록)
+    같은 객체의 여러 기록은 마지막 것 하나로 합치고, 현재 값을 읽어서 보냅니다.
+    """
+    ChangeLog = _model()
+    entries = list(
+        ChangeLog.objects.filter(pk__gt=since).exclude(action=RESET)
+        .order_by('pk').values_list('pk', 'model', 'object_pk', 'action')[:limit + 1]
+    )
+    more = len(entries) > limit
+    entries = entries[:limit]
+    if not entries:
+        return since, False, []
+    version = entries[-1][0]
+
+    last = {}
+    for pk, label, object_pk, action in entries:
+        last.pop((label, object_pk), None)  # 순서를 마지막 기록 위치로 옮김
+        last[(label, object_pk)] = action
+
+    pks_by_model = defaultdict(list)
+    for (label, object_pk), action in last.items():
+        if action != DELETE:
+            pks_by_model[label].append(object_pk)
+    current = {}
+    for label, pks in pks_by_model.items():
+        model = apps.get_model(label)
+        for item in _serialize(_queryset(model).filter(pk__in=pks)):
+            current[(label, item['pk'])] = item['fields']
+
+    changes = []
+    for (label, object_pk), action in last.items():
+        fields = current.get((label, object_pk))
+        if fields is None:
+            # 이후에 지워진 객체 (삭제 기록은 다음 페이지에 있음)
+            changes.append({'model': label, 'pk': object_pk, 'action': DELETE})
+        else:
+            changes.append({'model': label, 'pk': object_pk, 'action': 'upsert', 'fields': fields})
+    return version, more, changes
+
+
+def iter_snapshot(chunk_size=2000):
+    """추적 중인 모델 전체를 모델 순서대로 한 객체씩 (픽스처 형식)"""
+    from .bulk_loader import dependency_order
+    from .streaming import iter_batches
+
+    for model in dependency_order(TRACKED_MODELS):
+        for batch in iter_batches(_queryset(model).iterator(chunk_size=chunk_size), chunk_size):
+            yield from _serialize(batch)
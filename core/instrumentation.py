@@ -0,0 +1,163 @@
+"""
+요청별 SQL 계측 (settings.SQL_INSTRUMENTATION = True 일 때만 동작)
+
+디버거 없이 운영 환경에서 요청마다 쿼리 수, SQL 시간, 반복된 쿼리 모양을 확인합니다.
+- 응답 헤더: Server-Timing (db / app), X-DB-Queries, N+1 의심이 있으면 X-DB-Repeated-Queries
+- 같은 모양(값을 ? 로 바꾼 SQL)의 쿼리가 한 요청에서 SQL_N_PLUS_ONE_THRESHOLD 번을 넘으면 N+1 로 보고 경고 로그
+- 전체 시간이 SQL_SLOW_REQUEST_MS 이상이면 느린 요청 로그 (가장 많이 반복된 쿼리 모양 포함)
+로그는 'core.sql' 로거로 남깁니다.
+
+모든 DB 연결에 execute_wrapper 를 걸어 측정하므로 DEBUG 가 꺼져 있어도 동작합니다.
+스트리밍 응답은 본문을 보내는 동안 실행된 쿼리까지 세어 로그에 남깁니다. (헤더는 이미 보낸 뒤라 뷰가 끝난 시점까지의 값)
+ASGI(비동기 뷰)에서는 async ORM 이 요청별 DB 스레드에서 쿼리를 실행하므로 그 스레드의 연결에 wrapper 를 겁니다.
+"""
+import logging
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('core.sql')
+
+DEFAULT_SLOW_REQUEST_MS = 500
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+LOGGED_SHAPES = 5
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """
+    값만 다른 쿼리를 같은 모양으로 묶습니다.
+    문자열/숫자 리터럴과 자리표시자(%s) → ?, IN (?, ?, ...) → IN (...)
+    """
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _IN_LIST.sub('(...)', sql)
+    return _SPACES.sub(' ', sql.replace('%s', '?')).strip()
+
+
+class QueryRecorder:
+    """connection.execute_wrapper 로 걸어서 쿼리 수, 시간, 모양별 횟수를 모읍니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.shapes = Counter()
+        self.shape_durations = defaultdict(float)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            shape = normalize_sql(sql)
+            self.count += 1
+            self.duration += elapsed
+            self.shapes[shape] += 1
+            self.shape_durations[shape] += elapsed
+
+    @contextmanager
+    def installed(self):
+        with self.install():
+            yield self
+
+    def install(self):
+        """현재 스레드의 모든 DB 연결에 wrapper 를 겁니다. → 닫으면 해제되는 ExitStack"""
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+    def repeated(self, threshold):
+        """threshold 번을 넘게 실행된 모양 → [(모양, 횟수), ...] (많은 순)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+def _threshold():
+    return getattr(settings, 'SQL_N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)
+
+
+def _shorten(shape, limit=300):
+    return shape if len(shape) <= limit else shape[:limit] + '…'
+
+
+class SQLInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'SQL_INSTRUMENTATION', False):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with recorder.installed():
+            response = self.get_response(request)
+        return self._finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'SQL_INSTRUMENTATION', False):
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        stack = await sync_to_async(recorder.install)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._finish(request, response, recorder, started)
+
+    def _finish(self, request, response, recorder, started):
+        elapsed = time.perf_counter() - started
+        repeated = recorder.repeated(_threshold())
+        response['Server-Timing'] = (
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries", app;dur={elapsed * 1000:.1f}'
+        )
+        response['X-DB-Queries'] = str(recorder.count)
+        if repeated:
+            response['X-DB-Repeated-Queries'] = str(len(repeated))
+
+        if response.streaming and not response.is_async:
+            response.streaming_content = self._streamed(request, response.streaming_content, recorder, started)
+        else:
+            self._report(request, recorder, elapsed)
+        return response
+
+    def _streamed(self, request, content, recorder, started):
+        with recorder.installed():
+            yield from content
+        self._report(request, recorder, time.perf_counter() - started)
+
+    def _report(self, request, recorder, elapsed):
+        path = request.get_full_path()
+        for shape, n in recorder.repeated(_threshold()):
+            logger.warning(
+                "N+1 의심: %s 에서 같은 쿼리 %d번 (%.1fms): %s",
+                path, n, recorder.shape_durations[shape] * 1000, _shorten(shape),
+            )
+        if elapsed * 1000 >= getattr(settings, 'SQL_SLOW_REQUEST_MS', DEFAULT_SLOW_REQUEST_MS):
+            top = '\n'.join(
+                f"    {n}회 {recorder.shape_durations[shape] * 1000:.1f}ms  {_shorten(shape)}"
+                for shape, n in recorder.shapes.most_common(LOGGED_SHAPES)
+            )
+            logger.warning(
+                "느린 요청: %s %s %.1fms (쿼리 %d개, SQL %.1fms)\n%s",
+                request.method, path, elapsed * 1000, recorder.count, recorder.duration * 1000, top,
+            )
@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from core import benchmark
+
+
+class Command(BaseCommand):
+    help = "시드를 고정한 합성 데이터로 적재 스크립트와 조회 API 성능을 측정합니다. (운영 DB 는 건드리지 않음)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=benchmark.DEFAULT_SEED, help=f"합성 데이터 시드 (기본 {benchmark.DEFAULT_SEED})")
+        parser.add_argument('--scale', type=float, default=benchmark.DEFAULT_SCALE, help=f"데이터 규모 (1.0 = 대학 500·학과 5만·특성화고 5천, 기본 {benchmark.DEFAULT_SCALE})")
+        parser.add_argument('--repeat', type=int, default=benchmark.DEFAULT_REPEAT, help=f"API 별 측정 횟수 (기본 {benchmark.DEFAULT_REPEAT})")
+        parser.add_argument('--workers', type=int, default=None, help="엑셀 파싱 프로세스 수 (기본: CPU 수)")
+        parser.add_argument('--output', help="결과를 저장할 JSON 파일 경로")
+        parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일 경로")
+        parser.add_argument('--check-plans', action='store_true', help="실행 계획에 허용되지 않은 전체 스캔이 있으면 실패로 끝냄")
+        parser.add_argument('--db', help="벤치마크용 SQLite 파일 경로 (지정하면 끝난 뒤에도 남겨둠)")
+
+    def handle(self, *args, **options):
+        if options['scale'] <= 0 or options['repeat'] < 1:
+            raise CommandError("❌ --scale 은 0보다 크고 --repeat 은 1 이상이어야 합니다.")
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare'], encoding='utf-8') as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"❌ 비교할 결과 파일을 읽을 수 없습니다: {e}")
+
+        with tempfile.TemporaryDirectory(prefix='benchmark_') as workdir:
+            result = self._run(workdir, options)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"💾 결과 저장: {options['output']}")
+
+        if baseline is not None:
+            self.stdout.write(f"\n📊 비교 (기준: {baseline.get('environment', {}).get('commit') or options['compare']})")
+            for key, before, after, change in benchmark.compare(baseline, result):
+                change = '-' if change is None else f"{change:+.1f}%"
+                self.stdout.write(f"    {key:<55} {before!s:>10} → {after!s:>10}  {change}")
+
+        scans = [
+            f"{name}: {scan['table']}"
+            for name, plan in result['query_plans'].items() for scan in plan['full_scans']
+        ]
+        if scans and options['check_plans']:
+            raise CommandError("❌ 실행 계획 회귀 (인덱스 없는 전체 스캔): " + ', '.join(scans))
+        self.stdout.write(self.style.SUCCESS("✅ 벤치마크 완료"))
+
+    def _run(self, workdir, options):
+        """별도 DB 를 만들어 마이그레이션한 뒤 측정하고, --db 가 없으면 지웁니다."""
+        keep = bool(options['db'])
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        previous_name = test_settings.get('NAME')
+        test_settings['NAME'] = os.path.abspath(options['db']) if keep else os.path.join(workdir, 'benchmark.sqlite3')
+        self.stdout.write(f"🗄️ 벤치마크 DB 생성: {test_settings['NAME']}")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            # 데이터 버전 파일과 응답 캐시 키도 운영 환경과 분리합니다.
+            with override_settings(DATA_VERSION_DIR=os.path.join(workdir, 'data_versions'), ALLOWED_HOSTS=['testserver']):
+                return benchmark.run(
+                    seed=options['seed'], scale=options['scale'], repeat=options['repeat'],
+                    workdir=workdir, workers=options['workers'], log=self.stdout.write,
+                )
+        finally:
+            if keep:
+                connection.close()
+                connection.settings_dict['NAME'] = old_name
+            else:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            test_settings['NAME'] = previous_name
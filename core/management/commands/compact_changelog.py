@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+from django.utils import timezone
+from core import changelog
+from core.models import ChangeLog
+
+
+class Command(BaseCommand):
+    help = "오래된 델타 동기화 기록(ChangeLog)을 지웁니다. 지운 구간 이전 버전의 클라이언트는 전체 스냅샷을 받습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep-days', type=int, default=30, help="최근 며칠치 기록을 남길지 (기본 30)")
+        parser.add_argument('--before', type=int, help="이 버전 이하를 지웁니다. (--keep-days 대신)")
+
+    def handle(self, *args, **options):
+        before = options['before']
+        if before is None:
+            if options['keep_days'] < 0:
+                raise CommandError("❌ --keep-days 는 0 이상이어야 합니다.")
+            cutoff = timezone.now() - timedelta(days=options['keep_days'])
+            before = ChangeLog.objects.filter(created_at__lt=cutoff).aggregate(version=Max('pk'))['version'] or 0
+
+        deleted = changelog.compact(before)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 기록 {deleted:,}개 삭제 (스냅샷 경계: 버전 {changelog.floor():,}, 최신 버전 {changelog.latest_version():,})"
+        ))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.admission_loader import BATCH_SIZE, load
+from core.bulk_loader import FixtureError
+
+
+class Command(BaseCommand):
+    help = "대학 입시 결과(03_admission.json 형식)를 배치 단위 bulk upsert 로 불러옵니다. (다시 실행해도 중복 없음)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="입시 결과 JSON 파일 경로")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f"한 번에 처리할 항목 수 (기본 {BATCH_SIZE})")
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(f"    ... 진행률: {stats.items:,}개 처리 (배치 {stats.batches})")
+
+        self.stdout.write("📄 대학 입시 결과 데이터 로드 중...")
+        try:
+            with open(options['path'], encoding='utf-8') as fp:
+                stats = load(fp, batch_size=options['batch_size'], progress=progress)
+        except OSError as e:
+            raise CommandError(f"❌ 파일을 열 수 없습니다: {e}")
+        except FixtureError as e:
+            raise CommandError(f"❌ JSON 형식 오류: {e}")
+
+        for department_pk, reason in stats.errors:
+            self.stdout.write(self.style.WARNING(f"❌ 데이터 저장 실패 (PKs: D({department_pk})): {reason}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 대학 데이터 로드 완료. 총 {stats.saved:,}개 입결 저장 ({stats.elapsed:.2f}초)"
+        ))
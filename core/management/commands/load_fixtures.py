@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.bulk_loader import BATCH_SIZE, PROGRESS_EVERY, FixtureError, load
+
+
+class Command(BaseCommand):
+    help = "대용량 JSON 픽스처를 스트리밍으로 읽어 모델별 bulk_create 로 한 트랜잭션에 불러옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="픽스처 파일 경로 (Django JSON 픽스처 형식, 여러 개 가능)")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help=f"한 번에 저장할 원소 수 (기본 {BATCH_SIZE})")
+        parser.add_argument('--progress-every', type=int, default=PROGRESS_EVERY, help="진행 상황 출력 간격 (원소 수)")
+        parser.add_argument(
+            '-i', '--ignorenonexistent', action='store_true',
+            help="모델에 없는 필드/모델을 오류 대신 건너뜁니다. (loaddata 와 같은 옵션)",
+        )
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(f"⏳ {stats.total:,}개 저장 ({stats.rate:,.0f}개/초)")
+
+        self.stdout.write(f"📂 {len(options['paths'])}개 파일을 불러오는 중...")
+        try:
+            stats = load(
+                options['paths'], batch_size=options['batch_size'],
+                progress=progress, progress_every=options['progress_every'],
+                ignorenonexistent=options['ignorenonexistent'],
+            )
+        except OSError as e:
+            raise CommandError(f"❌ 파일을 열 수 없습니다: {e}")
+        except FixtureError as e:
+            raise CommandError(f"❌ 픽스처 형식 오류: {e}")
+
+        for label, count in sorted(stats.by_model.items()):
+            self.stdout.write(f"   - {label}: {count:,}개")
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 총 {stats.total:,}개 저장 완료 ({stats.elapsed:.2f}초, {stats.rate:,.0f}개/초)"
+        ))
@@ -0,0 +1,21 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from core import snapshot
+
+
+class Command(BaseCommand):
+    help = "현재 DB 를 정리된 읽기 전용 스냅샷으로 복사해 조회 API 용으로 게시합니다. (파일을 한 번에 교체)"
+
+    def handle(self, *args, **options):
+        self.stdout.write("📸 스냅샷 생성 중 (VACUUM INTO)...")
+        try:
+            target, versions = snapshot.publish()
+        except (DatabaseError, OSError) as e:
+            raise CommandError(f"❌ 스냅샷 게시 실패: {e}")
+
+        size_mb = os.path.getsize(target) / 1024 / 1024
+        self.stdout.write(self.style.SUCCESS(f"✅ 스냅샷 게시 완료: {target} ({size_mb:.1f}MB)"))
+        if not snapshot.is_enabled():
+            self.stdout.write(self.style.WARNING("⚠️ SNAPSHOT_ENABLED 가 꺼져 있어 조회 API 는 아직 default DB 를 읽습니다."))
@@ -0,0 +1,73 @@
+# 학과 검색용 FTS5(trigram) 인덱스
+# - core_departmentadmission 의 대학/계열/학과명과 기준학과(standards_json) 이름을 색인합니다.
+# - INSERT/UPDATE/DELETE 트리거로 원본 테이블과 항상 동기화됩니다.
+# - SQLite 가 아니거나 FTS5 trigram 토크나이저가 없으면 건너뛰고, 검색은 기존 icontains 로 동작합니다.
+
+from django.db import migrations, OperationalError
+
+FTS_TABLE = 'core_departmentadmission_fts'
+
+# standards_json 은 \uXXXX 로 이스케이프된 JSON 문자열이므로 json_each 로 풀어서 색인합니다.
+STANDARDS_SQL = "(SELECT group_concat(value, ' ') FROM json_each({row}.standards_json))"
+
+INSERT_SQL = (
+    f"INSERT INTO {FTS_TABLE}(rowid, university, division, department, standards) "
+    "VALUES ({row}.id, {row}.university, {row}.division, {row}.department, " + STANDARDS_SQL + ");"
+)
+
+FORWARD_SQL = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(university, division, department, standards, tokenize='trigram')",
+    f"""CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON core_departmentadmission BEGIN
+        {INSERT_SQL.format(row='new')}
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON core_departmentadmission BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON core_departmentadmission BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        {INSERT_SQL.format(row='new')}
+    END""",
+    f"""INSERT INTO {FTS_TABLE}(rowid, university, division, department, standards)
+        SELECT d.id, d.university, d.division, d.department, {STANDARDS_SQL.format(row='d')}
+        FROM core_departmentadmission d""",
+]
+
+REVERSE_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute(f"CREATE VIRTUAL TABLE temp.{FTS_TABLE}_probe USING fts5(x, tokenize='trigram')")
+            cursor.execute(f"DROP TABLE temp.{FTS_TABLE}_probe")
+        except OperationalError:
+            # FTS5/trigram 미지원 SQLite 빌드
+            return
+        for sql in FORWARD_SQL:
+            cursor.execute(sql)
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for sql in REVERSE_SQL:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts, drop_fts),
+    ]
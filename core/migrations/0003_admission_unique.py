@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:49
+
+from importlib import import_module
+
+from django.db import migrations, models
+from django.db.models import Max, Min
+
+fts = import_module('core.migrations.0002_departmentadmission_fts')
+
+
+def remove_duplicates(apps, schema_editor):
+    """
+    예전 로드 스크립트를 여러 번 실행해 생긴 중복 행을 정리합니다.
+    - DepartmentAdmission: 같은 대학/계열/학과명 중 id 가 가장 작은 행에 입결을 모으고 나머지는 지웁니다.
+    - AdmissionResult: 같은 학과/연도 중 가장 마지막에 저장된(id 가 가장 큰) 행만 남깁니다.
+    """
+    DepartmentAdmission = apps.get_model('core', 'DepartmentAdmission')
+    AdmissionResult = apps.get_model('core', 'AdmissionResult')
+
+    duplicated = (
+        DepartmentAdmission.objects.values('university', 'division', 'department')
+        .annotate(keep=Min('id'), n=models.Count('id')).filter(n__gt=1)
+    )
+    for row in duplicated:
+        others = DepartmentAdmission.objects.filter(
+            university=row['university'], division=row['division'], department=row['department'],
+        ).exclude(id=row['keep'])
+        AdmissionResult.objects.filter(department__in=others).update(department_id=row['keep'])
+        others.delete()
+
+    keep_ids = AdmissionResult.objects.values('department', 'year').annotate(keep=Max('id')).values('keep')
+    AdmissionResult.objects.exclude(id__in=keep_ids).delete()
+
+
+def rebuild_fts(apps, schema_editor):
+    """
+    SQLite 에서 제약 조건 추가/삭제는 테이블을 새로 만들어 바꾸므로 FTS 동기화 트리거가 함께 사라집니다.
+    FTS 테이블과 트리거를 다시 만듭니다. (0002 와 같은 SQL)
+    """
+    fts.drop_fts(apps, schema_editor)
+    fts.create_fts(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_departmentadmission_fts'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicates, migrations.RunPython.noop),
+        migrations.RunPython(migrations.RunPython.noop, rebuild_fts),
+        migrations.AddConstraint(
+            model_name='admissionresult',
+            constraint=models.UniqueConstraint(fields=('department', 'year'), name='core_admissionresult_unique_department_year'),
+        ),
+        migrations.AddConstraint(
+            model_name='departmentadmission',
+            constraint=models.UniqueConstraint(fields=('university', 'division', 'department'), name='core_departmentadmission_unique_name'),
+        ),
+        migrations.RunPython(rebuild_fts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_admission_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, verbose_name='모델')),
+                ('object_pk', models.BigIntegerField(verbose_name='객체 id')),
+                ('action', models.CharField(choices=[('create', '추가'), ('update', '수정'), ('delete', '삭제'), ('reset', '스냅샷 경계')], max_length=10, verbose_name='변경 종류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')),
+            ],
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_changelog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='보고서 이름')),
+                ('method', models.CharField(max_length=10, verbose_name='메서드')),
+                ('path', models.CharField(max_length=500, verbose_name='요청 주소')),
+                ('status_code', models.PositiveSmallIntegerField(verbose_name='응답 코드')),
+                ('duration_ms', models.FloatField(verbose_name='전체 시간(ms)')),
+                ('query_count', models.PositiveIntegerField(verbose_name='쿼리 수')),
+                ('sql_ms', models.FloatField(verbose_name='SQL 시간(ms)')),
+                ('serializer_ms', models.FloatField(verbose_name='직렬화(ms)')),
+                ('orm_ms', models.FloatField(verbose_name='ORM(ms)')),
+                ('render_ms', models.FloatField(verbose_name='렌더링(ms)')),
+                ('summary', models.JSONField(default=dict, verbose_name='요약')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')),
+            ],
+            options={
+                'verbose_name': '프로파일 보고서',
+                'verbose_name_plural': '프로파일 보고서 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
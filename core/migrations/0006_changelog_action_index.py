@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_profilereport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='changelog',
+            index=models.Index(fields=['action', 'object_pk'], name='changelog_action_object_idx'),
+        ),
+    ]
@@ -23,6 +23,12 @@ class AdmissionResult(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        # [신규] 학과별 연도당 1행 (load_university_data 의 bulk upsert 키)
+        constraints = [
+            models.UniqueConstraint(fields=['department', 'year'], name='core_admissionresult_unique_department_year'),
+        ]
+
 class DepartmentAdmission(models.Model):
     # 주요 대학/학과 정보
     # 이 필드들이 CharField이므로, 로드 스크립트에서 이름 문자열을 넣어줘야 합니다.
@@ -33,5 +39,65 @@ class DepartmentAdmission(models.Model):
     standards_json = models.JSONField(default=list) 
     scoring_json = models.JSONField(default=dict) 
 
+    class Meta:
+        # [신규] 대학/계열/학과명 조합당 1행
+        constraints = [
+            models.UniqueConstraint(
+                fields=['university', 'division', 'department'], name='core_departmentadmission_unique_name',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.university} - {self.department}"
+
+
+class ChangeLog(models.Model):
+    """
+    [신규] 대학/특성화고 데이터 변경 기록 (core/changelog.py, 델타 동기화 API)
+    - id 가 데이터 버전입니다. (계속 증가)
+    - action=reset 행은 스냅샷 경계(floor)를 표시하며, object_pk 에 floor 버전을 저장합니다.
+    """
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+    RESET = 'reset'
+    ACTION_CHOICES = [(CREATE, '추가'), (UPDATE, '수정'), (DELETE, '삭제'), (RESET, '스냅샷 경계')]
+
+    model = models.CharField(max_length=100, verbose_name="모델")  # 예: universities.admissionresult
+    object_pk = models.BigIntegerField(verbose_name="객체 id")
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES, verbose_name="변경 종류")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="기록 시각")
+
+    class Meta:
+        # [신규] floor() 가 스냅샷 경계 행만 인덱스로 찾도록 (변경 API 요청마다 실행)
+        indexes = [models.Index(fields=['action', 'object_pk'], name='changelog_action_object_idx')]
+
+    def __str__(self):
+        return f"#{self.pk} {self.action} {self.model}:{self.object_pk}"
+
+
+class ProfileReport(models.Model):
+    """
+    [신규] 요청 프로파일링 보고서 목록 (core/profiling.py)
+    - 보고서 본문(.txt)과 cProfile 결과(.prof)는 PROFILE_DIR 의 name 파일에 있습니다.
+    """
+    name = models.CharField(max_length=50, unique=True, verbose_name="보고서 이름")
+    method = models.CharField(max_length=10, verbose_name="메서드")
+    path = models.CharField(max_length=500, verbose_name="요청 주소")
+    status_code = models.PositiveSmallIntegerField(verbose_name="응답 코드")
+    duration_ms = models.FloatField(verbose_name="전체 시간(ms)")
+    query_count = models.PositiveIntegerField(verbose_name="쿼리 수")
+    sql_ms = models.FloatField(verbose_name="SQL 시간(ms)")
+    serializer_ms = models.FloatField(verbose_name="직렬화(ms)")
+    orm_ms = models.FloatField(verbose_name="ORM(ms)")
+    render_ms = models.FloatField(verbose_name="렌더링(ms)")
+    summary = models.JSONField(default=dict, verbose_name="요약")  # 구간별 시간, 상위 함수
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="기록 시각")
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "프로파일 보고서"
+        verbose_name_plural = "프로파일 보고서 목록"
+
     def __str__(self):
-        return f"{self.university} - {self.department}"
\ No newline at end of file
+        return f"{self.method} {self.path} ({self.duration_ms:.0f}ms)"
@@ -0,0 +1,194 @@
+"""
+요청 단위 프로파일링 (settings.PROFILING_ENABLED = True 일 때만 동작)
+
+허가된 요청만 cProfile 로 실행하고 보고서를 PROFILE_DIR 에 저장합니다. 저장된 보고서는 관리자 화면(ProfileReport)에서 봅니다.
+- 요청 방법: X-Profile 헤더에 settings.PROFILING_TOKEN 값을 보내거나, 스태프 로그인 상태에서 ?profile=1
+- 프로파일 중에는 응답 캐시를 건너뛰어 실제 처리 시간을 잽니다. 스트리밍 응답은 본문까지 모두 만든 뒤 돌려줍니다.
+- 보고서: 구간별 시간(직렬화 / ORM / 렌더링 / 기타), 누적 시간 상위 함수, 상위 함수의 호출 관계(callees)
+  같은 이름의 .prof 파일도 남기므로 snakeviz 같은 도구로 열어볼 수 있습니다.
+
+구간별 시간은 함수 자체 시간(tottime)을 파일 경로로 분류해 더하므로 구간끼리 겹치지 않습니다.
+비동기(ASGI) 요청은 이벤트 루프 스레드만 측정합니다. (async ORM 이 쿼리를 실행하는 DB 스레드는 쿼리 수/시간만 집계)
+"""
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from .instrumentation import QueryRecorder
+
+HEADER = 'HTTP_X_PROFILE'
+QUERY_PARAM = 'profile'
+TOP_FUNCTIONS = 30
+CALLGRAPH_FUNCTIONS = 15
+
+# (구간, 파일 경로에 들어가는 문자열) — 앞의 구간이 우선합니다.
+CATEGORIES = (
+    ('serializers', ('rest_framework/serializers.py', 'rest_framework/fields.py', 'rest_framework/relations.py', '/serializers.py')),
+    ('orm', ('django/db/',)),
+    ('rendering', ('rest_framework/renderers.py', 'core/renderers.py', 'json/', 'django/template/')),
+)
+
+
+def is_requested(request):
+    if not getattr(settings, 'PROFILING_ENABLED', False):
+        return False
+    token = getattr(settings, 'PROFILING_TOKEN', '')
+    header = request.META.get(HEADER, '')
+    if token and header and hmac.compare_digest(header, token):
+        return True
+    user = getattr(request, 'user', None)
+    return request.GET.get(QUERY_PARAM) == '1' and user is not None and user.is_staff
+
+
+def _category(filename):
+    path = filename.replace(os.sep, '/')
+    for name, patterns in CATEGORIES:
+        if any(pattern in path for pattern in patterns):
+            return name
+    return 'other'
+
+
+def summarize(stats):
+    """pstats.Stats → 구간별 시간(ms)과 누적 시간 상위 함수 목록"""
+    categories = {name: 0.0 for name, _ in CATEGORIES}
+    categories['other'] = 0.0
+    for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+        categories[_category(filename)] += tottime
+    top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP_FUNCTIONS]
+    return {
+        'categories_ms': {name: round(seconds * 1000, 1) for name, seconds in categories.items()},
+        'top_functions': [
+            {
+                'function': pstats.func_std_string(func),
+                'calls': ncalls,
+                'tottime_ms': round(tottime * 1000, 2),
+                'cumtime_ms': round(cumtime * 1000, 2),
+            }
+            for func, (_, ncalls, tottime, cumtime, _) in top
+        ],
+    }
+
+
+def format_report(stats, summary, header):
+    """사람이 읽는 텍스트 보고서 (관리자 화면에 그대로 표시)"""
+    out = io.StringIO()
+    out.write(header + '\n\n')
+    out.write('구간별 시간 (함수 자체 시간 합계)\n')
+    for name, ms in summary['categories_ms'].items():
+        out.write(f'    {name:<12} {ms:>10.1f}ms\n')
+    out.write('\n')
+    stats.stream = out
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+    stats.print_callees(CALLGRAPH_FUNCTIONS)
+    return out.getvalue()
+
+
+def _profile_dir():
+    path = str(getattr(settings, 'PROFILE_DIR', os.path.join(settings.BASE_DIR, 'profiles')))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def save_report(request, response, profiler, recorder, elapsed):
+    from .models import ProfileReport
+
+    stats = pstats.Stats(profiler)
+    summary = summarize(stats)
+    name = f"{timezone.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}"
+    directory = _profile_dir()
+    stats.dump_stats(os.path.join(directory, f'{name}.prof'))
+    header = (
+        f'{request.method} {request.get_full_path()} → {response.status_code}\n'
+        f'{elapsed * 1000:.1f}ms, 쿼리 {recorder.count}개 (SQL {recorder.duration * 1000:.1f}ms)'
+    )
+    with open(os.path.join(directory, f'{name}.txt'), 'w', encoding='utf-8') as f:
+        f.write(format_report(stats, summary, header))
+
+    categories = summary['categories_ms']
+    return ProfileReport.objects.create(
+        name=name,
+        method=request.method,
+        path=request.get_full_path()[:500],
+        status_code=response.status_code,
+        duration_ms=round(elapsed * 1000, 1),
+        query_count=recorder.count,
+        sql_ms=round(recorder.duration * 1000, 1),
+        serializer_ms=categories['serializers'],
+        orm_ms=categories['orm'],
+        render_ms=categories['rendering'],
+        summary=summary,
+    )
+
+
+def read_report(name):
+    """저장된 텍스트 보고서 (파일이 지워졌으면 None)"""
+    try:
+        with open(os.path.join(_profile_dir(), f'{os.path.basename(name)}.txt'), encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class ProfilingMiddleware:
+    """AuthenticationMiddleware 뒤에 두어야 스태프 여부를 확인할 수 있습니다."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    async def __acall__(self, request):
+        # request.user 는 세션을 읽으므로 DB 스레드에서 확인합니다.
+        if not await sync_to_async(is_requested)(request):
+            return await self.get_response(request)
+
+        request.skip_response_cache = True
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        stack = await sync_to_async(recorder.install)()
+        profiler.enable()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+            await sync_to_async(stack.close)()
+        elapsed = time.perf_counter() - started
+
+        report = await sync_to_async(save_report)(request, response, profiler, recorder, elapsed)
+        response['X-Profile-Report'] = report.name
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not is_requested(request):
+            return self.get_response(request)
+
+        request.skip_response_cache = True
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with recorder.installed():
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+                if response.streaming:
+                    response.streaming_content = [b''.join(response.streaming_content)]
+            finally:
+                profiler.disable()
+        elapsed = time.perf_counter() - started
+
+        report = save_report(request, response, profiler, recorder, elapsed)
+        response['X-Profile-Report'] = report.name
+        return response
@@ -0,0 +1,135 @@
+"""
+주요 조회 API 의 쿼리 실행 계획(EXPLAIN QUERY PLAN) 점검
+
+벤치마크와 같은 합성 데이터에서 API 를 한 번씩 호출해 실행된 SELECT 를 모두 모으고, SQLite 실행 계획을 확인합니다.
+인덱스 없이 테이블 전체를 훑는 단계(SCAN <테이블>)가 있으면 회귀로 봅니다.
+WHERE 가 있는데 인덱스 없이 MIN/MAX 를 구하는 단계(SEARCH <테이블>, USING 없음)도 전체 스캔이므로 같이 봅니다.
+- 인덱스 전체 스캔(SCAN ... USING COVERING INDEX), FTS 가상 테이블, 서브쿼리/CTE 스캔은 문제로 보지 않습니다.
+- 원래 전체를 읽어야 하는 경우는 hot_queries() 의 allowed 에 테이블과 이유를 적습니다.
+- sqlite_stat1 통계가 없으면 SQLite 는 테이블 크기와 상관없이 같은 계획을 고르므로 작은 데이터로 점검해도 됩니다.
+  (python manage.py benchmark --check-plans 로 벤치마크 규모에서도 확인)
+"""
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urlencode
+
+from django.db import connection
+from django.test import Client
+
+from . import response_cache
+
+# 커서/페이지 번호 페이지네이션: id(rowid) 순서로 읽다가 page_size 만큼 채우면 멈춥니다.
+PAGINATED_UNIVERSITIES = {'universities_university': "id 순서 페이지네이션 (LIMIT 만큼만 읽음)"}
+
+
+@dataclass
+class HotQuery:
+    name: str
+    url: str
+    allowed: dict = field(default_factory=dict)  # 테이블 → 전체 스캔을 허용하는 이유
+
+
+def hot_queries(catalog):
+    """점검할 API 목록 (합성 카탈로그 기준 주소, benchmark.endpoint_urls 와 같은 검색어/지역)"""
+    from . import benchmark, changelog
+
+    urls = benchmark.endpoint_urls(catalog)
+    queries = [
+        HotQuery(name, url, dict(PAGINATED_UNIVERSITIES) if name.startswith('universities_') else {})
+        for name, url in urls.items()
+    ]
+    for query in queries:
+        if query.name == 'search_short_term':
+            query.allowed['core_departmentadmission'] = "2글자 이하 부분 일치는 trigram FTS 를 쓸 수 없음"
+    queries.append(HotQuery('highschools_regions', '/api/highschools/regions/'))
+    since = max(changelog.floor(), changelog.latest_version() - 50)
+    queries.append(HotQuery('changes_delta', '/api/changes/?' + urlencode({'since': since})))
+    return queries
+
+
+# -----------------------------------------------------------
+# 계획 수집
+# -----------------------------------------------------------
+_CTE_NAME = re.compile(r'(\w+)\s*(?:\([^()]*\))?\s+AS\s+(?:NOT\s+)?(?:MATERIALIZED\s+)?\(', re.IGNORECASE)
+_SCAN = re.compile(r'^(SCAN|SEARCH) (\S+)(.*)$')
+_WHERE = re.compile(r'\bWHERE\b', re.IGNORECASE)
+
+
+def capture(client, url):
+    """url 을 요청하는 동안 실행된 SELECT/WITH 문 → [(sql, params), ...]"""
+    statements = []
+
+    def wrapper(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+            statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+    response_cache.get_cache().clear()
+    with connection.execute_wrapper(wrapper):
+        response = client.get(url)
+        if response.streaming:
+            b''.join(response.streaming_content)
+    return response.status_code, statements
+
+
+def explain(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def full_scans(sql, plan):
+    """인덱스 없이 전체를 훑는 테이블(또는 별칭) 이름 목록"""
+    ctes = {name.lower() for name in _CTE_NAME.findall(sql)}
+    scanned = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if not match:
+            continue
+        step, target, rest = match.groups()
+        if target.startswith('(') or target.lower() in ctes or 'USING' in rest or 'VIRTUAL TABLE' in rest:
+            continue
+        if step == 'SEARCH' and (rest.strip() or not _WHERE.search(sql)):
+            continue  # 조건 없는 MAX(id) 같은 rowid 끝 조회
+        scanned.append(target)
+    return scanned
+
+
+def check(catalog, client=None):
+    """
+    API 별 실행 계획 점검 → {이름: {'url', 'status', 'queries', 'full_scans', 'allowed', 'plans'}}
+    full_scans 에는 허용되지 않은 전체 스캔만 들어갑니다. (모두 비어 있어야 통과)
+    """
+    if connection.vendor != 'sqlite':
+        return {}
+    client = client or Client()
+    results = {}
+    for query in hot_queries(catalog):
+        status, statements = capture(client, query.url)
+        plans, regressions, allowed = [], [], []
+        for sql, params in statements:
+            plan = explain(sql, params)
+            plans.append({'sql': sql, 'plan': plan})
+            for table in full_scans(sql, plan):
+                if table in query.allowed:
+                    allowed.append({'table': table, 'reason': query.allowed[table]})
+                else:
+                    regressions.append({'table': table, 'sql': sql})
+        results[query.name] = {
+            'url': query.url,
+            'status': status,
+            'queries': len(statements),
+            'full_scans': regressions,
+            'allowed': allowed,
+            'plans': plans,
+        }
+    return results
+
+
+def regressions(results):
+    """check() 결과 중 허용되지 않은 전체 스캔 → [(API 이름, 테이블, SQL), ...]"""
+    return [
+        (name, scan['table'], scan['sql'])
+        for name, result in results.items()
+        for scan in result['full_scans']
+    ]
@@ -0,0 +1,175 @@
+"""
+카탈로그 API 용 압축 응답 형식 (MessagePack / CBOR / 사전 인코딩)
+
+모바일 앱처럼 느린 네트워크에서 전체 목록을 받을 때는 응답 크기가 가장 큰 비용입니다.
+- ?format=msgpack 또는 Accept: application/msgpack → MessagePack
+- ?format=cbor 또는 Accept: application/cbor → CBOR
+- ?layout=dict 또는 Accept 의 layout=dict 파라미터 → 사전 인코딩 (JSON/MessagePack/CBOR 모두 가능)
+  반복되는 문자열(기준학과명, 모집군, 영어 반영방식 등)과 영어 등급별 점수표를 한 번만 보내고 번호로 참조합니다.
+
+사전 인코딩 응답 형식:
+    {
+        "layout": "dict",
+        "strings": ["가군", "정보컴퓨터과", ...],    # 문자열 사전
+        "tables": [{"1": 100, "2": 98, ...}, ...],    # 점수표 사전
+        "string_fields": ["name", "recruitment_group", ...],   # 값이 strings 번호(또는 번호 목록)인 키
+        "table_fields": ["english_grade_points", "points"],    # 값이 tables 번호인 키
+        "data": <원래 응답과 같은 구조>
+    }
+값이 항상 문자열(또는 null, 문자열 목록)인 키만 string_fields 로 골라 번호로 바꾸므로,
+클라이언트는 두 목록만 보고 원래 응답을 복원할 수 있습니다.
+
+MessagePack/CBOR 인코딩은 외부 패키지 없이 core/binary_formats.py 에서 합니다.
+"""
+import json
+
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import binary_formats
+
+LAYOUT_PARAM = 'layout'
+DICT_LAYOUT = 'dict'
+TABLE_FIELDS = ('english_grade_points', 'points')
+
+
+# -----------------------------------------------------------
+# 사전 인코딩
+# -----------------------------------------------------------
+def _plain(data):
+    """Decimal, datetime, ReturnDict 등을 JSON 과 같은 기본 타입으로 바꿉니다."""
+    return json.loads(json.dumps(data, cls=JSONEncoder))
+
+
+def _string_fields(data, table_fields):
+    """값이 항상 문자열/None/문자열 목록인 키를 찾습니다."""
+    seen, rejected = set(), set()
+
+    def visit(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in table_fields:
+                    continue
+                if value is None or value == []:
+                    pass  # 빈 값은 판단에 쓰지 않습니다.
+                elif isinstance(value, str) or (
+                    isinstance(value, list) and all(isinstance(item, str) for item in value)
+                ):
+                    seen.add(key)
+                else:
+                    rejected.add(key)
+                visit(value)
+        elif isinstance(node, list):
+            for item in node:
+                visit(item)
+
+    visit(data)
+    return seen - rejected
+
+
+def dictionary_encode(data, table_fields=TABLE_FIELDS):
+    """응답 데이터를 사전 인코딩 형식(모듈 설명 참고)으로 바꿉니다."""
+    string_fields = _string_fields(data, table_fields)
+    strings, string_index = [], {}
+    tables, table_index = [], {}
+
+    def ref_string(value):
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    def ref_table(value):
+        key = json.dumps(value, sort_keys=True)
+        if key not in table_index:
+            table_index[key] = len(tables)
+            tables.append(value)
+        return table_index[key]
+
+    def encode(node):
+        if isinstance(node, list):
+            return [encode(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        encoded = {}
+        for key, value in node.items():
+            if value is None:
+                encoded[key] = None
+            elif key in table_fields and isinstance(value, dict):
+                encoded[key] = ref_table(value)
+            elif key in string_fields:
+                encoded[key] = [ref_string(v) for v in value] if isinstance(value, list) else ref_string(value)
+            else:
+                encoded[key] = encode(value)
+        return encoded
+
+    encoded = encode(data)
+    return {
+        'layout': DICT_LAYOUT,
+        'strings': strings,
+        'tables': tables,
+        'string_fields': sorted(string_fields),
+        'table_fields': list(table_fields),
+        'data': encoded,
+    }
+
+
+def wants_dictionary_layout(accepted_media_type, renderer_context):
+    """?layout=dict 또는 Accept 의 layout=dict 파라미터"""
+    request = (renderer_context or {}).get('request')
+    if request is not None and request.query_params.get(LAYOUT_PARAM) == DICT_LAYOUT:
+        return True
+    params = [part.strip() for part in (accepted_media_type or '').split(';')[1:]]
+    return f'{LAYOUT_PARAM}={DICT_LAYOUT}' in params
+
+
+class DictionaryLayoutMixin:
+    """render 전에 요청에 따라 사전 인코딩을 적용합니다."""
+    table_fields = TABLE_FIELDS
+
+    def prepare(self, data, accepted_media_type, renderer_context):
+        if data is not None and wants_dictionary_layout(accepted_media_type, renderer_context):
+            return dictionary_encode(data, self.table_fields)
+        return data
+
+
+# -----------------------------------------------------------
+# 렌더러
+# -----------------------------------------------------------
+class CatalogJSONRenderer(DictionaryLayoutMixin, JSONRenderer):
+    """기본 JSON 과 같고, ?layout=dict 일 때만 사전 인코딩합니다."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = self.prepare(data, accepted_media_type, renderer_context)
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(DictionaryLayoutMixin, BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        data = self.prepare(_plain(data), accepted_media_type, renderer_context)
+        return binary_formats.msgpack_dumps(data)
+
+
+class CBORRenderer(DictionaryLayoutMixin, BaseRenderer):
+    media_type = 'application/cbor'
+    format = 'cbor'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        data = self.prepare(_plain(data), accepted_media_type, renderer_context)
+        return binary_formats.cbor_dumps(data)
+
+
+def catalog_renderer_classes():
+    """카탈로그 뷰셋의 renderer_classes"""
+    return [CatalogJSONRenderer, BrowsableAPIRenderer, MessagePackRenderer, CBORRenderer]
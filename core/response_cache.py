@@ -0,0 +1,124 @@
+"""
+조회 API 응답 캐시
+
+같은 대학 이름, 같은 지역처럼 반복되는 조회는 prefetch 체인을 다시 실행하지 않고 저장해 둔 응답 bytes 를 돌려줍니다.
+- 캐시 키 = 주소(호스트 포함) + 정규화한 쿼리 파라미터 + Accept + 관련 scope 의 데이터 버전(core/versioning.py)
+- 모델 시그널로 데이터 버전이 바뀌면 키가 달라지므로 옛 응답은 더 이상 조회되지 않습니다. (TTL 없음)
+  남은 옛 항목은 캐시 백엔드의 MAX_ENTRIES 정리(cull)로 지워집니다.
+- 백엔드는 settings.CACHES[RESPONSE_CACHE_ALIAS] 로 바꿀 수 있습니다. (기본 locmem, 여러 프로세스가
+  함께 쓰려면 FileBasedCache)
+"""
+import hashlib
+import json
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from . import versioning
+
+DEFAULT_ALIAS = 'responses'
+CACHED_HEADERS = ('Content-Type', 'Vary', 'Allow')
+
+
+def get_cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', DEFAULT_ALIAS)]
+
+
+def normalized_params(request):
+    """쿼리 파라미터를 (이름, 값) 정렬 목록으로 만듭니다. (앞뒤 공백과 빈 값은 무시)"""
+    params = []
+    for name in request.GET:
+        for value in request.GET.getlist(name):
+            value = value.strip()
+            if value:
+                params.append((name, value))
+    return sorted(params)
+
+
+def cache_key(request, scopes):
+    parts = [
+        request.build_absolute_uri(request.path),  # 페이지네이션 next 링크에 호스트가 들어감
+        normalized_params(request),
+        request.META.get('HTTP_ACCEPT', ''),
+        [versioning.get_version(scope) for scope in scopes],
+    ]
+    digest = hashlib.sha1(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+    return f'response:{digest}'
+
+
+def _store(cache, key, response):
+    headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+    cache.set(key, (response.status_code, response.content, headers), timeout=None)
+
+
+def _cached_response(cached):
+    status, content, headers = cached
+    response = HttpResponse(content, status=status)
+    for name, value in headers.items():
+        response[name] = value
+    response['X-Cache'] = 'HIT'
+    return response
+
+
+def _should_store(response):
+    return response.status_code == 200 and not response.streaming and not versioning.has_uncommitted_changes()
+
+
+def _skips(request):
+    return request.method not in ('GET', 'HEAD') or getattr(request, 'skip_response_cache', False)
+
+
+def cache_response(*scopes):
+    """
+    뷰 데코레이터: GET/HEAD 200 응답을 scope 데이터 버전별로 저장합니다.
+    스트리밍 응답(?stream=1)과 아직 커밋되지 않은 변경이 있는 트랜잭션 안의 응답은 저장하지 않습니다.
+    request.skip_response_cache 가 참이면(프로파일링 중) 캐시를 읽지도 저장하지도 않습니다.
+    비동기 뷰(async def)에는 캐시 백엔드의 비동기 API(aget/aset)를 사용합니다.
+    """
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                if _skips(request):
+                    return await view_func(request, *args, **kwargs)
+
+                cache = get_cache()
+                key = cache_key(request, scopes)
+                cached = await cache.aget(key)
+                if cached is not None:
+                    return _cached_response(cached)
+
+                response = await view_func(request, *args, **kwargs)
+                if _should_store(response):
+                    response['X-Cache'] = 'MISS'
+                    headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+                    await cache.aset(key, (response.status_code, response.content, headers), timeout=None)
+                return response
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if _skips(request):
+                return view_func(request, *args, **kwargs)
+
+            cache = get_cache()
+            key = cache_key(request, scopes)
+            cached = cache.get(key)
+            if cached is not None:
+                return _cached_response(cached)
+
+            response = view_func(request, *args, **kwargs)
+            if not _should_store(response):
+                return response
+            response['X-Cache'] = 'MISS'
+            if hasattr(response, 'render') and not response.is_rendered:
+                # DRF Response 는 렌더링이 끝난 뒤에 저장합니다.
+                response.add_post_render_callback(lambda rendered: _store(cache, key, rendered))
+            else:
+                _store(cache, key, response)
+            return response
+        return wrapper
+    return decorator
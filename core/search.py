@@ -0,0 +1,178 @@
+"""
+학과 검색 (SQLite FTS5 trigram 인덱스)
+
+core_departmentadmission_fts 테이블은 migrations/0002 의 트리거로 원본과 동기화됩니다.
+- 3글자 이상 검색어: FTS5 MATCH (인덱스 사용, bm25 관련도 순 정렬)
+- 3글자 미만 검색어: trigram 으로 찾을 수 없으므로 같은 FTS 행에 LIKE 조건으로 붙입니다.
+- 인덱스를 쓸 수 없으면(FTS 테이블 없음, 3글자 이상 검색어 없음) None 을 반환하고
+  호출하는 쪽에서 기존 icontains 검색을 사용합니다.
+- departments_json: 검색 결과를 입결과 함께 SQLite JSON 함수로 응답 JSON 까지 한 번에 만듭니다.
+  (배열 순서는 SQLite 3.44+ 의 정렬 집계, 그 전 버전은 바깥 ORDER BY 로 보장)
+- 직접 실행하는 SQL 은 라우터를 거치지 않으므로 read_connection() 으로 DepartmentAdmission 을 읽을 DB 를 고릅니다.
+  (스냅샷을 읽는 요청이면 'snapshot', core/snapshot.py)
+"""
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import connections, router, DatabaseError
+
+FTS_TABLE = 'core_departmentadmission_fts'
+MIN_TRIGRAM_LENGTH = 3
+
+# bm25 컬럼 가중치: university, division, department, standards
+BM25_WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+ALL_COLUMNS = '{university division department standards}'
+
+
+def read_connection():
+    """DepartmentAdmission 읽기가 라우팅되는 DB 연결"""
+    from .models import DepartmentAdmission
+
+    return connections[router.db_for_read(DepartmentAdmission)]
+
+
+def _phrase(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like(term):
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def build_query(university='', department='', q=''):
+    """
+    검색어 → (MATCH 식, [(LIKE 대상 컬럼들, 패턴), ...])
+    - 공백으로 나눈 단어마다 AND 조건
+    - q 는 대학/계열/학과/기준학과 전체에서 찾습니다.
+    """
+    match_terms = []
+    like_terms = []
+    for columns, text in (('university', university), ('department', department), (ALL_COLUMNS, q)):
+        for term in text.split():
+            if len(term) >= MIN_TRIGRAM_LENGTH:
+                match_terms.append(f'{columns} : {_phrase(term)}')
+            else:
+                like_columns = columns.strip('{}').split()
+                like_terms.append((like_columns, _like(term)))
+    return ' AND '.join(match_terms), like_terms
+
+
+def match_sql(university='', department='', q=''):
+    """
+    FTS5 검색 SQL → (sql, params). 결과 열은 (학과 id, 관련도 순위)입니다.
+    3글자 이상 검색어가 없으면 None
+    """
+    match, like_terms = build_query(university, department, q)
+    if not match:
+        return None
+
+    rank = f'bm25({FTS_TABLE}, {", ".join(map(str, BM25_WEIGHTS))}), rowid'
+    sql = [f'SELECT rowid, row_number() OVER (ORDER BY {rank}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s']
+    params = [match]
+    for columns, pattern in like_terms:
+        sql.append('AND (' + ' OR '.join(f"{col} LIKE %s ESCAPE '\\'" for col in columns) + ')')
+        params.extend([pattern] * len(columns))
+    sql.append(f'ORDER BY {rank}')
+    return ' '.join(sql), params
+
+
+def search_ids(university='', department='', q=''):
+    """FTS5 로 DepartmentAdmission id 를 관련도 순으로 찾습니다. (인덱스를 쓸 수 없으면 None)"""
+    connection = read_connection()
+    if connection.vendor != 'sqlite':
+        return None
+
+    query = match_sql(university, department, q)
+    if query is None:
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(*query)
+            return [row[0] for row in cursor.fetchall()]
+    except DatabaseError:
+        # FTS 테이블이 없는 DB (FTS5 미지원 빌드 등)
+        return None
+
+
+# -----------------------------------------------------------
+# 검색 결과 JSON (SQLite JSON 함수로 SQL 한 번에 만들기)
+# -----------------------------------------------------------
+RESULT_COLUMNS = (
+    'year', 'quota',
+    'korean_grade', 'korean_percentile',
+    'math_grade', 'math_percentile',
+    'english_grade',
+    'inquiry_grade', 'inquiry_percentile',
+)
+
+ORDERED_AGGREGATE_VERSION = (3, 44, 0)  # json_group_array(... ORDER BY ...) 를 쓸 수 있는 SQLite
+
+_DEPARTMENT_FIELDS = """
+        'id', d.id,
+        'university', d.university,
+        'division', d.division,
+        'department', d.department,
+        'recruitment_group', d.recruitment_group,
+        'standards', json(d.standards_json),
+        'scoring', json(d.scoring_json)"""
+
+# 서브쿼리의 ORDER BY 는 바깥 집계 순서를 보장하지 않으므로 집계 안에 정렬(학과: 검색 순위, 입결: 학년도 내림차순)을 씁니다.
+# 서브쿼리를 거친 JSON 값은 텍스트가 되므로 json() 으로 다시 감싸야 문자열이 아닌 JSON 으로 들어갑니다.
+DEPARTMENTS_JSON_SQL = """
+WITH hits(id, position) AS ({hits})
+SELECT coalesce(json_group_array(json(item) ORDER BY position), '[]') FROM (
+    SELECT hits.position AS position, json_object({department_fields},
+        'results', json((
+            SELECT coalesce(json_group_array(json_object({result_fields}) ORDER BY r.year DESC), '[]')
+            FROM core_admissionresult r WHERE r.department_id = d.id
+        ))
+    ) AS item
+    FROM hits JOIN core_departmentadmission d ON d.id = hits.id
+)
+"""
+
+# 정렬 집계가 없는 SQLite: 학과 × 입결 행을 바깥 ORDER BY 로 정렬해 읽고 배열은 파이썬에서 잇습니다.
+DEPARTMENT_ROWS_SQL = """
+WITH hits(id, position) AS ({hits})
+SELECT hits.position, json_object({department_fields}),
+    CASE WHEN r.id IS NULL THEN NULL ELSE json_object({result_fields}) END
+FROM hits JOIN core_departmentadmission d ON d.id = hits.id
+LEFT JOIN core_admissionresult r ON r.department_id = d.id
+ORDER BY hits.position, r.year DESC
+"""
+
+
+def _has_ordered_aggregates(connection):
+    return connection.Database.sqlite_version_info >= ORDERED_AGGREGATE_VERSION
+
+
+def _join_rows(rows):
+    """(순위, 학과 JSON, 입결 JSON) 행 → 응답 JSON 텍스트 (학과 JSON 끝의 '}' 앞에 results 를 붙임)"""
+    items = []
+    for _, group in groupby(rows, key=itemgetter(0)):
+        group = list(group)
+        results = ','.join(result for _, _, result in group if result is not None)
+        items.append(f'{group[0][1][:-1]},"results":[{results}]}}')
+    return '[' + ','.join(items) + ']'
+
+
+def departments_json(hits_sql, params=()):
+    """
+    hits_sql 이 고른 학과(열: 학과 id, 정렬 순서)를 입결과 함께 API 응답 JSON 으로 만듭니다.
+    검색, 입결 조회, 직렬화가 SQL 한 문장이며 결과 bytes 를 돌려줍니다. (ORM 객체를 만들지 않음)
+    SQLite 3.44 미만에서는 정렬된 행만 SQL 로 만들고 배열은 파이썬에서 잇습니다.
+    """
+    connection = read_connection()
+    ordered = _has_ordered_aggregates(connection)
+    sql = (DEPARTMENTS_JSON_SQL if ordered else DEPARTMENT_ROWS_SQL).format(
+        hits=hits_sql,
+        department_fields=_DEPARTMENT_FIELDS,
+        result_fields=', '.join(f"'{column}', r.{column}" for column in RESULT_COLUMNS),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        if ordered:
+            return cursor.fetchone()[0].encode('utf-8')
+        return _join_rows(cursor.fetchall()).encode('utf-8')
@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from highschools.models import HighSchool, StandardDepartment
+from universities.models import University, UniversityDepartment
+from . import autocomplete, versioning
+from .models import DepartmentAdmission, AdmissionResult
+
+
+# -----------------------------------------------------------
+# 초성 자동완성 색인 갱신 (저장/삭제된 항목만 커밋 후에 넣고 뺍니다)
+# 롤백된 변경이나 커밋 전 이름은 색인에 들어가지 않습니다.
+# -----------------------------------------------------------
+AUTOCOMPLETE_MODELS = {
+    University: ('university', autocomplete.update_university),
+    UniversityDepartment: ('department', autocomplete.update_department),
+    HighSchool: ('highschool', autocomplete.update_highschool),
+    StandardDepartment: ('standard', autocomplete.update_standard),
+}
+
+
+def autocomplete_saved(sender, instance, using, **kwargs):
+    update = AUTOCOMPLETE_MODELS[sender][1]
+    transaction.on_commit(lambda: update(instance), using=using)
+
+
+def autocomplete_deleted(sender, instance, using, **kwargs):
+    kind = AUTOCOMPLETE_MODELS[sender][0]
+    pk = instance.pk
+    transaction.on_commit(lambda: autocomplete.remove(kind, pk), using=using)
+
+
+for model in AUTOCOMPLETE_MODELS:
+    post_save.connect(autocomplete_saved, sender=model, dispatch_uid=f'autocomplete_save_{model.__name__}')
+    post_delete.connect(autocomplete_deleted, sender=model, dispatch_uid=f'autocomplete_delete_{model.__name__}')
+
+
+# -----------------------------------------------------------
+# 학과 검색 데이터 버전 (ETag) 올리기
+# -----------------------------------------------------------
+versioning.connect(versioning.CORE, DepartmentAdmission, AdmissionResult)
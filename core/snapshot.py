@@ -0,0 +1,238 @@
+"""
+읽기 전용 스냅샷 DB (조회 API 를 적재 작업과 분리)
+
+적재 스크립트(load_base_data, load_university_data, import_data)와 관리자 화면은 기존 db.sqlite3 에 쓰고,
+조회 API 는 publish_snapshot 명령으로 만든 읽기 전용 복사본(settings.SNAPSHOT_DB_PATH)에서 읽습니다.
+- 복사본은 VACUUM INTO 로 한 시점의 일관된 상태를 정리된(vacuum) 파일로 만든 뒤 os.replace 로 한 번에 바꿉니다.
+- 'snapshot' DB 는 mode=ro&immutable=1 로 열리므로 잠금/변경 확인 없이 읽고, mmap 으로 페이지를 공유합니다.
+- 요청마다 파일이 바뀌었는지(inode) 확인하고, 바뀌었으면 연결을 닫아 새 파일을 엽니다. (워커 재시작 불필요)
+- 복사본 안의 snapshot_manifest 테이블에 복사 직전의 데이터 버전을 저장합니다. 스냅샷을 읽는 요청의
+  ETag/응답 캐시 키는 이 버전을 쓰므로, 새 스냅샷을 게시하기 전까지는 옛 데이터가 새 버전으로 캐시되지 않습니다.
+
+라우팅: SnapshotReadMiddleware 가 GET/HEAD 요청(관리자 화면 제외) 동안 reading() 을 켜고,
+SnapshotRouter 가 그동안의 대학/특성화고/검색 모델 읽기를 'snapshot' 으로 보냅니다. 쓰기는 항상 default 입니다.
+SNAPSHOT_ENABLED 가 꺼져 있거나 아직 게시된 파일이 없으면 아무것도 바꾸지 않습니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.urls import NoReverseMatch, reverse
+
+from . import versioning
+
+SNAPSHOT_ALIAS = 'snapshot'
+READ_APPS = {'universities', 'highschools', 'core'}
+MANIFEST_TABLE = 'snapshot_manifest'
+REFRESH_ATTEMPTS = 3  # manifest 를 읽는 사이에 다시 게시되면 새 파일로 다시 시도하는 횟수
+
+_reading = ContextVar('snapshot_reading', default=None)  # 읽는 중인 스냅샷의 manifest
+_manifests = {}  # inode → manifest ({scope: 데이터 버전, 'published_at': 게시 시각})
+_manifests_lock = threading.Lock()
+
+
+def path():
+    return str(settings.SNAPSHOT_DB_PATH)
+
+
+def is_enabled():
+    return getattr(settings, 'SNAPSHOT_ENABLED', False) and SNAPSHOT_ALIAS in settings.DATABASES
+
+
+def is_reading():
+    return _reading.get() is not None
+
+
+@contextmanager
+def reading(manifest=None):
+    """이 블록 안의 조회 모델 읽기를 스냅샷으로 보냅니다. (manifest 의 데이터 버전을 ETag/캐시 키에 사용)"""
+    token = _reading.set(manifest or {})
+    try:
+        yield
+    finally:
+        _reading.reset(token)
+
+
+# -----------------------------------------------------------
+# 게시
+# -----------------------------------------------------------
+def publish(using='default'):
+    """
+    현재 DB 를 스냅샷 파일로 게시합니다. → (파일 경로, 데이터 버전 dict)
+    데이터 버전은 복사 전에 읽습니다. (복사 중에 바뀐 데이터는 다음 게시 때 새 버전으로 반영)
+    """
+    versions = {scope: versioning.get_version(scope) for scope in versioning.SCOPES}
+    published_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    target = path()
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    tmp_path = f'{target}.{os.getpid()}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute('VACUUM INTO %s', [tmp_path])
+
+    copy = sqlite3.connect(tmp_path)
+    try:
+        with copy:
+            copy.execute(f'CREATE TABLE {MANIFEST_TABLE} (scope TEXT PRIMARY KEY, version TEXT NOT NULL)')
+            copy.executemany(
+                f'INSERT INTO {MANIFEST_TABLE} VALUES (?, ?)', [*versions.items(), ('published_at', published_at)],
+            )
+        copy.execute('PRAGMA journal_mode = DELETE')
+    finally:
+        copy.close()
+    os.chmod(tmp_path, 0o444)
+    os.replace(tmp_path, target)
+    return target, versions
+
+
+def _read_manifest(file_path):
+    copy = sqlite3.connect(f'file:{file_path}?mode=ro', uri=True)
+    try:
+        return dict(copy.execute(f'SELECT scope, version FROM {MANIFEST_TABLE}'))
+    finally:
+        copy.close()
+
+
+# -----------------------------------------------------------
+# 요청 처리
+# -----------------------------------------------------------
+def _inode():
+    try:
+        return os.stat(path()).st_ino
+    except FileNotFoundError:
+        return None
+
+
+def _manifest_for(inode):
+    """
+    inode 파일의 manifest. 처음 보는 파일이면 읽은 뒤 inode 가 그대로인지 다시 확인합니다.
+    (읽는 사이에 다시 게시됐으면 None → 새 파일로 다시 시도)
+    """
+    manifest = _manifests.get(inode)
+    if manifest is not None:
+        return manifest
+    manifest = _read_manifest(path())
+    if _inode() != inode:
+        return None
+    with _manifests_lock:
+        _manifests.clear()  # 옛 스냅샷의 버전은 더 이상 필요 없음
+        _manifests[inode] = manifest
+    return manifest
+
+
+def refresh():
+    """
+    게시된 스냅샷이 있으면 그 manifest 를, 없으면 None 을 돌려줍니다.
+    파일이 바뀌었으면(inode 변경) 이 스레드의 스냅샷 연결을 닫아 다음 쿼리에서 새 파일을 열게 합니다.
+    """
+    for _ in range(REFRESH_ATTEMPTS):
+        inode = _inode()
+        if inode is None:
+            return None
+        try:
+            manifest = _manifest_for(inode)
+        except sqlite3.DatabaseError:
+            return None  # 게시 도중이거나 스냅샷이 아닌 파일
+        if manifest is None:
+            continue
+        connection = connections[SNAPSHOT_ALIAS]
+        if getattr(connection, 'snapshot_inode', None) != inode:
+            connection.close()
+            connection.snapshot_inode = inode
+        return manifest
+    return None
+
+
+def published_version(scope):
+    """스냅샷을 읽는 중이면 게시 시점의 데이터 버전 (versioning.get_version 에서 사용)"""
+    manifest = _reading.get()
+    return manifest.get(scope) if manifest else None
+
+
+class SnapshotRouter:
+    def db_for_read(self, model, **hints):
+        if _reading.get() is not None and model._meta.app_label in READ_APPS:
+            return SNAPSHOT_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 스냅샷에서 읽은 객체와 default 객체는 같은 데이터입니다.
+        if {obj1._state.db, obj2._state.db} <= {'default', SNAPSHOT_ALIAS}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == SNAPSHOT_ALIAS:
+            return False
+        return None
+
+
+def _admin_prefix():
+    try:
+        return reverse('admin:index')
+    except NoReverseMatch:
+        return None
+
+
+def _applies(request):
+    if request.method not in ('GET', 'HEAD') or not is_enabled():
+        return False
+    admin_prefix = _admin_prefix()
+    return not (admin_prefix and request.path.startswith(admin_prefix))
+
+
+class SnapshotReadMiddleware:
+    """
+    GET/HEAD 조회 요청(관리자 화면 제외)의 읽기를 스냅샷으로 보냅니다.
+    비동기 요청도 reading() 의 context 가 async ORM 의 DB 스레드로 그대로 전달됩니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        manifest = refresh() if _applies(request) else None
+        if manifest is None:
+            return self.get_response(request)
+
+        with reading(manifest):
+            response = self.get_response(request)
+        return self._finish(response, manifest)
+
+    async def __acall__(self, request):
+        # 연결은 DB 스레드별이므로 refresh 도 async ORM 과 같은 스레드에서 실행합니다.
+        manifest = await sync_to_async(refresh)() if _applies(request) else None
+        if manifest is None:
+            return await self.get_response(request)
+
+        with reading(manifest):
+            response = await self.get_response(request)
+        return self._finish(response, manifest)
+
+    def _finish(self, response, manifest):
+        if response.streaming and not response.is_async:
+            response.streaming_content = self._streamed(response.streaming_content, manifest)
+        response['X-Snapshot'] = manifest.get('published_at', '')
+        return response
+
+    def _streamed(self, content, manifest):
+        with reading(manifest):
+            yield from content
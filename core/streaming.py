@@ -0,0 +1,41 @@
+"""
+대용량 JSON 스트리밍 응답 (?stream=1)
+
+목록 전체를 파이썬 리스트와 JSON 문자열로 만든 뒤 보내는 대신, 한 항목씩 직렬화해서 바로 흘려보냅니다.
+- 쿼리셋은 iterator(chunk_size=...) 로 CHUNK_SIZE 개씩 읽고, prefetch_related 도 그 묶음 단위로 실행됩니다.
+- 최대 메모리는 묶음 하나 크기로 고정되고, 첫 바이트까지 걸리는 시간은 전체 결과 크기와 상관없습니다.
+"""
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+CHUNK_SIZE = 200
+STREAM_PARAM = 'stream'
+
+
+def is_streaming(request):
+    return request.GET.get(STREAM_PARAM, '').lower() in ('1', 'true', 'yes')
+
+
+def iter_batches(iterable, size=None):
+    """iterable 을 size(기본 CHUNK_SIZE) 개씩 묶은 리스트로 돌려줍니다."""
+    size = size or CHUNK_SIZE
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def iter_json_array(items, encoder_class=DjangoJSONEncoder):
+    """항목을 하나씩 JSON 으로 인코딩해 '[', 항목, ',', ..., ']' 순서로 bytes 를 생성합니다."""
+    encode = encoder_class(ensure_ascii=False).encode
+    yield b'['
+    separator = b''
+    for item in items:
+        yield separator + encode(item).encode('utf-8')
+        separator = b','
+    yield b']'
+
+
+def json_stream_response(items, encoder_class=DjangoJSONEncoder):
+    return StreamingHttpResponse(iter_json_array(items, encoder_class), content_type='application/json')
@@ -1,3 +1,746 @@
-from django.test import TestCase
+import io
+import json
+import os
+import sqlite3
+import tempfile
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.db import connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from highschools.models import HighSchool, HighSchoolDepartment, StandardDepartment
+from universities.models import University, UniversityDivision, UniversityDepartment, DepartmentEffectiveInfo
+from .models import DepartmentAdmission, AdmissionResult
+from . import admission_loader, benchmark, bulk_loader, changelog, instrumentation, profiling, query_plans, search, snapshot, autocomplete, response_cache, versioning
+
+
+class DepartmentSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.politics = DepartmentAdmission.objects.create(
+            university='경희대학교', division='사회계열', department='정치외교학과',
+            recruitment_group='가군', standards_json=['경영·사무과'],
+        )
+        cls.software = DepartmentAdmission.objects.create(
+            university='세종대학교', division='자연계열', department='소프트웨어학과',
+            recruitment_group='가군', standards_json=['정보컴퓨터과'],
+        )
+        for year in (2024, 2025):
+            AdmissionResult.objects.create(
+                department=cls.politics, year=year, quota=3, korean_grade=2.0, korean_percentile=91,
+                math_grade=3.5, math_percentile=80, english_grade=2, inquiry_grade=2.5, inquiry_percentile=85,
+            )
+
+    def test_fts_index_follows_writes(self):
+        self.assertEqual(search.search_ids(university='경희대'), [self.politics.id])
+        self.assertEqual(search.search_ids(q='정보컴퓨터'), [self.software.id])
+
+        self.software.university = '경희대학교'
+        self.software.save()
+        self.assertEqual(set(search.search_ids(university='경희대')), {self.politics.id, self.software.id})
+
+        self.politics.delete()
+        self.assertEqual(search.search_ids(university='경희대'), [self.software.id])
+
+    def test_short_terms(self):
+        # 3글자 미만만 있으면 인덱스를 쓰지 않고, 섞여 있으면 LIKE 조건으로 붙습니다.
+        self.assertIsNone(search.search_ids(university='경희'))
+        self.assertEqual(search.search_ids(university='경희', department='정치외교'), [self.politics.id])
+
+        response = self.client.get('/api/search/', {'university': '세종'})
+        self.assertEqual([d['department'] for d in response.json()], ['소프트웨어학과'])
+
+    def test_streaming(self):
+        for params in ({'university': '대학교'}, {'university': '경희'}):
+            expected = self.client.get('/api/search/', params).json()
+            response = self.client.get('/api/search/', {**params, 'stream': '1'})
+            self.assertTrue(response.streaming)
+            self.assertEqual(json.loads(b''.join(response.streaming_content)), expected)
+
+    def test_json_in_one_query(self):
+        # FTS 경로와 icontains 경로 모두 SQL 한 번으로 응답 JSON 을 만듭니다.
+        for params in ({'university': '경희대'}, {'university': '경희'}):
+            with self.assertNumQueries(1):
+                data = self.client.get('/api/search/', params).json()
+            self.assertEqual([d['id'] for d in data], [self.politics.id])
+            self.assertEqual(data[0]['standards'], ['경영·사무과'])
+            self.assertEqual([r['year'] for r in data[0]['results']], [2025, 2024])
+            self.assertEqual(data[0]['results'][0]['math_grade'], 3.5)
+        self.assertEqual(self.client.get('/api/search/', {'university': '없는대학교'}).json(), [])
+
+    def test_json_order_is_explicit(self):
+        # 학과는 검색 순위, 입결은 학년도 내림차순 (서브쿼리 정렬에 기대지 않음)
+        for year in (2023, 2026):
+            AdmissionResult.objects.create(
+                department=self.politics, year=year, quota=1, korean_grade=3.0, korean_percentile=80,
+                math_grade=3.0, math_percentile=80, english_grade=3, inquiry_grade=3.0, inquiry_percentile=80,
+            )
+        hits = search.match_sql(university='대학교')
+        expected_ids = search.search_ids(university='대학교')
+        paths = [False] + ([True] if sqlite3.sqlite_version_info >= search.ORDERED_AGGREGATE_VERSION else [])
+        for ordered in paths:
+            with mock.patch('core.search._has_ordered_aggregates', return_value=ordered):
+                data = json.loads(search.departments_json(*hits))
+            self.assertEqual([d['id'] for d in data], expected_ids)
+            by_id = {d['id']: d for d in data}
+            self.assertEqual([r['year'] for r in by_id[self.politics.id]['results']], [2026, 2025, 2024, 2023])
+            self.assertEqual(by_id[self.software.id]['results'], [])
+            self.assertEqual(by_id[self.software.id]['standards'], ['정보컴퓨터과'])
+
+
+class AutocompleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.khu = University.objects.create(name='경희대학교')
+        division = UniversityDivision.objects.create(university=cls.khu, name='사회계열')
+        cls.dept = UniversityDepartment.objects.create(division=division, name='정치외교학과')
+        HighSchool.objects.create(region='서울특별시교육청', name='경기기계공업고등학교')
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(DATA_VERSION_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        autocomplete.invalidate()
+
+    def names(self, query, **kwargs):
+        return [item['name'] for item in autocomplete.get_index().search(query, **kwargs)]
+
+    def test_choseong_and_mixed_queries(self):
+        self.assertEqual(self.names('ㄱㅎㄷ'), ['경희대학교'])
+        self.assertEqual(self.names('ㅈㅊㅇㄱ'), ['정치외교학과'])
+        self.assertEqual(self.names('경ㅎ'), ['경희대학교'])
+        self.assertEqual(self.names('경기'), ['경기기계공업고등학교'])
+        self.assertEqual(self.names('ㄱ', kinds={'highschool'}), ['경기기계공업고등학교'])
+
+    def test_incremental_updates(self):
+        index = autocomplete.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.khu.name = '경희사이버대학교'
+            self.khu.save()
+        self.assertEqual(self.names('ㄱㅎㅅ'), ['경희사이버대학교'])
+        self.assertEqual(self.names('ㄱㅎㄷ'), [])
+        item = autocomplete.get_index().search('ㅈㅊ')[0]
+        self.assertEqual(item['label'], '경희사이버대학교 정치외교학과 (가군)')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dept.delete()
+        self.assertEqual(self.names('ㅈㅊ'), [])
+        self.assertIs(autocomplete.get_index(), index)  # 이 프로세스의 변경만 있었으므로 다시 만들지 않음
+
+    def test_rollback_is_not_indexed(self):
+        autocomplete.get_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    University.objects.create(name='서울대학교')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(self.names('ㅅㅇㄷ'), [])
+
+    def test_rebuilds_after_change_from_other_process(self):
+        index = autocomplete.get_index()
+        # bulk_create 적재처럼 시그널 없이 바뀌고, 다른 프로세스가 버전을 올린 경우
+        HighSchool.objects.bulk_create([HighSchool(region='서울특별시교육청', name='서울로봇고등학교')])
+        with open(versioning._path(versioning.HIGHSCHOOLS), 'w') as f:
+            f.write('1-999999')
+        self.assertEqual(self.names('ㅅㅇㄹ'), ['서울로봇고등학교'])
+        self.assertIsNot(autocomplete.get_index(), index)
+
+    @skipUnless(versioning.fcntl, "파일 잠금(fcntl)이 없는 플랫폼")
+    def test_version_write_waits_for_other_writer(self):
+        # 다른 프로세스가 버전을 쓰는 중이면(잠금을 잡고 있으면) 앞 버전을 읽지 않고 기다립니다.
+        import fcntl
+        import threading
+
+        path = versioning._path(versioning.HIGHSCHOOLS)
+        since = versioning.get_version(versioning.HIGHSCHOOLS)
+        with open(f'{path}.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            writer = threading.Thread(target=versioning._write, args=(versioning.HIGHSCHOOLS,))
+            writer.start()
+            writer.join(0.2)
+            self.assertTrue(writer.is_alive())
+            with open(path, 'w') as f:
+                f.write('1-999999')  # 잠금을 잡은 다른 프로세스의 버전
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        writer.join()
+        current = versioning.get_version(versioning.HIGHSCHOOLS)
+        self.assertFalse(versioning.only_written_here(versioning.HIGHSCHOOLS, since, current))
+        self.assertTrue(versioning.only_written_here(versioning.HIGHSCHOOLS, '1-999999', current))
+
+    def test_api(self):
+        response = self.client.get('/api/autocomplete/', {'q': 'ㄱㅎ', 'types': 'university'})
+        self.assertEqual(response.json()[0]['type'], 'university')
+
+
+class DataVersionETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = DepartmentAdmission.objects.create(
+            university='경희대학교', division='사회계열', department='정치외교학과', recruitment_group='가군',
+        )
+        cls.univ = University.objects.create(name='경희대학교')
+        cls.division = UniversityDivision.objects.create(university=cls.univ, name='사회계열')
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(DATA_VERSION_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def assert_not_modified(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+        with self.assertNumQueries(0):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+        return response['ETag']
+
+    def test_not_modified_without_queries(self):
+        for url in ['/api/universities/', '/api/highschools/', '/api/highschools/regions/', '/api/search/?q=정치외교']:
+            self.assert_not_modified(url)
+
+    def test_writes_change_etag(self):
+        etag = self.assert_not_modified('/api/search/?q=정치외교')
+        self.dept.department = '정치외교학부'
+        self.dept.save()
+        response = self.client.get('/api/search/?q=정치외교', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        # ManyToMany 변경과 다른 scope(기준학과) 변경도 대학 목록 ETag 에 반영됩니다.
+        etag = self.assert_not_modified('/api/universities/')
+        standard = StandardDepartment.objects.create(name='경영·사무과')
+        response = self.client.get('/api/universities/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.division.eligible_standard_departments.add(standard)
+        response = self.client.get('/api/universities/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_caches_follow_version_from_other_process(self):
+        from universities import matching
+
+        index = matching.get_index()
+        self.assertIs(matching.get_index(), index)
+        versioning._write(versioning.UNIVERSITIES)  # 다른 프로세스에서 데이터가 바뀐 경우
+        self.assertIsNot(matching.get_index(), index)
+
+
+class ResponseCacheTests(TransactionTestCase):
+    """커밋 시점의 버전 갱신까지 확인해야 하므로 TransactionTestCase 를 사용합니다."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(DATA_VERSION_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        response_cache.get_cache().clear()
+
+    def test_hit_until_signal(self):
+        dept = DepartmentAdmission.objects.create(
+            university='경희대학교', division='사회계열', department='정치외교학과', recruitment_group='가군',
+        )
+        first = self.client.get('/api/search/', {'university': '경희대', 'department': '정치외교'})
+        self.assertEqual(first['X-Cache'], 'MISS')
+        # 파라미터 순서/공백/빈 값이 달라도 같은 키입니다.
+        with self.assertNumQueries(0):
+            cached = self.client.get('/api/search/?department=정치외교%20&university=경희대&q=')
+        self.assertEqual(cached['X-Cache'], 'HIT')
+        self.assertEqual(cached.content, first.content)
+
+        dept.department = '정치외교학부'
+        dept.save()
+        response = self.client.get('/api/search/', {'university': '경희대', 'department': '정치외교'})
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['department'], '정치외교학부')
+
+    def test_regions_and_uncommitted_changes(self):
+        HighSchool.objects.create(region='서울특별시교육청', name='선린인터넷고등학교')
+        self.assertEqual(self.client.get('/api/highschools/regions/')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get('/api/highschools/regions/')['X-Cache'], 'HIT')
+
+        with transaction.atomic():
+            HighSchool.objects.create(region='부산광역시교육청', name='부산컴퓨터과학고등학교')
+            response = self.client.get('/api/highschools/regions/')
+            self.assertNotIn('X-Cache', response)  # 커밋 전 데이터는 저장하지 않음
+        response = self.client.get('/api/highschools/regions/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json(), ['부산광역시교육청', '서울특별시교육청'])
+
+
+class BulkLoaderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.std = StandardDepartment.objects.create(name='정보컴퓨터과')
+        University.objects.create(pk=1, name='옛 이름')
+
+    def write_fixture(self, objects):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(objects, f, ensure_ascii=False, indent=4)
+        return path
+
+    def test_iter_array_across_chunks(self):
+        text = '[ {"a": "가나다", "b": [1, 2]} ,\n{"c": {}}, 3 ]'
+        self.assertEqual(list(bulk_loader.iter_array(io.StringIO(text), chunk_size=4)), [
+            {'a': '가나다', 'b': [1, 2]}, {'c': {}}, 3,
+        ])
+        with self.assertRaises(bulk_loader.FixtureError):
+            list(bulk_loader.iter_array(io.StringIO('[{"a": 1}, {"b": '), chunk_size=4))
+
+    def test_load_in_batches(self):
+        # 학과가 계열보다 먼저 나와도(배치가 나뉘어도) 같은 트랜잭션이므로 저장됩니다.
+        path = self.write_fixture([
+            {'model': 'universities.universitydepartment', 'pk': 10, 'fields': {
+                'division': 5, 'name': '컴퓨터공학과', 'recruitment_group': '가군', 'eligible_standard_departments': [],
+            }},
+            {'model': 'universities.university', 'pk': 1, 'fields': {'name': '서강대학교', 'logo_image': ''}},
+            {'model': 'universities.universitydivision', 'pk': 5, 'fields': {
+                'university': 1, 'name': '자연계열', 'korean_score': 30.0,
+                'eligible_standard_departments': [self.std.pk],
+            }},
+        ])
+        stats = bulk_loader.load([path], batch_size=2)
+        self.assertEqual(stats.total, 3)
+        self.assertEqual(University.objects.get(pk=1).name, '서강대학교')  # 같은 pk 는 덮어쓰기
+        dept = UniversityDepartment.objects.get(pk=10)
+        self.assertEqual(dept.division.university.name, '서강대학교')
+        # bulk 저장 후 학과 최종 정보도 다시 계산됩니다.
+        self.assertEqual(DepartmentEffectiveInfo.objects.get(department=dept).standard_names, ['정보컴퓨터과'])
+
+    def test_unknown_fields_rejected(self):
+        path = self.write_fixture([
+            {'model': 'universities.university', 'pk': 1, 'fields': {'name': '서강대학교', 'logo': ''}},
+        ])
+        with self.assertRaises(bulk_loader.FixtureError):
+            bulk_loader.load([path])
+        self.assertEqual(University.objects.get(pk=1).name, '옛 이름')  # 트랜잭션 전체 롤백
+
+        bulk_loader.load([path], ignorenonexistent=True)
+        self.assertEqual(University.objects.get(pk=1).name, '서강대학교')
+
+    def test_natural_key_forward_reference(self):
+        from django.contrib.auth.models import Group, User
+
+        # 사용자가 뒤 배치의 그룹을 natural key 로 가리킵니다.
+        path = self.write_fixture([
+            {'model': 'auth.user', 'pk': 50, 'fields': {'username': 'editor', 'password': '!', 'groups': [['편집자']]}},
+            {'model': 'auth.group', 'pk': 7, 'fields': {'name': '편집자'}},
+        ])
+        bulk_loader.load([path], batch_size=1)
+        self.assertEqual(list(User.objects.get(pk=50).groups.all()), [Group.objects.get(pk=7)])
+
+
+class AdmissionLoaderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        univ = University.objects.create(name='서강대학교')
+        division = UniversityDivision.objects.create(university=univ, name='자연계열', korean_score=30.0)
+        cls.depts = [
+            UniversityDepartment.objects.create(division=division, name=f'학과{i}', recruitment_group='가군')
+            for i in range(4)
+        ]
+
+    def fixture(self, years, **fields):
+        items = [
+            {'model': 'universities.admissionresult', 'fields': {
+                'department': dept.pk, 'year': year, 'recruit_count': None,
+                'korean_grade': 2.0, 'korean_percentile': 91.0, 'math_grade': 3.0, 'math_percentile': 80.0,
+                'english_grade': 2.0, 'inquiry_grade': 2.5, 'inquiry_percentile': 85.0, **fields,
+            }}
+            for year in years for dept in self.depts
+        ]
+        return io.StringIO(json.dumps(items))
+
+    def test_reload_is_idempotent(self):
+        stats = admission_loader.load(self.fixture([2024, 2025]))
+        self.assertEqual((stats.saved, stats.errors), (8, []))
+        stats = admission_loader.load(self.fixture([2025, 2026], recruit_count=5))
+        self.assertEqual(DepartmentAdmission.objects.count(), 4)
+        self.assertEqual(AdmissionResult.objects.count(), 12)  # 학과 4개 × 3개 연도
+        self.assertEqual(AdmissionResult.objects.get(department__department='학과0', year=2024).quota, 0)
+        self.assertEqual(AdmissionResult.objects.get(department__department='학과0', year=2025).quota, 5)
+
+    def test_queries_per_batch_are_constant(self):
+        # 배치(학과 4개)당 학과 읽기 1 + DepartmentAdmission upsert 1 + id 읽기 1 + 입결 upsert 1
+        # (트랜잭션 savepoint 2개 제외)
+        with self.assertNumQueries(2 + 4):
+            admission_loader.load(self.fixture([2024]), batch_size=4)
+        with self.assertNumQueries(2 + 4 * 3):
+            admission_loader.load(self.fixture([2023, 2024, 2025]), batch_size=4)
+
+
+class ChangeLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.std = StandardDepartment.objects.create(name='정보컴퓨터과')
+        cls.univ = University.objects.create(name='서강대학교')
+        cls.division = UniversityDivision.objects.create(university=cls.univ, name='자연계열')
+
+    def get(self, **params):
+        response = self.client.get('/api/changes/', params)
+        if response.streaming:
+            return json.loads(b''.join(response.streaming_content))
+        return response.json()
+
+    def test_snapshot_then_deltas(self):
+        snapshot = self.get()
+        self.assertTrue(snapshot['snapshot'])
+        self.assertIn(
+            {'model': 'universities.university', 'pk': self.univ.pk, 'fields': {'name': '서강대학교', 'logo_image': ''}},
+            snapshot['objects'],
+        )
+        version = snapshot['version']
+        self.assertEqual(self.get(since=version)['changes'], [])
+
+        dept = UniversityDepartment.objects.create(division=self.division, name='컴퓨터공학과')
+        dept.eligible_standard_departments.add(self.std)
+        self.univ.name = '서강대'
+        self.univ.save()
+        delta = self.get(since=version)
+        self.assertFalse(delta['snapshot'])
+        changes = {(c['model'], c['pk']): c for c in delta['changes']}
+        # 같은 학과의 추가 + M2M 변경은 현재 값 하나로 합쳐집니다.
+        self.assertEqual(changes[('universities.universitydepartment', dept.pk)]['fields']['eligible_standard_departments'], [self.std.pk])
+        self.assertEqual(changes[('universities.university', self.univ.pk)]['fields']['name'], '서강대')
+        self.assertIn(('universities.departmenteffectiveinfo', dept.pk), changes)
+
+        version, dept_pk = delta['version'], dept.pk
+        dept.delete()
+        changes = self.get(since=version)['changes']
+        self.assertIn({'model': 'universities.universitydepartment', 'pk': dept_pk, 'action': 'delete'}, changes)
+
+    def test_deleting_m2m_target_updates_owners(self):
+        school = HighSchool.objects.create(region='서울특별시교육청', name='선린인터넷고등학교')
+        hs_dept = HighSchoolDepartment.objects.create(school=school, name='소프트웨어과')
+        hs_dept.standard_departments.add(self.std)
+        dept = UniversityDepartment.objects.create(division=self.division, name='컴퓨터공학과')
+        dept.eligible_standard_departments.add(self.std)
+        self.division.eligible_standard_departments.add(self.std)
+        version = self.get()['version']
+
+        std_pk = self.std.pk
+        self.std.delete()  # through 행은 m2m_changed 없이 지워짐
+        changes = {(c['model'], c['pk']): c for c in self.get(since=version)['changes']}
+        self.assertEqual(changes[('highschools.standarddepartment', std_pk)]['action'], 'delete')
+        self.assertEqual(changes[('highschools.highschooldepartment', hs_dept.pk)]['fields']['standard_departments'], [])
+        self.assertEqual(changes[('universities.universitydepartment', dept.pk)]['fields']['eligible_standard_departments'], [])
+        self.assertEqual(changes[('universities.universitydivision', self.division.pk)]['fields']['eligible_standard_departments'], [])
+
+    def test_paging_and_compaction(self):
+        version = changelog.latest_version()
+        for i in range(3):
+            University.objects.create(name=f'대학{i}')
+        first = self.get(since=version, limit=2)
+        self.assertTrue(first['more'])
+        rest = self.get(since=first['version'], limit=2)
+        self.assertFalse(rest['more'])
+        self.assertEqual(len(first['changes']) + len(rest['changes']), 3)
+
+        changelog.compact(first['version'])
+        self.assertTrue(self.get(since=version)['snapshot'])  # 지워진 구간 → 스냅샷
+        self.assertEqual(len(self.get(since=first['version'])['changes']), 1)
+        self.assertEqual(self.client.get('/api/changes/', {'since': 'x'}).status_code, 400)
+
+
+class BenchmarkTests(TestCase):
+    def test_catalog_is_deterministic(self):
+        first = benchmark.SyntheticCatalog(seed=7, scale=0.01)
+        second = benchmark.SyntheticCatalog(seed=7, scale=0.01)
+        self.assertEqual(first.highschool_names, second.highschool_names)
+        self.assertEqual(len(set(first.highschool_names)), first.n_highschools)
+        self.assertEqual(list(first.iter_base_objects())[-1], list(second.iter_base_objects())[-1])
+        self.assertNotEqual(first.university_names, benchmark.SyntheticCatalog(seed=8, scale=0.01).university_names)
+
+    def test_run_small_scale(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        with override_settings(DATA_VERSION_DIR=tmp.name):
+            result = benchmark.run(seed=1, scale=0.002, repeat=1, workdir=tmp.name, workers=1, log=lambda message: None)
+
+        self.assertEqual(result['sizes']['universities.University'], 1)
+        self.assertEqual(result['sizes']['core.AdmissionResult'], 1000)  # 학과 100 × 10개 연도
+        self.assertEqual(result['sizes']['highschools.HighSchool'], 10)
+        for name, endpoint in result['endpoints'].items():
+            self.assertEqual(endpoint['status'], 200, name)
+        self.assertEqual(result['endpoints']['highschools_rows']['queries_max'], 2)
+
+        changes = dict((key, change) for key, _, _, change in benchmark.compare(result, result))
+        self.assertEqual(changes['endpoints.search_standard.p50_ms'], 0.0)
+
+
+@override_settings(SQL_INSTRUMENTATION=True, SQL_N_PLUS_ONE_THRESHOLD=3, SQL_SLOW_REQUEST_MS=60_000)
+class SQLInstrumentationTests(TestCase):
+    def test_normalize_sql(self):
+        self.assertEqual(
+            instrumentation.normalize_sql("SELECT * FROM t WHERE id IN (%s, %s,%s) AND name = 'a''b' LIMIT 21"),
+            instrumentation.normalize_sql("SELECT *  FROM t WHERE id IN (%s) AND name = 'c'\nLIMIT 5"),
+        )
+
+    def _request(self, queries):
+        def view(request):
+            for pk in range(queries):
+                list(StandardDepartment.objects.filter(pk=pk))
+            return HttpResponse('ok')
+        return instrumentation.SQLInstrumentationMiddleware(view)(RequestFactory().get('/api/test/'))
+
+    def test_headers(self):
+        response = self._request(2)
+        self.assertEqual(response['X-DB-Queries'], '2')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="2 queries", app;dur=[\d.]+$')
+        self.assertNotIn('X-DB-Repeated-Queries', response)
+
+    def test_flags_n_plus_one(self):
+        with self.assertLogs('core.sql', 'WARNING') as logs:
+            response = self._request(4)
+        self.assertEqual(response['X-DB-Repeated-Queries'], '1')
+        self.assertIn('N+1', logs.output[0])
+        self.assertIn('4번', logs.output[0])
+
+    @override_settings(SQL_INSTRUMENTATION=False)
+    def test_disabled(self):
+        self.assertNotIn('X-DB-Queries', self._request(4))
+
+
+class ProfilingTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.profile_dir = tmp.name
+        settings_override = override_settings(
+            PROFILING_ENABLED=True, PROFILING_TOKEN='secret', PROFILE_DIR=tmp.name, DATA_VERSION_DIR=tmp.name,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        StandardDepartment.objects.create(name='정보컴퓨터과')
+
+    def test_token_profiles_request(self):
+        from .models import ProfileReport
+
+        response = self.client.get('/api/highschools/regions/', HTTP_X_PROFILE='secret')
+        self.assertEqual(response.status_code, 200)
+        report = ProfileReport.objects.get(name=response['X-Profile-Report'])
+        self.assertEqual(report.path, '/api/highschools/regions/')
+        self.assertGreater(report.query_count, 0)
+        self.assertEqual(set(report.summary['categories_ms']), {'serializers', 'orm', 'rendering', 'other'})
+        self.assertTrue(os.path.exists(os.path.join(self.profile_dir, f'{report.name}.prof')))
+        self.assertIn('구간별 시간', profiling.read_report(report.name))
+
+    def test_requires_authorization(self):
+        for headers in ({}, {'HTTP_X_PROFILE': 'wrong'}):
+            response = self.client.get('/api/highschools/regions/?profile=1', **headers)
+            self.assertNotIn('X-Profile-Report', response)
+
+
+class QueryPlanTests(TestCase):
+    def test_full_scans(self):
+        sql = 'WITH hits(id, position) AS (SELECT 1) SELECT * FROM t WHERE a = %s'
+        plan = [
+            'SCAN hits', 'SCAN (subquery-2)', 'SCAN t_fts VIRTUAL TABLE INDEX 0:M4',
+            'SCAN t USING COVERING INDEX t_idx', 'SEARCH t USING INDEX t_idx (a=?)', 'SCAN t', 'SEARCH u',
+        ]
+        self.assertEqual(query_plans.full_scans(sql, plan), ['t', 'u'])
+        self.assertEqual(query_plans.full_scans('SELECT MAX(id) FROM u', ['SEARCH u']), [])
+
+    def test_hot_queries_use_indexes(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        catalog = benchmark.SyntheticCatalog(seed=1, scale=0.002)
+        with override_settings(DATA_VERSION_DIR=tmp.name):
+            benchmark.run_loaders(catalog, tmp.name, workers=1, log=lambda message: None)
+            results = query_plans.check(catalog)
+
+        self.assertEqual(query_plans.regressions(results), [])
+        self.assertTrue(all(result['status'] == 200 for result in results.values()))
+        self.assertIn('SEARCH core_changelog USING COVERING INDEX changelog_action_object_idx (action=?)', [
+            step for plan in results['changes_delta']['plans'] for step in plan['plan']
+        ])
+
+
+class SnapshotTests(TransactionTestCase):
+    """VACUUM INTO 는 트랜잭션 안에서 실행할 수 없으므로 TransactionTestCase 를 사용합니다."""
+    databases = {'default', 'snapshot'}
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'snapshot.sqlite3')
+        settings_override = override_settings(
+            SNAPSHOT_ENABLED=True, SNAPSHOT_DB_PATH=self.path, DATA_VERSION_DIR=tmp.name,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        response_cache.get_cache().clear()
+
+        # 테스트에서는 snapshot 이 default 를 가리키므로(TEST MIRROR) 게시한 파일을 직접 열게 합니다.
+        connection = connections['snapshot']
+        original = connection.settings_dict['NAME']
+        connection.close()
+        connection.settings_dict['NAME'] = f'file:{self.path}?mode=ro&immutable=1'
+
+        def restore():
+            connection.close()
+            connection.settings_dict['NAME'] = original
+        self.addCleanup(restore)
+
+    def names(self, response):
+        return [university['name'] for university in response.json()]
+
+    def test_reads_published_snapshot(self):
+        University.objects.create(name='경희대학교')
+        self.assertEqual(self.names(self.client.get('/api/universities/?fields=id,name')), ['경희대학교'])
+        snapshot.publish()
+
+        University.objects.create(name='세종대학교')
+        first = self.client.get('/api/universities/?fields=id,name')
+        self.assertEqual(self.names(first), ['경희대학교'])
+        self.assertTrue(first['X-Snapshot'])
+        # 게시 전의 변경은 스냅샷 ETag 에 반영되지 않습니다.
+        self.assertEqual(self.client.get('/api/universities/?fields=id,name', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        snapshot.publish()
+        second = self.client.get('/api/universities/?fields=id,name')
+        self.assertEqual(self.names(second), ['경희대학교', '세종대학교'])
+        self.assertNotEqual(second['ETag'], first['ETag'])
+
+    def test_search_reads_published_snapshot(self):
+        dept = DepartmentAdmission.objects.create(
+            university='경희대학교', division='사회계열', department='정치외교학과', recruitment_group='가군',
+        )
+        snapshot.publish()
+        DepartmentAdmission.objects.filter(pk=dept.pk).update(department='국제관계학과')
+
+        # FTS + JSON SQL 한 문장, 스트리밍(ORM), 비동기 API 모두 스냅샷을 읽습니다.
+        for url in ('/api/search/?q=정치외교', '/api/search/?q=정치외교&stream=1', '/api/async/search/?q=정치외교'):
+            response = self.client.get(url)
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            self.assertEqual([item['department'] for item in json.loads(body)], ['정치외교학과'], url)
+        self.assertEqual(json.loads(self.client.get('/api/search/?q=국제관계').content), [])
+
+    def test_manifest_of_republished_file(self):
+        # manifest 를 읽는 사이에 다시 게시되면 옛 inode 에 새 manifest 를 기록하지 않고 새 파일로 다시 읽습니다.
+        snapshot.publish()
+        old_inode = os.stat(self.path).st_ino
+        read_manifest = snapshot._read_manifest
+
+        def publish_while_reading(file_path):
+            manifest = read_manifest(file_path)
+            if os.stat(self.path).st_ino == old_inode:
+                versioning.bump(versioning.UNIVERSITIES)
+                snapshot.publish()
+            return manifest
+
+        with mock.patch.object(snapshot, '_manifests', {}), \
+                mock.patch.object(snapshot, '_read_manifest', side_effect=publish_while_reading):
+            manifest = snapshot.refresh()
+            new_inode = os.stat(self.path).st_ino
+            self.assertNotEqual(new_inode, old_inode)
+            self.assertEqual(list(snapshot._manifests), [new_inode])
+        self.assertEqual(manifest['universities'], versioning.get_version(versioning.UNIVERSITIES))
+
+    def test_admin_and_writes_use_default(self):
+        snapshot.publish()
+        with snapshot.reading({}):
+            self.assertEqual(University.objects.all().db, 'snapshot')
+            University.objects.create(name='경희대학교')  # 쓰기는 default
+            self.assertEqual(University.objects.using('default').count(), 1)
+        self.assertEqual(University.objects.all().db, 'default')
+        response = self.client.get('/admin/login/')
+        self.assertNotIn('X-Snapshot', response)
+
+
+class AsyncViewTests(TestCase):
+    """비동기 API 는 같은 데이터에서 동기 API 와 같은 JSON 을 돌려줘야 합니다."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(DATA_VERSION_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.catalog = benchmark.SyntheticCatalog(seed=3, scale=0.002)
+        benchmark.run_loaders(self.catalog, tmp.name, workers=1, log=lambda message: None)
+        response_cache.get_cache().clear()
+
+    async def assertSameJSON(self, sync_url, async_url, key=None):
+        expected = (await self.async_client.get(sync_url)).json()
+        response = await self.async_client.get(async_url)
+        self.assertEqual(response.status_code, 200, async_url)
+        actual = response.json()
+        if key:  # 동기 API 는 지역 인덱스 순서, 비동기 API 는 id 순서
+            expected, actual = sorted(expected, key=key), sorted(actual, key=key)
+        self.assertEqual(actual, expected, async_url)
+
+    async def test_search_and_highschools(self):
+        urls = benchmark.endpoint_urls(self.catalog)
+        query = urls['search_standard'].split('?', 1)[1]
+        await self.assertSameJSON(f'/api/search/?{query}', f'/api/async/search/?{query}')
+        await self.assertSameJSON('/api/highschools/regions/', '/api/async/highschools/regions/')
+        region = self.catalog.highschool_regions[0][:2]
+        await self.assertSameJSON(
+            f'/api/highschools/?region={region}', f'/api/async/highschools/?region={region}',
+            key=lambda school: school['id'],
+        )
+
+        response = await self.async_client.get('/api/async/highschools/regions/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        cached = await self.async_client.get('/api/async/highschools/regions/', headers={'If-None-Match': response['ETag']})
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_highschools_region_first_request(self):
+        # 프로세스의 첫 요청이 비동기 지역 필터여도 교육청 목록을 DB 스레드에서 읽어야 합니다.
+        region = self.catalog.highschool_regions[0][:2]
+        with mock.patch('highschools.views._regions', None):
+            response = await self.async_client.get(f'/api/async/highschools/?region={region}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json())
+        self.assertTrue(all(school['region'].startswith(region) for school in response.json()))
+
+    async def test_universities_pages(self):
+        # 로고가 있는 대학, 저장된 최종 정보(DepartmentEffectiveInfo)가 없는 학과도 포함
+        @sync_to_async
+        def add_universities():
+            standard = StandardDepartment.objects.create(name='정보통신과')
+            for n in range(3):
+                univ = University.objects.create(name=f'비동기대학{n}', logo_image=f'logos/{n}.png' if n else '')
+                division = UniversityDivision.objects.create(university=univ, name='공학계열', korean_score=30)
+                division.eligible_standard_departments.add(standard)
+                UniversityDepartment.objects.create(division=division, name='전자공학과', recruitment_group='나군')
+            DepartmentEffectiveInfo.objects.filter(department__division__university__name='비동기대학2').delete()
+        await add_universities()
+
+        async def walk(prefix):
+            pages, url = [], f'{prefix}?page_size=2'
+            while url:
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 200, url)
+                pages.append(response.json())
+                url = pages[-1]['next']
+            return pages
+
+        pages = await walk('/api/async/universities/')
+        # next/previous 링크는 경로만 다릅니다.
+        same_links = json.loads(json.dumps(pages).replace('/api/async/universities/', '/api/universities/'))
+        self.assertEqual(same_links, await walk('/api/universities/'))
+        self.assertEqual([page['previous'] is None for page in pages], [True] + [False] * (len(pages) - 1))
+        universities = {u['name']: u for page in pages for u in page['results']}
+        self.assertIsNone(universities['비동기대학0']['logo_image'])
+        self.assertEqual(universities['비동기대학1']['logo_image'], 'http://testserver/media/logos/1.png')
+        dept = universities['비동기대학2']['divisions'][0]['departments'][0]
+        self.assertEqual(dept['final_recruitment_info']['standards'], ['정보통신과'])
+        self.assertEqual(dept['final_recruitment_info']['scores']['korean'], 30)
+
+        # 동기 API 의 previous 링크(뒤로 가는 cursor)도 그대로 받습니다.
+        previous = pages[-1]['previous'].replace('/api/universities/', '/api/async/universities/')
+        self.assertEqual((await self.async_client.get(previous)).json()['results'], pages[-2]['results'])
+        # 배열 형식, fields 선택도 동기 API 와 같습니다.
+        for query in ('', '?fields=id,name', '?expand=divisions'):
+            await self.assertSameJSON(f'/api/universities/{query}', f'/api/async/universities/{query}')
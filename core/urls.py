@@ -1,9 +1,16 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     path('', views.index, name='index'),
     path('highschool-search/', views.highschool_search, name='highschool_search'),
     path('edurank-search/', views.edurank_search, name='edurank_search'),
     path('api/search/', views.department_search_api, name='api_search'),
+    path('api/autocomplete/', views.autocomplete_api, name='api_autocomplete'),
+    path('api/changes/', views.changes_api, name='api_changes'),
+    # [신규] 비동기(ASGI) 조회 API (core/async_views.py)
+    path('api/async/search/', async_views.department_search_api, name='api_async_search'),
+    path('api/async/highschools/', async_views.highschool_list_api, name='api_async_highschools'),
+    path('api/async/highschools/regions/', async_views.highschool_regions_api, name='api_async_highschool_regions'),
+    path('api/async/universities/', async_views.university_list_api, name='api_async_universities'),
 ]
\ No newline at end of file
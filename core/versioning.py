@@ -0,0 +1,190 @@
+"""
+데이터 버전 (ETag / Last-Modified / 조건부 GET)
+
+입시 데이터는 시즌 중 몇 번만 바뀌고 조회는 아주 많으므로, 데이터 묶음(scope)마다 버전을 두고
+저장/삭제/M2M 시그널이 올 때마다 버전을 올립니다.
+- universities: 대학, 계열, 학과, 입결(universities.AdmissionResult)
+- highschools: 특성화고, 고교 학과, 기준학과
+- core: 학과 검색 데이터(DepartmentAdmission, core.AdmissionResult)
+
+버전은 DATA_VERSION_DIR 아래 scope 이름의 파일에 저장하므로 모든 워커 프로세스가 같은 값을 봅니다.
+(이전 버전 읽기와 새 버전 쓰기는 '<scope>.lock' 파일 잠금으로 프로세스 간에 한 번에 하나씩만 합니다.)
+조회 API 는 conditional() 로 ETag/Last-Modified 를 붙이고, If-None-Match 가 같으면 쿼리 없이 304 를 돌려줍니다.
+bulk_create / update() / raw SQL 처럼 시그널이 없는 일괄 작업 뒤에는 bump() 를 직접 호출해야 합니다.
+"""
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.views.decorators.http import condition
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금이 없으면 only_written_here() 가 항상 False (캐시를 다시 만듦)
+    fcntl = None
+
+UNIVERSITIES = 'universities'
+HIGHSCHOOLS = 'highschools'
+CORE = 'core'
+SCOPES = (UNIVERSITIES, HIGHSCHOOLS, CORE)
+
+
+def _path(scope):
+    return os.path.join(settings.DATA_VERSION_DIR, scope)
+
+
+_written = {}  # (scope, 이 프로세스가 쓴 버전) → 바로 앞 버전
+_written_lock = threading.Lock()
+MAX_WRITTEN = 1000
+
+
+@contextmanager
+def _file_lock(path):
+    """다른 프로세스의 _write 와 겹치지 않도록 '<path>.lock' 에 배타 잠금을 겁니다."""
+    with open(f'{path}.lock', 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _write(scope):
+    """
+    새 버전('<나노초 시각>-<pid>')을 임시 파일에 쓴 뒤 os.replace 로 한 번에 바꿉니다.
+    바로 앞 버전을 읽고 바꾸는 사이에 다른 프로세스가 끼어들 수 없도록 파일 잠금 안에서 합니다.
+    """
+    version = f'{time.time_ns()}-{os.getpid()}'
+    path = _path(scope)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if fcntl is None:
+        _replace(path, version)
+        return version
+    with _file_lock(path):
+        try:
+            with open(path) as f:
+                previous = f.read().strip()
+        except FileNotFoundError:
+            previous = None
+        _replace(path, version)
+    with _written_lock:
+        if len(_written) >= MAX_WRITTEN:
+            _written.clear()  # 이어진 기록이 끊기면 only_written_here() 가 False → 다시 만들면 됨
+        _written[scope, version] = previous
+    return version
+
+
+def _replace(path, version):
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(version)
+    os.replace(tmp_path, path)
+
+
+def get_version(scope):
+    # 읽기 전용 스냅샷을 읽는 요청은 스냅샷을 게시할 때의 버전을 사용합니다. (core/snapshot.py)
+    from .snapshot import published_version
+    if (version := published_version(scope)) is not None:
+        return version
+    try:
+        with open(_path(scope)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return _write(scope)
+
+
+def only_written_here(scope, since, current):
+    """
+    since 버전 뒤로 current 까지 이 프로세스만 버전을 올렸는지
+    (프로세스 메모리 캐시를 다시 만들지 않고 자기 변경만 반영해도 되는지 판단할 때 사용)
+    """
+    version = current
+    while version != since:
+        if (scope, version) not in _written:
+            return False
+        version = _written[scope, version]
+    return True
+
+
+def modified_at(version):
+    """버전 문자열 → 바뀐 시각 (UTC)"""
+    return datetime.fromtimestamp(int(version.split('-')[0]) / 1e9, tz=timezone.utc)
+
+
+def bump(*scopes):
+    """
+    scope 버전을 올립니다.
+    트랜잭션 안이면 커밋 후에 한 번 더 올립니다. (커밋 전에 다른 프로세스가 옛 데이터를
+    새 버전으로 읽어 가더라도, 커밋 후의 버전과는 달라지도록)
+    """
+    connection = transaction.get_connection()
+    for scope in scopes:
+        _write(scope)
+        if connection.in_atomic_block:
+            connection.data_versions_pending = True
+            transaction.on_commit(lambda scope=scope: _committed(connection, scope))
+
+
+def _committed(connection, scope):
+    connection.data_versions_pending = False
+    _write(scope)
+
+
+def has_uncommitted_changes():
+    """현재 트랜잭션 안에서 아직 커밋되지 않은 데이터 변경이 있는지 (응답 캐시 저장 여부 판단용)"""
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        connection.data_versions_pending = False
+        return False
+    return getattr(connection, 'data_versions_pending', False)
+
+
+# -----------------------------------------------------------
+# 시그널 연결 (각 앱의 signals.py 에서 호출)
+# -----------------------------------------------------------
+def connect(scope, *models):
+    """models 의 저장/삭제와 ManyToMany 변경 시 scope 버전을 올리도록 연결합니다."""
+    def changed(sender, **kwargs):
+        if kwargs.get('action', 'post_').startswith('post_'):
+            bump(scope)
+
+    for model in models:
+        label = model._meta.label_lower
+        post_save.connect(changed, sender=model, weak=False, dispatch_uid=f'data_version_save_{label}')
+        post_delete.connect(changed, sender=model, weak=False, dispatch_uid=f'data_version_delete_{label}')
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                changed, sender=field.remote_field.through, weak=False,
+                dispatch_uid=f'data_version_m2m_{label}_{field.name}',
+            )
+
+
+# -----------------------------------------------------------
+# 조건부 GET
+# -----------------------------------------------------------
+def etag_for(*scopes):
+    def etag_func(request, *args, **kwargs):
+        # 같은 URL 이라도 응답 형식(Accept)이 다르면 다른 ETag 를 사용합니다.
+        parts = [get_version(scope) for scope in scopes] + [request.META.get('HTTP_ACCEPT', '')]
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:32]
+    return etag_func
+
+
+def last_modified_for(*scopes):
+    def last_modified_func(request, *args, **kwargs):
+        return max(modified_at(get_version(scope)) for scope in scopes)
+    return last_modified_func
+
+
+def conditional(*scopes):
+    """
+    뷰 데코레이터: scope 버전으로 ETag/Last-Modified 를 붙이고,
+    If-None-Match / If-Modified-Since 가 맞으면 뷰를 실행하지 않고 304 를 반환합니다.
+    """
+    return condition(etag_func=etag_for(*scopes), last_modified_func=last_modified_for(*scopes))
@@ -1,8 +1,10 @@
 from django.shortcuts import render
-from django.http import JsonResponse
-from django.db.models import Q
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db import DatabaseError
+from django.db.models import Prefetch, Q
 # TODO: 모델 이름을 실제 파일에 맞게 수정하세요.
 from .models import DepartmentAdmission, AdmissionResult
+from . import search, autocomplete, changelog, response_cache, streaming, versioning
 
 def index(request):
     return render(request, 'core/index.html')
@@ -13,44 +15,153 @@ def highschool_search(request):
 def edurank_search(request):
    return render(request, 'core/edurank_search.html')
 
+@versioning.conditional(versioning.CORE)
+@response_cache.cache_response(versioning.CORE)
 def department_search_api(request):
+    """
+    학과 검색 API
+    GET /api/search/?university=경희대&department=정치외교&q=기준학과명
+    - FTS5 trigram 인덱스(core/search.py)로 찾고 관련도 순으로 반환합니다.
+    - 인덱스를 쓸 수 없는 경우(예: 모든 검색어가 3글자 미만)에는 icontains 로 찾습니다.
+    - ?stream=1 : 결과를 한 학과씩 스트리밍합니다. (core/streaming.py, 대량 조회용)
+    - 데이터 버전 ETag 를 붙이고, If-None-Match 가 같으면 304 를 반환합니다. (core/versioning.py)
+    - 같은 검색어 조합은 응답 캐시에서 돌려줍니다. (core/response_cache.py)
+    - [신규] SQLite 에서는 검색 + 입결 + JSON 직렬화를 SQL 한 문장으로 처리하고 결과 bytes 를 그대로 보냅니다.
+    """
     univ_query = request.GET.get('university', '').strip()
     dept_query = request.GET.get('department', '').strip()
+    free_query = request.GET.get('q', '').strip()
 
-    # DB 필터링 로직
+    if not streaming.is_streaming(request) and search.read_connection().vendor == 'sqlite':
+        return HttpResponse(_search_json(univ_query, dept_query, free_query), content_type='application/json')
+
+    ids = search.search_ids(univ_query, dept_query, free_query)
+    queryset = DepartmentAdmission.objects.prefetch_related(
+        Prefetch('results', queryset=AdmissionResult.objects.order_by('-year'))
+    )
+    if ids is None:
+        queryset = queryset.filter(_search_filters(univ_query, dept_query, free_query))
+
+    items = (_department_item(dept) for dept in _iter_departments(ids, queryset))
+    if streaming.is_streaming(request):
+        return streaming.json_stream_response(items)
+    return JsonResponse(list(items), safe=False)
+
+
+def _search_filters(univ_query, dept_query, free_query):
+    # DB 필터링 로직 (FTS 인덱스를 쓸 수 없을 때)
     filters = Q()
     if univ_query:
         filters &= Q(university__icontains=univ_query)
     if dept_query:
         filters &= Q(department__icontains=dept_query)
+    if free_query:
+        filters &= (
+            Q(university__icontains=free_query) | Q(division__icontains=free_query)
+            | Q(department__icontains=free_query)
+        )
+    return filters
+
+
+def _search_json(univ_query, dept_query, free_query):
+    """검색 결과 JSON bytes (core/search.py departments_json, SQL 1번)"""
+    hits = search.match_sql(univ_query, dept_query, free_query)
+    if hits is not None:
+        try:
+            return search.departments_json(*hits)
+        except DatabaseError:
+            pass  # FTS 테이블이 없는 DB
+    sql, params = (
+        DepartmentAdmission.objects.filter(_search_filters(univ_query, dept_query, free_query))
+        .order_by('id').values('id').query.sql_with_params()
+    )
+    return search.departments_json(f'SELECT id, id FROM ({sql})', params)
+
+
+def _iter_departments(ids, queryset):
+    """
+    검색 결과 학과를 CHUNK_SIZE 개씩 (입결 포함) 읽어 한 개씩 돌려줍니다.
+    ids 가 있으면 그 순서(관련도 순)를 유지합니다.
+    """
+    if ids is None:
+        yield from queryset.iterator(chunk_size=streaming.CHUNK_SIZE)
+        return
+    for batch in streaming.iter_batches(ids):
+        found = queryset.in_bulk(batch)
+        yield from (found[pk] for pk in batch if pk in found)
+
+
+def _department_item(dept):
+    # 클라이언트에 전달할 JSON 형식으로 변환
+    return {
+        'id': dept.id,
+        'university': dept.university,
+        'division': dept.division,
+        'department': dept.department,
+        'recruitment_group': dept.recruitment_group,
+        'standards': dept.standards_json, # JSONField는 자동으로 Python 객체로 로드됨
+        'scoring': dept.scoring_json,
+        'results': [
+            {
+                'year': r.year,
+                'quota': r.quota,
+                'korean_grade': r.korean_grade, 
+                'korean_percentile': r.korean_percentile,
+                'math_grade': r.math_grade,
+                'math_percentile': r.math_percentile,
+                'english_grade': r.english_grade,
+                'inquiry_grade': r.inquiry_grade,
+                'inquiry_percentile': r.inquiry_percentile,
+            } for r in dept.results.all()  # Prefetch 에서 학년도 내림차순으로 정렬됨
+        ]
+    }
+
+def autocomplete_api(request):
+    """
+    초성/음절 자동완성 API (메모리 trie, DB 조회 없음)
+    GET /api/autocomplete/?q=ㄱㅎㄷ&types=university,department&limit=10
+    - types: university, department, highschool, standard (생략하면 전체)
+    """
+    query = request.GET.get('q', '').strip()
+    types = {t.strip() for t in request.GET.get('types', '').split(',') if t.strip()}
+    try:
+        limit = min(int(request.GET.get('limit', autocomplete.DEFAULT_LIMIT)), autocomplete.MAX_LIMIT)
+    except ValueError:
+        limit = autocomplete.DEFAULT_LIMIT
+
+    results = autocomplete.get_index().search(query, kinds=types or None, limit=limit)
+    return JsonResponse(results, safe=False)
+
+
+@versioning.conditional(versioning.UNIVERSITIES, versioning.HIGHSCHOOLS)
+def changes_api(request):
+    """
+    [신규] 델타 동기화 API (core/changelog.py)
+    GET /api/changes/?since=<마지막으로 받은 version>&limit=1000
+    - since 이후 변경만 반환합니다: {"version", "snapshot": false, "more", "changes": [...]}
+      changes 항목: {"model", "pk", "action": "upsert", "fields"} 또는 {"model", "pk", "action": "delete"}
+      more 가 true 면 받은 version 으로 다시 요청합니다.
+    - since 가 없거나 기록이 정리된(compact) 구간이면 전체 스냅샷을 스트리밍합니다:
+      {"version", "snapshot": true, "objects": [픽스처 형식 객체, ...]}
+    """
+    try:
+        since = int(request.GET['since']) if request.GET.get('since', '').strip() else None
+        limit = min(int(request.GET.get('limit', changelog.DEFAULT_LIMIT)), changelog.MAX_LIMIT)
+    except ValueError:
+        return JsonResponse({'error': "since 와 limit 은 정수여야 합니다."}, status=400)
+    if since is None or since < changelog.floor():
+        return _snapshot_response()
+
+    version, more, changes = changelog.changes_since(since, max(limit, 1))
+    return JsonResponse({'version': version, 'snapshot': False, 'more': more, 'changes': changes})
+
+
+def _snapshot_response():
+    # 버전을 먼저 읽으므로, 스냅샷을 읽는 동안 바뀐 것은 다음 델타 요청에 다시 포함됩니다.
+    version = changelog.latest_version()
 
-    departments = DepartmentAdmission.objects.filter(filters).prefetch_related('results')
-    
-    data = []
-    for dept in departments:
-        # 클라이언트에 전달할 JSON 형식으로 변환
-        item = {
-            'id': dept.id,
-            'university': dept.university,
-            'division': dept.division,
-            'department': dept.department,
-            'recruitment_group': dept.recruitment_group,
-            'standards': dept.standards_json, # JSONField는 자동으로 Python 객체로 로드됨
-            'scoring': dept.scoring_json,
-            'results': [
-                {
-                    'year': r.year,
-                    'quota': r.quota,
-                    'korean_grade': r.korean_grade, 
-                    'korean_percentile': r.korean_percentile,
-                    'math_grade': r.math_grade,
-                    'math_percentile': r.math_percentile,
-                    'english_grade': r.english_grade,
-                    'inquiry_grade': r.inquiry_grade,
-                    'inquiry_percentile': r.inquiry_percentile,
-                } for r in dept.results.all().order_by('-year')
-            ]
-        }
-        data.append(item)
-
-    return JsonResponse(data, safe=False)
\ No newline at end of file
+    def body():
+        yield f'{{"version": {version}, "snapshot": true, "objects": '.encode()
+        yield from streaming.iter_json_array(changelog.iter_snapshot())
+        yield b'}'
+    return StreamingHttpResponse(body(), content_type='application/json')
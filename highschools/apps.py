@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class HighschoolsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'highschools'
+
+    def ready(self):
+        # 데이터 버전(ETag) 갱신용 시그널 연결
+        from . import signals  # noqa: F401
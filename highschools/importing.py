@@ -0,0 +1,449 @@
+"""
+특성화고 기준학과 엑셀 일괄 가져오기
+
+전국 시도교육청 엑셀(data/*.xlsx)의 모든 파일/시트를 읽어 특성화고, 학과, 기준학과와 그 연결을 저장합니다.
+1. 파싱: 파일마다 시트를 워커 수만큼 묶어 프로세스 풀에서 나눠 읽고, 행을 (지역, 학교명, 학과명, 기준학과명들) 로 정리합니다.
+   (통합 문서를 여는 비용이 크므로 작업 하나는 파일을 한 번만 열고 맡은 시트들을 읽습니다.)
+2. 비교: 시트와 (학교명, 학과명) 행마다 내용 해시를 만들어 지난 가져오기 기록(ImportedSheet)과 비교합니다.
+   해시가 같은 시트는 건너뛰고, 바뀐 시트에서는 추가·수정·삭제할 행만 골라 변경 보고서를 만듭니다.
+   prune=True 이면 지난번에 가져온 시트가 이번 엑셀에 없을 때 그 시트의 행을 모두 삭제할 행으로 봅니다.
+   (전체 엑셀을 가져올 때만 사용, 일부 파일만 가져오면 다른 시트는 건드리지 않음)
+3. 적용: 바뀐 행만 한 트랜잭션 안에서 bulk_create / bulk_update / through 테이블 일괄 INSERT 로 씁니다.
+   (계산은 모두 트랜잭션 밖에서 끝내므로 SQLite 쓰기 잠금 시간이 짧습니다.)
+
+bulk 작업은 시그널을 보내지 않으므로 저장 후 데이터 버전과 자동완성 색인을 직접 갱신합니다.
+"""
+import hashlib
+import json
+import math
+import os
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+HEADER_ROW = 4
+SCHOOL_COLUMN = '학교명'
+DEPARTMENT_COLUMN = '학과명'
+REGION_COLUMN = '시 · 도 구분'
+STANDARD_COLUMN_KEYWORD = '기준학과'
+SKIP_SHEET_KEYWORD = '개요'
+SKIP_SCHOOL_KEYWORDS = ('특성화고등학교', '설립별')
+
+
+def clean_region_name(raw_text):
+    """지역명 전처리"""
+    if pd.isna(raw_text) or raw_text == '':
+        return None
+    # 유니코드 정규화 (NFC)
+    text = unicodedata.normalize('NFC', str(raw_text))
+    text = text.replace('\n', '').replace(' ', '').strip()
+    if not text.endswith('교육청'):
+        text += '교육청'
+    return text
+
+
+def clean_standard_name(name):
+    """
+    [최종 수정] 기준학과명 강력 전처리
+    1. 유니코드 정규화 (NFC)
+    2. 모든 공백 제거 (특수 공백 포함)
+    3. 모든 종류의 점(·) 통일
+    """
+    if not name:
+        return None
+
+    # 1. 문자열 변환 및 유니코드 정규화 (자모 분리 현상 해결)
+    name = str(name)
+    name = unicodedata.normalize('NFC', name)
+
+    # 2. 모든 종류의 공백 제거 (일반 공백 + 특수 공백 \xa0 등)
+    name = "".join(name.split())
+
+    # 3. 쓰레기 데이터 필터링
+    if name in ['-', 'ￚ', '–', '.', '', 'nan']:
+        return None
+
+    # 4. 모든 종류의 점을 표준 가운데 점(·)으로 치환
+    # U+00B7(·), U+318D(ㆍ), U+FF65(･), U+2022(•), U+22C5(⋅)
+    name = name.replace('･', '·').replace('•', '·').replace('ㆍ', '·').replace('.', '·').replace('⋅', '·')
+
+    # 5. 매핑 테이블 (오타 및 관용적 표현 통일)
+    mapping = {
+        '경영사무과': '경영·사무과',
+        '재무회계과': '재무·회계과',
+        '방송통신과': '방송·통신과',
+        '조리식음료과': '조리·식음료과',
+        '관광레저과': '관광·레저과',
+        '인쇄출판과': '인쇄·출판과',
+        '건축촌목과': '건축·토목과',
+        '조리･식음료과': '조리·식음료과', # 특수 점 케이스 명시
+        '경영･사무과': '경영·사무과',
+    }
+
+    if name in mapping:
+        name = mapping[name]
+
+    return name
+
+
+def split_standard_names(raw_val):
+    """기준학과 칸 하나 → 정제된 기준학과명 목록 (줄바꿈/쉼표로 여러 개가 들어 있을 수 있음)"""
+    if pd.isna(raw_val):
+        return []
+    val_str = unicodedata.normalize('NFC', str(raw_val)).strip()
+    if val_str == '':
+        return []
+    names = (clean_standard_name(name) for name in val_str.replace('\n', ',').split(','))
+    return [name for name in names if name]
+
+
+# -----------------------------------------------------------
+# 1. 파싱 (워커 프로세스, Django 사용 안 함)
+# -----------------------------------------------------------
+def parse_sheet(df, sheet_name):
+    """
+    시트 DataFrame → [(지역, 학교명, 학과명, (기준학과명, ...)), ...]
+    학교명/지역은 병합 셀이므로 아래로 채우고, 기준학과는 '기준학과' 열과 그 오른쪽 열 두 칸을 읽습니다.
+    """
+    df.columns = [str(c).strip() for c in df.columns]
+    if SCHOOL_COLUMN not in df.columns or DEPARTMENT_COLUMN not in df.columns:
+        return []
+
+    schools = df[SCHOOL_COLUMN].ffill()
+    regions = df[REGION_COLUMN].ffill() if REGION_COLUMN in df.columns else pd.Series(None, index=df.index)
+    sheet_region = clean_region_name(sheet_name)
+
+    std_columns = []
+    for idx, col_name in enumerate(df.columns):
+        if STANDARD_COLUMN_KEYWORD in col_name:
+            std_columns = [df.iloc[:, i] for i in (idx, idx + 1) if i < len(df.columns)]
+            break
+    empty = pd.Series(None, index=df.index)
+    std_first, std_second = (std_columns + [empty, empty])[:2]
+
+    rows = []
+    for school_name, dept_name, raw_region, val1, val2 in zip(
+        schools, df[DEPARTMENT_COLUMN], regions, std_first, std_second
+    ):
+        if pd.isna(school_name) or pd.isna(dept_name):
+            continue
+        if any(keyword in str(school_name) for keyword in SKIP_SCHOOL_KEYWORDS):
+            continue
+        region = clean_region_name(raw_region) or sheet_region
+        standards = tuple(split_standard_names(val1) + split_standard_names(val2))
+        rows.append((region, str(school_name), str(dept_name), standards))
+    return rows
+
+
+def list_sheets(path):
+    with pd.ExcelFile(path) as workbook:
+        return [name for name in workbook.sheet_names if SKIP_SHEET_KEYWORD not in name]
+
+
+def read_sheets(path, sheet_names, header=HEADER_ROW):
+    """파일을 한 번 열어 sheet_names 시트들을 파싱합니다. [(파일명, 시트명, 행 목록), ...]"""
+    frames = pd.read_excel(path, sheet_name=list(sheet_names), header=header)
+    return [(os.path.basename(path), name, parse_sheet(frames[name], name)) for name in sheet_names]
+
+
+def _read_sheets_task(task):
+    return read_sheets(*task)
+
+
+def parse_workbooks(paths, workers=None, header=HEADER_ROW):
+    """
+    모든 파일의 모든 시트를 파싱합니다. 결과 [(파일명, 시트명, 행 목록), ...] 는 (파일, 시트) 순서를 유지합니다.
+    workers == 1 이면 프로세스 풀 없이 현재 프로세스에서 읽습니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    groups_per_file = max(1, math.ceil(workers / max(len(paths), 1)))
+    tasks = []
+    for path in paths:
+        sheet_names = list_sheets(path)
+        size = max(1, math.ceil(len(sheet_names) / groups_per_file))
+        tasks.extend((path, sheet_names[i:i + size], header) for i in range(0, len(sheet_names), size))
+
+    workers = min(workers, len(tasks)) or 1
+    if workers == 1:
+        results = map(_read_sheets_task, tasks)
+        return [sheet for group in results for sheet in group]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [sheet for group in pool.map(_read_sheets_task, tasks) for sheet in group]
+
+
+# -----------------------------------------------------------
+# 2. 내용 해시 비교 → 변경 계획 (DB 는 읽기만)
+# -----------------------------------------------------------
+def row_key(school_name, dept_name):
+    return f'{school_name}\t{dept_name}'
+
+
+def split_row_key(key):
+    return tuple(key.split('\t', 1))
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass
+class SheetRows:
+    """한 시트의 (학교명, 학과명) 별 내용과 해시. 같은 학과가 여러 행이면 기준학과를 합칩니다."""
+    source: str
+    name: str
+    rows: dict = field(default_factory=dict)  # 행 키 → (지역, (기준학과명, ...))
+    hashes: dict = field(default_factory=dict)  # 행 키 → 해시
+
+    @classmethod
+    def from_parsed(cls, source, name, parsed_rows):
+        sheet = cls(source, name)
+        for region, school_name, dept_name, standards in parsed_rows:
+            key = row_key(school_name, dept_name)
+            first_region, merged = sheet.rows.get(key, (region, ()))
+            for std in standards:
+                if std not in merged:
+                    merged += (std,)
+            sheet.rows[key] = (first_region, merged)
+        sheet.hashes = {key: _digest([region, sorted(stds)]) for key, (region, stds) in sheet.rows.items()}
+        return sheet
+
+    @property
+    def content_hash(self):
+        return _digest(self.hashes)
+
+
+@dataclass
+class SheetDiff:
+    name: str
+    source: str
+    status: str  # 'new' | 'changed' | 'unchanged' | 'removed'
+    inserted: list = field(default_factory=list)  # 행 키
+    updated: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+
+
+@dataclass
+class ImportPlan:
+    sheets: list  # [SheetRows]
+    diffs: list  # [SheetDiff] (sheets 와 같은 순서)
+    before: dict = field(default_factory=dict)  # 수정/삭제 행 키 → (지역, [기준학과명]) 현재 DB 값
+
+    @property
+    def changed(self):
+        return [(sheet, diff) for sheet, diff in zip(self.sheets, self.diffs) if diff.status != 'unchanged']
+
+    def counts(self):
+        return {
+            'sheets_changed': len(self.changed),
+            'sheets_unchanged': len(self.diffs) - len(self.changed),
+            'sheets_removed': sum(d.status == 'removed' for d in self.diffs),
+            'inserted': sum(len(d.inserted) for d in self.diffs),
+            'updated': sum(len(d.updated) for d in self.diffs),
+            'removed': sum(len(d.removed) for d in self.diffs),
+        }
+
+    def report(self):
+        """변경 보고서 (JSON 으로 저장할 수 있는 dict)"""
+        sheets = []
+        for sheet, diff in zip(self.sheets, self.diffs):
+            def describe(key, rows):
+                region, standards = rows[key]
+                school_name, dept_name = split_row_key(key)
+                return {'school': school_name, 'department': dept_name, 'region': region, 'standards': list(standards)}
+
+            sheets.append({
+                'sheet': diff.name,
+                'source': diff.source,
+                'status': diff.status,
+                'inserted': [describe(key, sheet.rows) for key in diff.inserted],
+                'updated': [
+                    {'before': describe(key, self.before), 'after': describe(key, sheet.rows)}
+                    for key in diff.updated if key in self.before
+                ] + [describe(key, sheet.rows) for key in diff.updated if key not in self.before],
+                'removed': [describe(key, self.before) for key in diff.removed if key in self.before],
+            })
+        return {'summary': self.counts(), 'sheets': sheets}
+
+
+def _current_rows(keys):
+    """행 키 → (지역, [기준학과명]) 현재 DB 값 (보고서의 수정 전/삭제 내용)"""
+    from .models import HighSchoolDepartment
+
+    wanted = {split_row_key(key) for key in keys}
+    if not wanted:
+        return {}
+    school_names = {school_name for school_name, _ in wanted}
+    current = {}
+    departments = HighSchoolDepartment.objects.filter(school__name__in=school_names).select_related('school')
+    for dept in departments.prefetch_related('standard_departments'):
+        if (dept.school.name, dept.name) in wanted:
+            current[row_key(dept.school.name, dept.name)] = (
+                dept.school.region, sorted(std.name for std in dept.standard_departments.all())
+            )
+    return current
+
+
+def plan_import(parsed_sheets, full=False, prune=False):
+    """
+    파싱 결과를 저장된 시트/행 해시와 비교해 추가·수정·삭제할 행을 정합니다.
+    - 시트 해시가 같으면 행 비교도 하지 않습니다. (full=True 면 저장된 해시를 무시하고 모든 행을 다시 씁니다)
+    - 삭제: 이전 가져오기에서 이 시트에 있던 행이 이번에는 어느 시트에도 없을 때
+    - prune=True: 엑셀에서 빠진 시트의 행을 (다른 시트로 옮겨 가지 않았으면) 모두 삭제하고 기록도 지웁니다.
+      parsed_sheets 가 전체 엑셀일 때만 켜야 합니다. (기본값은 이번에 읽은 시트만 비교)
+    같은 이름의 시트가 여러 파일에 있으면 뒤에 오는 파일의 시트를 사용합니다.
+    """
+    from .models import ImportedSheet
+
+    by_name = {}
+    for source, name, rows in parsed_sheets:
+        by_name[name] = SheetRows.from_parsed(source, name, rows)
+    sheets = list(by_name.values())
+    records = ImportedSheet.objects.all() if prune else ImportedSheet.objects.filter(name__in=by_name)
+    stored = {record.name: record for record in records}
+    all_keys = {key for sheet in sheets for key in sheet.rows}
+
+    diffs = []
+    for sheet in sheets:
+        record = stored.get(sheet.name)
+        old_hashes = {} if record is None else record.row_hashes
+        if record is None:
+            status = 'new'
+        elif not full and record.content_hash == sheet.content_hash:
+            diffs.append(SheetDiff(sheet.name, sheet.source, 'unchanged'))
+            continue
+        else:
+            status = 'changed'
+
+        diff = SheetDiff(sheet.name, sheet.source, status)
+        for key, digest in sheet.hashes.items():
+            if key not in old_hashes:
+                diff.inserted.append(key)
+            elif full or old_hashes[key] != digest:
+                diff.updated.append(key)
+        diff.removed = [key for key in old_hashes if key not in all_keys]
+        diffs.append(diff)
+
+    for name, record in stored.items():
+        if name not in by_name:
+            sheets.append(SheetRows(record.source, name))
+            diffs.append(SheetDiff(
+                name, record.source, 'removed', removed=[key for key in record.row_hashes if key not in all_keys],
+            ))
+
+    plan = ImportPlan(sheets, diffs)
+    plan.before = _current_rows(key for diff in diffs for key in diff.updated + diff.removed)
+    return plan
+
+
+# -----------------------------------------------------------
+# 3. 적용 (한 트랜잭션, 바뀐 행만 bulk)
+# -----------------------------------------------------------
+def apply_plan(plan, batch_size=500):
+    """
+    변경 계획을 한 트랜잭션으로 적용합니다. 바뀐 것이 없으면 쓰기 트랜잭션을 열지 않습니다.
+    - 추가/수정 행: 학교(지역 포함)·학과·기준학과를 맞추고 학과의 기준학과 연결을 엑셀 내용으로 바꿉니다.
+    - 삭제 행: 학과를 지우고, 학과가 하나도 남지 않은 학교도 지웁니다. (기준학과는 대학 쪽에서도 쓰므로 남김)
+    """
+    from django.db import transaction
+    from core import autocomplete, changelog, versioning
+    from .models import HighSchool, HighSchoolDepartment, StandardDepartment, ImportedSheet
+
+    changed = plan.changed
+    if not changed:
+        return plan.counts()
+
+    upserts = {}  # 행 키 → (지역, 기준학과명들)
+    removals = set()
+    for sheet, diff in changed:
+        for key in diff.inserted + diff.updated:
+            upserts[key] = sheet.rows[key]
+        removals.update(diff.removed)
+    Link = HighSchoolDepartment.standard_departments.through
+
+    with transaction.atomic():
+        # 학교: 없으면 만들고, 지역이 바뀌었으면 고칩니다. (학교 지역은 그 학교의 첫 행 기준)
+        school_regions = {}
+        for key, (region, _) in upserts.items():
+            school_regions.setdefault(split_row_key(key)[0], region)
+        schools = HighSchool.objects.in_bulk(list(school_regions), field_name='name')
+        moved = []
+        for name, region in school_regions.items():
+            school = schools.get(name)
+            if school is not None and school.region != region:
+                school.region = region
+                moved.append(school)
+        HighSchool.objects.bulk_update(moved, ['region'], batch_size=batch_size)
+        new_schools = [HighSchool(name=name, region=region) for name, region in school_regions.items()
+                       if name not in schools]
+        HighSchool.objects.bulk_create(new_schools, batch_size=batch_size)
+        schools.update((school.name, school) for school in new_schools)
+
+        # 기준학과
+        std_names = {std for _, standards in upserts.values() for std in standards}
+        std_ids = dict(StandardDepartment.objects.filter(name__in=std_names).values_list('name', 'id'))
+        new_standards = [StandardDepartment(name=name) for name in std_names if name not in std_ids]
+        StandardDepartment.objects.bulk_create(new_standards, batch_size=batch_size)
+        std_ids.update((std.name, std.id) for std in new_standards)
+
+        # 학과
+        school_ids = [school.id for school in schools.values()]
+        dept_ids = {
+            (school_id, name): pk
+            for pk, school_id, name in HighSchoolDepartment.objects.filter(school_id__in=school_ids)
+            .values_list('id', 'school_id', 'name')
+        }
+        new_departments = []
+        for key in upserts:
+            school_name, dept_name = split_row_key(key)
+            if (schools[school_name].id, dept_name) not in dept_ids:
+                new_departments.append(HighSchoolDepartment(school=schools[school_name], name=dept_name))
+        HighSchoolDepartment.objects.bulk_create(new_departments, batch_size=batch_size)
+        dept_ids.update(((dept.school_id, dept.name), dept.id) for dept in new_departments)
+
+        # 기준학과 연결: 추가/수정된 학과의 연결을 엑셀 내용으로 교체
+        link_rows = {}
+        for key, (_, standards) in upserts.items():
+            school_name, dept_name = split_row_key(key)
+            link_rows[dept_ids[(schools[school_name].id, dept_name)]] = standards
+        Link.objects.filter(highschooldepartment_id__in=link_rows).delete()
+        Link.objects.bulk_create([
+            Link(highschooldepartment_id=dept_id, standarddepartment_id=std_ids[std])
+            for dept_id, standards in link_rows.items() for std in standards
+        ], batch_size=batch_size)
+
+        # 삭제
+        if removals:
+            removed_pairs = [split_row_key(key) for key in removals]
+            removed_schools = {school_name for school_name, _ in removed_pairs}
+            targets = HighSchoolDepartment.objects.filter(school__name__in=removed_schools).values_list(
+                'id', 'school__name', 'name'
+            )
+            removed_pairs = set(removed_pairs)
+            HighSchoolDepartment.objects.filter(
+                pk__in=[pk for pk, school_name, name in targets if (school_name, name) in removed_pairs]
+            ).delete()
+            HighSchool.objects.filter(name__in=removed_schools, departments__isnull=True).delete()
+
+        # 해시 기록 (엑셀에서 빠진 시트는 기록도 삭제)
+        ImportedSheet.objects.filter(name__in=[diff.name for diff in plan.diffs if diff.status == 'removed']).delete()
+        for sheet, diff in changed:
+            if diff.status == 'removed':
+                continue
+            ImportedSheet.objects.update_or_create(
+                name=sheet.name,
+                defaults={'source': sheet.source, 'content_hash': sheet.content_hash, 'row_hashes': sheet.hashes},
+            )
+
+        # 델타 동기화 기록 (bulk 저장은 시그널이 없으므로 직접, 삭제는 delete() 시그널로 기록됨)
+        new_dept_ids = {dept.id for dept in new_departments}
+        changelog.record_many(HighSchool, [school.id for school in new_schools], changelog.CREATE)
+        changelog.record_many(HighSchool, [school.id for school in moved])
+        changelog.record_many(StandardDepartment, [std.id for std in new_standards], changelog.CREATE)
+        changelog.record_many(HighSchoolDepartment, new_dept_ids, changelog.CREATE)
+        changelog.record_many(HighSchoolDepartment, [pk for pk in link_rows if pk not in new_dept_ids])
+
+        versioning.bump(versioning.HIGHSCHOOLS)
+        transaction.on_commit(autocomplete.invalidate)
+    return plan.counts()
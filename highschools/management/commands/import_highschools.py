@@ -0,0 +1,83 @@
+import glob
+import json
+import time
+from django.core.management.base import BaseCommand, CommandError
+from highschools.importing import HEADER_ROW, apply_plan, parse_workbooks, plan_import
+
+STATUS_LABELS = {'new': '🆕 새 시트', 'changed': '✏️ 변경', 'unchanged': '⏭️ 변경 없음', 'removed': '🗑️ 빠진 시트'}
+
+
+class Command(BaseCommand):
+    help = "특성화고 기준학과 엑셀(여러 파일/시트)을 병렬로 읽어, 지난 가져오기와 달라진 행만 한 트랜잭션에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help="엑셀 파일 경로 (생략하면 data/*.xlsx 전체)")
+        parser.add_argument('--workers', type=int, default=None, help="파싱 프로세스 수 (기본: CPU 수)")
+        parser.add_argument('--header', type=int, default=HEADER_ROW, help=f"컬럼명이 있는 행 번호 (0부터, 기본 {HEADER_ROW})")
+        parser.add_argument('--dry-run', action='store_true', help="DB 에 쓰지 않고 변경 보고서만 출력")
+        parser.add_argument('--full', action='store_true', help="저장된 해시를 무시하고 모든 행을 다시 반영")
+        parser.add_argument('--report', help="변경 보고서를 JSON 파일로 저장할 경로")
+        parser.add_argument(
+            '--prune', action='store_true',
+            help="이번에 읽은 엑셀에 없는 시트(지난 가져오기 기록)의 행을 삭제 (경로를 생략하면 항상 적용)",
+        )
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or sorted(glob.glob('data/*.xlsx'))
+        # 경로를 직접 주면 일부 파일만 가져오는 것일 수 있으므로, 빠진 시트 삭제는 --prune 일 때만 합니다.
+        prune = options['prune'] or not options['paths']
+        if not paths:
+            raise CommandError("❌ data 폴더에 .xlsx 파일이 없습니다.")
+
+        started = time.perf_counter()
+        self.stdout.write(f"📂 {len(paths)}개 파일을 읽는 중...")
+        try:
+            parsed = parse_workbooks(paths, workers=options['workers'], header=options['header'])
+        except Exception as e:
+            raise CommandError(f"❌ 엑셀 읽기 실패: {e}")
+        plan = plan_import(parsed, full=options['full'], prune=prune)
+        planned = time.perf_counter()
+
+        if options['dry_run']:
+            counts = plan.counts()
+        else:
+            counts = apply_plan(plan)
+        finished = time.perf_counter()
+
+        report = plan.report()
+        self.stdout.write("=" * 60)
+        for sheet in report['sheets']:
+            self.stdout.write(
+                f"{STATUS_LABELS[sheet['status']]} {sheet['sheet']}: "
+                f"+{len(sheet['inserted'])} ~{len(sheet['updated'])} -{len(sheet['removed'])}"
+            )
+            if options['verbosity'] >= 2:
+                self.write_rows(sheet)
+        self.stdout.write("=" * 60)
+        title = "🔍 변경 사항 확인 (dry-run, 저장하지 않음)" if options['dry_run'] else "🎉 가져오기 완료!"
+        self.stdout.write(self.style.SUCCESS(title))
+        self.stdout.write(
+            f"📊 시트 변경 {counts['sheets_changed']}개(빠진 시트 {counts['sheets_removed']}개) / "
+            f"변경 없음 {counts['sheets_unchanged']}개, "
+            f"행 추가 {counts['inserted']} · 수정 {counts['updated']} · 삭제 {counts['removed']}"
+        )
+        self.stdout.write(f"⏱️ 파싱/비교 {planned - started:.2f}초, 저장 {finished - planned:.2f}초")
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"📝 변경 보고서 저장: {options['report']}")
+
+    def write_rows(self, sheet):
+        def label(row):
+            return f"{row['school']} / {row['department']} [{', '.join(row['standards'])}]"
+
+        for row in sheet['inserted']:
+            self.stdout.write(f"    + {label(row)}")
+        for row in sheet['updated']:
+            if 'before' in row:
+                self.stdout.write(f"    ~ {label(row['before'])} → [{', '.join(row['after']['standards'])}]")
+            else:
+                self.stdout.write(f"    ~ {label(row)}")
+        for row in sheet['removed']:
+            self.stdout.write(f"    - {label(row)}")
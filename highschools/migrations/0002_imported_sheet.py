@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('highschools', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportedSheet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='시트명')),
+                ('source', models.CharField(blank=True, max_length=255, verbose_name='파일명')),
+                ('content_hash', models.CharField(max_length=64, verbose_name='시트 해시')),
+                ('row_hashes', models.JSONField(default=dict, verbose_name='행별 해시')),
+                ('imported_at', models.DateTimeField(auto_now=True, verbose_name='가져온 시각')),
+            ],
+        ),
+    ]
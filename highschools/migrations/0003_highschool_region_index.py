@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('highschools', '0002_imported_sheet'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='highschool',
+            index=models.Index(fields=['region', 'name'], name='highschool_region_name_idx'),
+        ),
+    ]
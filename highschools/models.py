@@ -19,6 +19,10 @@ class HighSchool(models.Model):
     region = models.CharField(max_length=50, verbose_name="시도교육청")  # 예: 서울특별시교육청
     name = models.CharField(max_length=100, unique=True, verbose_name="학교명")
 
+    class Meta:
+        # [신규] 지역 필터(정확히 일치 또는 접두어 범위)와 지역 내 학교명 정렬을 인덱스로 처리합니다.
+        indexes = [models.Index(fields=['region', 'name'], name='highschool_region_name_idx')]
+
     def __str__(self):
         return self.name
 
@@ -42,4 +46,19 @@ class HighSchoolDepartment(models.Model):
         unique_together = ('school', 'name')
 
     def __str__(self):
-        return f"{self.school.name} - {self.name}"
\ No newline at end of file
+        return f"{self.school.name} - {self.name}"
+
+class ImportedSheet(models.Model):
+    """
+    [신규] 기준학과 엑셀 시트별 가져오기 기록 (highschools/importing.py)
+    - 시트 전체와 (학교명, 학과명) 행마다 내용 해시를 저장해 두고,
+      다시 가져올 때 바뀐 시트/행만 추가·수정·삭제합니다.
+    """
+    name = models.CharField(max_length=100, unique=True, verbose_name="시트명")
+    source = models.CharField(max_length=255, blank=True, verbose_name="파일명")
+    content_hash = models.CharField(max_length=64, verbose_name="시트 해시")
+    row_hashes = models.JSONField(default=dict, verbose_name="행별 해시")  # "학교명\t학과명" → 해시
+    imported_at = models.DateTimeField(auto_now=True, verbose_name="가져온 시각")
+
+    def __str__(self):
+        return self.name
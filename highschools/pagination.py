@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class HighSchoolRowCursorPagination(CursorPagination):
+    """
+    특성화고 학과 행(rows) 커서 페이지네이션
+    예: /api/highschools/rows/?region=서울교육청&page_size=100  →  응답의 next 링크로 다음 페이지 조회
+    - 학교명, 학과명 순서 (school_name 은 뷰에서 붙이는 annotate 값)
+    """
+    ordering = ('school_name', 'name', 'id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 500
@@ -15,4 +15,15 @@ class HighSchoolSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = HighSchool
-        fields = ['id', 'region', 'name', 'departments']
\ No newline at end of file
+        fields = ['id', 'region', 'name', 'departments']
+
+class HighSchoolRowSerializer(serializers.ModelSerializer):
+    """[신규] 학교-학과 한 행 (highschool_search.html 표의 한 줄)"""
+    region = serializers.CharField(source='school.region')
+    school_id = serializers.IntegerField()
+    school = serializers.CharField(source='school_name')
+    standard_departments = serializers.StringRelatedField(many=True)
+
+    class Meta:
+        model = HighSchoolDepartment
+        fields = ['id', 'region', 'school_id', 'school', 'name', 'standard_departments']
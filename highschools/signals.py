@@ -0,0 +1,14 @@
+from core import changelog, versioning
+from .models import HighSchool, HighSchoolDepartment, StandardDepartment
+
+
+# -----------------------------------------------------------
+# 데이터 버전 (ETag) 올리기
+# -----------------------------------------------------------
+versioning.connect(versioning.HIGHSCHOOLS, HighSchool, HighSchoolDepartment, StandardDepartment)
+
+
+# -----------------------------------------------------------
+# 델타 동기화용 변경 기록 (core/changelog.py)
+# -----------------------------------------------------------
+changelog.connect(HighSchool, HighSchoolDepartment, StandardDepartment)
@@ -1,3 +1,149 @@
+import io
+from unittest import mock
+
+import pandas as pd
+from django.core.management import call_command
 from django.test import TestCase
+from core import response_cache
+from .importing import apply_plan, parse_sheet, plan_import
+from .models import HighSchool, HighSchoolDepartment, ImportedSheet, StandardDepartment
+
+
+class ImportHighSchoolsTests(TestCase):
+    def make_sheet(self):
+        return pd.DataFrame({
+            '시 · 도 구분': ['서울', None, None, None],
+            '학교명': ['선린인터넷고등학교', None, '서울특성화고등학교 계', '미림여자정보과학고등학교'],
+            '학과명': ['소프트웨어과', '정보보호과', '-', '뉴미디어소프트웨어과'],
+            '교육과정의 기준학과명(최대2개)': ['정보 컴퓨터과', '정보컴퓨터과\n경영사무과', None, '-'],
+            'Unnamed: 4': [None, '방송통신과', None, '정보컴퓨터과'],
+        })
+
+    def test_parse_sheet(self):
+        rows = parse_sheet(self.make_sheet(), '서울특별시교육청')
+        self.assertEqual(rows, [
+            ('서울교육청', '선린인터넷고등학교', '소프트웨어과', ('정보컴퓨터과',)),
+            ('서울교육청', '선린인터넷고등학교', '정보보호과', ('정보컴퓨터과', '경영·사무과', '방송·통신과')),
+            ('서울교육청', '미림여자정보과학고등학교', '뉴미디어소프트웨어과', ('정보컴퓨터과',)),
+        ])
+
+    def test_incremental_reimport(self):
+        HighSchool.objects.create(name='선린인터넷고등학교', region='기존교육청')
+        sheet = self.make_sheet()
+        plan = plan_import([('2026.xlsx', '서울특별시교육청', parse_sheet(sheet.copy(), '서울특별시교육청'))])
+        counts = apply_plan(plan)
+        self.assertEqual((counts['inserted'], counts['updated'], counts['removed']), (3, 0, 0))
+        self.assertEqual(HighSchool.objects.get(name='선린인터넷고등학교').region, '서울교육청')
+        dept = HighSchoolDepartment.objects.get(school__name='선린인터넷고등학교', name='정보보호과')
+        self.assertEqual(
+            sorted(dept.standard_departments.values_list('name', flat=True)),
+            ['경영·사무과', '방송·통신과', '정보컴퓨터과'],
+        )
+
+        # 같은 내용이면 시트 해시만 비교하고 쓰지 않습니다.
+        plan = plan_import([('2027.xlsx', '서울특별시교육청', parse_sheet(sheet.copy(), '서울특별시교육청'))])
+        self.assertEqual(plan.diffs[0].status, 'unchanged')
+        with self.assertNumQueries(0):
+            apply_plan(plan)
+
+        # 한 행 수정 + 한 행 삭제 (학과가 모두 없어진 학교도 삭제)
+        sheet.loc[1, '교육과정의 기준학과명(최대2개)'] = '정보컴퓨터과'
+        sheet.loc[1, 'Unnamed: 4'] = None
+        sheet = sheet.drop(index=3)
+        plan = plan_import([('2027.xlsx', '서울특별시교육청', parse_sheet(sheet, '서울특별시교육청'))])
+        counts = apply_plan(plan)
+        self.assertEqual((counts['inserted'], counts['updated'], counts['removed']), (0, 1, 1))
+        self.assertEqual(list(dept.standard_departments.values_list('name', flat=True)), ['정보컴퓨터과'])
+        self.assertFalse(HighSchool.objects.filter(name='미림여자정보과학고등학교').exists())
+        self.assertEqual(StandardDepartment.objects.count(), 3)  # 기준학과는 지우지 않음
+
+        report = plan.report()['sheets'][0]
+        self.assertEqual(report['updated'][0]['before']['standards'], ['경영·사무과', '방송·통신과', '정보컴퓨터과'])
+        self.assertEqual(report['removed'][0]['department'], '뉴미디어소프트웨어과')
+
+    def test_removed_sheet_is_deleted(self):
+        sheet = self.make_sheet()
+        apply_plan(plan_import([
+            ('2026.xlsx', '서울특별시교육청', parse_sheet(sheet.copy(), '서울특별시교육청')),
+            ('2026.xlsx', '부산광역시교육청', [('부산교육청', '부산컴퓨터과학고등학교', '소프트웨어과', ('정보컴퓨터과',))]),
+        ]))
+        seoul_only = [('2027.xlsx', '서울특별시교육청', parse_sheet(sheet.copy(), '서울특별시교육청'))]
+
+        # 기본값(일부 파일만 가져올 때)은 빠진 시트를 그대로 둡니다.
+        plan = plan_import(seoul_only)
+        self.assertEqual([diff.status for diff in plan.diffs], ['unchanged'])
+
+        plan = plan_import(seoul_only, prune=True)
+        self.assertEqual([(diff.name, diff.status) for diff in plan.diffs][1], ('부산광역시교육청', 'removed'))
+        self.assertEqual(plan.report()['sheets'][1]['removed'][0]['school'], '부산컴퓨터과학고등학교')
+        counts = apply_plan(plan)
+        self.assertEqual((counts['sheets_removed'], counts['removed']), (1, 1))
+        self.assertFalse(HighSchool.objects.filter(name='부산컴퓨터과학고등학교').exists())
+        self.assertEqual(list(ImportedSheet.objects.values_list('name', flat=True)), ['서울특별시교육청'])
+        self.assertEqual(plan_import(seoul_only, prune=True).diffs[0].status, 'unchanged')
+
+    def test_command_prunes_only_default_file_set(self):
+        apply_plan(plan_import([
+            ('2026.xlsx', '서울특별시교육청', parse_sheet(self.make_sheet(), '서울특별시교육청')),
+            ('2026.xlsx', '부산광역시교육청', [('부산교육청', '부산컴퓨터과학고등학교', '소프트웨어과', ('정보컴퓨터과',))]),
+        ]))
+        seoul_only = [('seoul.xlsx', '서울특별시교육청', parse_sheet(self.make_sheet(), '서울특별시교육청'))]
+        command = 'highschools.management.commands.import_highschools'
+
+        # 경로를 직접 준 일부 파일 가져오기는 다른 시트의 학교/학과를 남깁니다.
+        with mock.patch(f'{command}.parse_workbooks', return_value=seoul_only):
+            call_command('import_highschools', 'seoul.xlsx', stdout=io.StringIO())
+        self.assertTrue(HighSchoolDepartment.objects.filter(school__name='부산컴퓨터과학고등학교').exists())
+        self.assertEqual(ImportedSheet.objects.count(), 2)
+
+        # data/*.xlsx 전체를 가져오면 빠진 시트를 삭제합니다.
+        with mock.patch(f'{command}.parse_workbooks', return_value=seoul_only), \
+                mock.patch(f'{command}.glob.glob', return_value=['data/seoul.xlsx']):
+            call_command('import_highschools', stdout=io.StringIO())
+        self.assertFalse(HighSchool.objects.filter(name='부산컴퓨터과학고등학교').exists())
+        self.assertEqual(ImportedSheet.objects.count(), 1)
+
+
+class HighSchoolApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        computer = StandardDepartment.objects.create(name='정보컴퓨터과')
+        business = StandardDepartment.objects.create(name='경영·사무과')
+        for region, school, departments in (
+            ('서울특별시교육청', '선린인터넷고등학교', ['소프트웨어과', '정보보호과', 'IT경영과']),
+            ('서울특별시교육청', '미림여자정보과학고등학교', ['뉴미디어소프트웨어과']),
+            ('부산광역시교육청', '부산컴퓨터과학고등학교', ['컴퓨터과']),
+        ):
+            school = HighSchool.objects.create(region=region, name=school)
+            for name in departments:
+                dept = HighSchoolDepartment.objects.create(school=school, name=name)
+                dept.standard_departments.add(business if name == 'IT경영과' else computer)
+
+    def test_list_prefetch_and_region_prefix(self):
+        self.client.get('/api/highschools/', {'region': '서울'})  # 교육청 목록은 데이터 버전별로 한 번만 읽습니다.
+        response_cache.get_cache().clear()
+        with self.assertNumQueries(3):
+            data = self.client.get('/api/highschools/', {'region': '서울'}).json()
+        self.assertEqual({school['name'] for school in data}, {'선린인터넷고등학교', '미림여자정보과학고등학교'})
+        self.assertEqual(len(self.client.get('/api/highschools/', {'region': '부산광역시교육청'}).json()), 1)
+
+        # 그 이름으로 시작하는 교육청이 없으면 이름 중간에서 찾습니다.
+        self.assertEqual(len(self.client.get('/api/highschools/', {'region': '교육청'}).json()), 3)
+        self.assertEqual(len(self.client.get('/api/highschools/', {'region': '광역시'}).json()), 1)
+        self.assertEqual(self.client.get('/api/highschools/', {'region': '제주'}).json(), [])
+
+    def test_rows(self):
+        with self.assertNumQueries(2):
+            page = self.client.get('/api/highschools/rows/', {'region': '서울특별시교육청', 'page_size': 2}).json()
+        self.assertEqual([(row['school'], row['name']) for row in page['results']], [
+            ('미림여자정보과학고등학교', '뉴미디어소프트웨어과'), ('선린인터넷고등학교', 'IT경영과'),
+        ])
+        rest = self.client.get(page['next']).json()
+        self.assertEqual([row['name'] for row in rest['results']], ['소프트웨어과', '정보보호과'])
+        self.assertIsNone(rest['next'])
 
-# Create your tests here.
+        rows = self.client.get('/api/highschools/rows/', {'school': '선린', 'standard': '정보컴퓨터'}).json()['results']
+        self.assertEqual([row['name'] for row in rows], ['소프트웨어과', '정보보호과'])
+        self.assertEqual(rows[0]['standard_departments'], ['정보컴퓨터과'])
+        rows = self.client.get('/api/highschools/rows/', {'department': '컴퓨터'}).json()['results']
+        self.assertEqual([(row['region'], row['school']) for row in rows], [('부산광역시교육청', '부산컴퓨터과학고등학교')])
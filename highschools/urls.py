@@ -1,10 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import HighSchoolViewSet
+from .views import HighSchoolViewSet, HighSchoolDepartmentViewSet
 
 router = DefaultRouter()
+# 'departments' 를 먼저 등록해야 학교 상세(<pk>/) 패턴에 가로채이지 않습니다.
+router.register(r'departments', HighSchoolDepartmentViewSet, basename='highschool-department')
 router.register(r'', HighSchoolViewSet, basename='highschool')
 
 urlpatterns = [
     path('', include(router.urls)),
-]
\ No newline at end of file
+]
@@ -1,26 +1,80 @@
-from rest_framework import viewsets
+from rest_framework import mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from .models import HighSchool
-from .serializers import HighSchoolSerializer
+from django.db.models import F, Prefetch
+from django.utils.decorators import method_decorator
+from core import renderers, response_cache, versioning
+from universities import matching
+from universities.models import UniversityDepartment
+from universities.serializers import EligibleDepartmentSerializer
+from .models import HighSchool, HighSchoolDepartment
+from .pagination import HighSchoolRowCursorPagination
+from .serializers import HighSchoolSerializer, HighSchoolDepartmentSerializer, HighSchoolRowSerializer
 
+
+_regions = None  # (데이터 버전, 교육청 이름 목록)
+
+
+def _all_regions():
+    """등록된 교육청 이름 (특성화고 데이터 버전이 바뀔 때만 다시 읽습니다. 교육청은 20개 미만)"""
+    global _regions
+    version = versioning.get_version(versioning.HIGHSCHOOLS)
+    cached = _regions
+    if cached is None or cached[0] != version:
+        cached = _regions = (version, list(HighSchool.objects.values_list('region', flat=True).distinct()))
+    return cached[1]
+
+
+def matching_regions(region):
+    """
+    지역 검색어 → 교육청 이름 목록
+    그 이름으로 시작하는 교육청(예: '서울' → '서울특별시교육청')이 있으면 그것만,
+    없으면 이름 중간에 들어 있는 교육청(예: '특별시' → '서울특별시교육청')을 돌려줍니다.
+    """
+    regions = _all_regions()
+    return (
+        [name for name in regions if name.startswith(region)]
+        or [name for name in regions if region.casefold() in name.casefold()]
+    )
+
+
+def filter_regions(queryset, regions, field='region'):
+    """교육청 이름 목록(matching_regions 결과)으로 거릅니다. 쿼리를 실행하지 않으므로 async 뷰에서도 씁니다."""
+    return queryset.filter(**{f'{field}__in': regions})
+
+
+def filter_region(queryset, region, field='region'):
+    """
+    지역 필터: 교육청 이름이 검색어로 시작하는 학교, 그런 교육청이 없으면 이름에 검색어가 들어 있는 학교
+    LIKE 대신 교육청 이름 목록(region IN (...))으로 거르므로 region 인덱스를 탑니다.
+    """
+    return filter_regions(queryset, matching_regions(region), field)
+
+@method_decorator(versioning.conditional(versioning.HIGHSCHOOLS), name='dispatch')
+@method_decorator(response_cache.cache_response(versioning.HIGHSCHOOLS), name='dispatch')
 class HighSchoolViewSet(viewsets.ReadOnlyModelViewSet):
     """
     특성화고 및 학과 정보 조회 API
+    - 데이터 버전 ETag 를 붙이고, If-None-Match 가 같으면 304 를 반환합니다. (core/versioning.py)
+    - 같은 조회(지역 필터, regions 포함)는 응답 캐시에서 돌려줍니다. (core/response_cache.py)
+    - [변경] 학과와 기준학과를 prefetch 하므로 학교 수와 상관없이 쿼리 3번입니다.
     """
-    queryset = HighSchool.objects.all()
+    queryset = HighSchool.objects.prefetch_related(
+        Prefetch('departments', queryset=HighSchoolDepartment.objects.prefetch_related('standard_departments'))
+    )
     serializer_class = HighSchoolSerializer
+    renderer_classes = renderers.catalog_renderer_classes()
 
     def get_queryset(self):
         """
         URL 파라미터로 region(교육청)이 들어오면 필터링합니다.
-        예: /api/highschools/?region=서울특별시교육청
+        예: /api/highschools/?region=서울특별시교육청 (앞부분만 써도 됩니다: ?region=서울, 없으면 이름 중간 일치: ?region=특별시)
         """
         queryset = super().get_queryset()
-        region = self.request.query_params.get('region')
-        
+        region = self.request.query_params.get('region', '').strip()
+
         if region:
-            queryset = queryset.filter(region__contains=region)
+            queryset = filter_region(queryset, region)
         return queryset
 
     @action(detail=False, methods=['get'])
@@ -31,4 +85,60 @@ class HighSchoolViewSet(viewsets.ReadOnlyModelViewSet):
         URL: /api/highschools/regions/
         """
         regions = HighSchool.objects.values_list('region', flat=True).distinct().order_by('region')
-        return Response(list(regions))
\ No newline at end of file
+        return Response(list(regions))
+
+    @action(detail=False, methods=['get'], pagination_class=HighSchoolRowCursorPagination)
+    def rows(self, request):
+        """
+        [신규] 학교-학과를 한 줄씩 펼친 목록 (커서 페이지네이션)
+        URL: /api/highschools/rows/?region=서울교육청&school=선린&department=소프트웨어&standard=정보&page_size=100
+        - 모든 필터는 선택이며, school/department/standard 는 부분 일치입니다.
+        - 페이지당 쿼리 2번 (학과+학교, 기준학과)
+        """
+        params = request.query_params
+        queryset = HighSchoolDepartment.objects.select_related('school').prefetch_related(
+            'standard_departments'
+        ).annotate(school_name=F('school__name'))
+
+        region = params.get('region', '').strip()
+        if region:
+            queryset = filter_region(queryset, region, field='school__region')
+        if school := params.get('school', '').strip():
+            queryset = queryset.filter(school__name__icontains=school)
+        if department := params.get('department', '').strip():
+            queryset = queryset.filter(name__icontains=department)
+        if standard := params.get('standard', '').strip():
+            queryset = queryset.filter(pk__in=HighSchoolDepartment.objects.filter(
+                standard_departments__name__icontains=standard
+            ).values('pk'))
+
+        page = self.paginate_queryset(queryset)
+        serializer = HighSchoolRowSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+@method_decorator(versioning.conditional(versioning.HIGHSCHOOLS, versioning.UNIVERSITIES), name='dispatch')
+class HighSchoolDepartmentViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """
+    특성화고 개별 학과 조회 API
+    GET /api/highschools/departments/<id>/
+    """
+    queryset = HighSchoolDepartment.objects.prefetch_related('standard_departments')
+    serializer_class = HighSchoolDepartmentSerializer
+
+    @action(detail=True, methods=['get'])
+    def eligible(self, request, pk=None):
+        """
+        이 학과 학생이 지원 가능한 대학 학과 목록을 반환합니다.
+        (기준학과 역색인 기반: universities/matching.py)
+        URL: /api/highschools/departments/<id>/eligible/
+        """
+        department = self.get_object()
+        standard_ids = [std.id for std in department.standard_departments.all()]
+        dept_ids = matching.eligible_department_ids(standard_ids)
+
+        departments = UniversityDepartment.objects.filter(pk__in=dept_ids).select_related(
+            'division__university'
+        ).order_by('division__university__name', 'division__name', 'name')
+        serializer = EligibleDepartmentSerializer(departments, many=True)
+        return Response(serializer.data)
@@ -46,6 +46,7 @@ class AdmissionResultInline(admin.StackedInline):
 class UniversityDepartmentAdmin(admin.ModelAdmin):
     list_display = ['get_university', 'division', 'name', 'recruitment_group']
     list_filter = ['division__university', 'recruitment_group', 'division']
+    list_select_related = ['division__university']  # get_university 가 행마다 대학을 조회하지 않도록
     search_fields = ['name', 'division__university__name']
     
     # [핵심 2] 계열 선택(division)을 긴 드롭다운 대신 '검색 상자'로 변경
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UniversitiesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'universities'
+
+    def ready(self):
+        # 캐시/역색인 무효화용 시그널 연결
+        from . import signals  # noqa: F401
@@ -0,0 +1,178 @@
+"""
+학과 최종 모집 정보(DepartmentEffectiveInfo) 갱신
+
+UniversityDepartment.compute_final_info 와 같은 규칙(비워두면 계열 설정 사용)을
+학과 묶음 단위로 계산해서 한 번의 bulk upsert 로 저장합니다.
+- 읽기 쿼리 3번 (학과+계열, 학과 기준학과, 계열 기준학과) + 쓰기 1번 (배치)
+- 계열을 수정하면 소속 학과 전체가 한 번에 갱신됩니다.
+"""
+from django.db.models import Q
+from django.dispatch import Signal
+from collections import defaultdict
+from .models import UniversityDivision, UniversityDepartment, DepartmentEffectiveInfo
+
+# 갱신이 끝난 뒤 발생합니다. (department_ids: 갱신된 학과 id 목록)
+effective_info_changed = Signal()
+
+BATCH_SIZE = 500
+REFRESH_CHUNK_SIZE = 5000
+
+_UPDATE_FIELDS = [
+    'recruitment_group',
+    'korean_score', 'math_score', 'inquiry_score',
+    'english_method', 'english_grade_points',
+    'naesin_reflection_score',
+    'standard_ids', 'standard_names',
+]
+
+
+def _standards_by_owner(through, owner_field, owner_subquery):
+    """through 테이블에서 소유자(학과/계열) id → [(기준학과 id, 이름), ...]"""
+    result = defaultdict(list)
+    rows = through.objects.filter(**{f'{owner_field}__in': owner_subquery}).order_by('standarddepartment_id').values_list(
+        owner_field, 'standarddepartment_id', 'standarddepartment__name'
+    )
+    for owner_id, std_id, std_name in rows:
+        result[owner_id].append((std_id, std_name))
+    return result
+
+
+def resolve(department, own_standards, division_standards):
+    """학과 1개의 최종 정보를 계산합니다. (DB 접근 없음, department.division 은 미리 로드되어 있어야 함)"""
+    division = department.division
+
+    def pick(value, default):
+        return value if value is not None else default
+
+    # 내 설정이 하나라도 있으면 내 것 사용, 없으면 계열 것 사용
+    standards = own_standards or division_standards
+
+    return DepartmentEffectiveInfo(
+        department_id=department.id,
+        recruitment_group=department.recruitment_group,
+        korean_score=pick(department.korean_score, division.korean_score),
+        math_score=pick(department.math_score, division.math_score),
+        inquiry_score=pick(department.inquiry_score, division.inquiry_score),
+        english_method=department.english_method or division.english_method,
+        english_grade_points=pick(department.english_grade_points, division.english_grade_points),
+        naesin_reflection_score=pick(department.naesin_reflection_score, division.naesin_reflection_score),
+        standard_ids=[std_id for std_id, _ in standards],
+        standard_names=[name for _, name in standards],
+    )
+
+
+def refresh(queryset):
+    """queryset 에 해당하는 학과들의 최종 정보를 다시 계산해 저장하고, 갱신된 학과 수를 반환합니다."""
+    departments = list(queryset.select_related('division'))
+    if not departments:
+        return 0
+
+    own = _standards_by_owner(
+        UniversityDepartment.eligible_standard_departments.through,
+        'universitydepartment_id',
+        queryset.values('id'),
+    )
+    division_own = _standards_by_owner(
+        UniversityDivision.eligible_standard_departments.through,
+        'universitydivision_id',
+        queryset.values('division_id'),
+    )
+
+    records = [resolve(d, own.get(d.id), division_own.get(d.division_id, [])) for d in departments]
+    DepartmentEffectiveInfo.objects.bulk_create(
+        records,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['department'],
+        update_fields=_UPDATE_FIELDS,
+    )
+
+    effective_info_changed.send(sender=DepartmentEffectiveInfo, department_ids=[d.id for d in departments])
+    return len(records)
+
+
+def refresh_departments(department_ids):
+    return refresh(UniversityDepartment.objects.filter(pk__in=list(department_ids)))
+
+
+def refresh_divisions(division_ids):
+    """계열 수정 시: 소속 학과 전체를 한 번에 갱신합니다."""
+    return refresh(UniversityDepartment.objects.filter(division_id__in=list(division_ids)))
+
+
+def departments_using_standard(standard_id):
+    """기준학과를 (직접 또는 계열을 통해) 참조하는 학과"""
+    return UniversityDepartment.objects.filter(
+        Q(eligible_standard_departments=standard_id) | Q(division__eligible_standard_departments=standard_id)
+    ).distinct()
+
+
+def refresh_standard(standard_id):
+    """기준학과 이름 변경 시: 해당 기준학과를 참조하는 학과만 갱신합니다."""
+    return refresh(departments_using_standard(standard_id))
+
+
+def refresh_all(chunk_size=REFRESH_CHUNK_SIZE):
+    """전체 학과를 id 순서로 chunk_size 개씩 나눠 갱신합니다. (학과 수와 상관없이 메모리 사용량 일정)"""
+    ids = UniversityDepartment.objects.order_by('pk').values_list('pk', flat=True)
+    total, last_id = 0, None
+    while True:
+        chunk = list((ids if last_id is None else ids.filter(pk__gt=last_id))[:chunk_size])
+        if not chunk:
+            return total
+        total += refresh(UniversityDepartment.objects.filter(pk__gte=chunk[0], pk__lte=chunk[-1]))
+        last_id = chunk[-1]
+
+
+def resolve_many(departments):
+    """
+    학과 목록의 최종 정보를 한 번에 해석합니다. → {학과 id: get_final_info 형식 dict}
+    - select_related 등으로 이미 읽어온 effective_info 는 그대로 사용하고,
+    - 나머지는 저장된 레코드를 한 번에 읽습니다.
+    - 레코드가 아직 없는 학과만 기준학과 through 테이블을 2번 조회해 즉석에서 계산합니다. (저장하지 않음)
+    """
+    descriptor = UniversityDepartment.effective_info
+    infos = {}
+    unloaded, missing = [], []
+
+    for dept in departments:
+        if descriptor.is_cached(dept):
+            record = descriptor.related.get_cached_value(dept)
+            if record is not None:
+                infos[dept.id] = record.as_final_info()
+            else:
+                missing.append(dept)
+        else:
+            unloaded.append(dept)
+
+    if unloaded:
+        records = DepartmentEffectiveInfo.objects.in_bulk([d.id for d in unloaded])
+        for dept in unloaded:
+            if dept.id in records:
+                infos[dept.id] = records[dept.id].as_final_info()
+            else:
+                missing.append(dept)
+
+    if missing:
+        # 소속 계열이 아직 로드되지 않은 학과는 계열을 한 번에 읽어 붙입니다.
+        division_field = UniversityDepartment._meta.get_field('division')
+        need_division = [d for d in missing if not division_field.is_cached(d)]
+        if need_division:
+            divisions = UniversityDivision.objects.in_bulk({d.division_id for d in need_division})
+            for dept in need_division:
+                dept.division = divisions[dept.division_id]
+
+        own = _standards_by_owner(
+            UniversityDepartment.eligible_standard_departments.through,
+            'universitydepartment_id',
+            [d.id for d in missing],
+        )
+        division_own = _standards_by_owner(
+            UniversityDivision.eligible_standard_departments.through,
+            'universitydivision_id',
+            {d.division_id for d in missing},
+        )
+        for dept in missing:
+            infos[dept.id] = resolve(dept, own.get(dept.id), division_own.get(dept.division_id, [])).as_final_info()
+
+    return infos
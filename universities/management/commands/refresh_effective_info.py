@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from universities import effective_info
+
+
+class Command(BaseCommand):
+    help = "모든 학과의 최종 모집 정보(DepartmentEffectiveInfo)를 다시 계산합니다. (bulk 로드 후 사용)"
+
+    def handle(self, *args, **options):
+        count = effective_info.refresh_all()
+        self.stdout.write(self.style.SUCCESS(f"✅ {count}개 학과의 최종 모집 정보를 갱신했습니다."))
@@ -0,0 +1,33 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from universities.simulation import RosterError, read_roster_file, simulate
+
+
+class Command(BaseCommand):
+    help = "학생 명단 CSV 로 전체 학과 환산 점수/작년 입결 비교 결과를 학생별 순위 CSV 로 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('roster', help="학생 명단 CSV (student_id, korean, math, inquiry, english[, naesin, highschool_department])")
+        parser.add_argument('-o', '--output', help="결과 CSV 경로 (생략하면 표준 출력)")
+        parser.add_argument('--top', type=int, default=None, help="학생별 상위 N개 학과만 기록")
+        parser.add_argument('--eligible-only', action='store_true', help="지원 가능한 학과만 기록 (고교 학과가 있는 학생)")
+        parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본: settings.SIMULATION_WORKERS 또는 CPU 수)")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['roster'], 'rb') as f:
+                students = read_roster_file(f)
+        except OSError as e:
+            raise CommandError(f"❌ 명단 파일을 열 수 없습니다: {e}")
+        except RosterError as e:
+            raise CommandError(f"❌ 명단 형식 오류: {e}")
+
+        chunks = simulate(students, top=options['top'], eligible_only=options['eligible_only'], workers=options['workers'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8-sig', newline='') as out:
+                for chunk in chunks:
+                    out.write(chunk)
+            self.stderr.write(self.style.SUCCESS(f"✅ 학생 {len(students)}명 시뮬레이션 완료 → {options['output']}"))
+        else:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
@@ -0,0 +1,57 @@
+"""
+지원 가능 학과 매칭 엔진
+
+기준학과(StandardDepartment) → 지원 가능한 대학 학과(UniversityDepartment) 역색인을
+프로세스 메모리에 미리 만들어 둡니다.
+- 학과에 기준학과 예외 설정이 없으면 소속 계열의 목록을 사용합니다. (DepartmentEffectiveInfo 에 이미 반영됨)
+- 조회는 고교 학과의 기준학과들에 대한 집합 합집합이므로 전체 카탈로그 크기와 무관합니다.
+- 학과 최종 정보가 바뀌면 signals.py 에서 invalidate() 를 호출해 다음 조회 때 다시 만듭니다.
+- 다른 프로세스에서 바뀐 경우는 데이터 버전(core/versioning.py)이 달라진 것을 보고 다시 만듭니다.
+"""
+import threading
+from collections import defaultdict
+
+from core import versioning
+from .models import DepartmentEffectiveInfo
+
+_lock = threading.Lock()
+_index = None  # (만들 때의 데이터 버전, 역색인)
+
+
+def _build_index():
+    """저장된 학과 최종 정보(DepartmentEffectiveInfo)에서 쿼리 1번으로 전체 역색인을 만듭니다."""
+    index = defaultdict(set)
+    for dept_id, standard_ids in DepartmentEffectiveInfo.objects.values_list('department_id', 'standard_ids'):
+        for std_id in standard_ids:
+            index[std_id].add(dept_id)
+
+    return {std_id: frozenset(dept_ids) for std_id, dept_ids in index.items()}
+
+
+def get_index():
+    """기준학과 id → 지원 가능 대학 학과 id 집합"""
+    global _index
+    version = versioning.get_version(versioning.UNIVERSITIES)
+    cached = _index
+    if cached is None or cached[0] != version:
+        with _lock:
+            if _index is None or _index[0] != version:
+                _index = (version, _build_index())
+            cached = _index
+    return cached[1]
+
+
+def invalidate(**kwargs):
+    """역색인을 버립니다. (시그널 receiver 로도 그대로 사용)"""
+    global _index
+    with _lock:
+        _index = None
+
+
+def eligible_department_ids(standard_ids):
+    """기준학과 id 들로 지원 가능한 대학 학과 id 집합을 구합니다."""
+    index = get_index()
+    result = set()
+    for std_id in standard_ids:
+        result |= index.get(std_id, frozenset())
+    return result
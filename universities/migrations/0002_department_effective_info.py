@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:26
+
+import django.db.models.deletion
+from collections import defaultdict
+from django.db import migrations, models
+
+
+def backfill_effective_info(apps, schema_editor):
+    """기존 학과들의 최종 모집 정보를 채웁니다. (universities/effective_info.py 와 같은 규칙)"""
+    UniversityDepartment = apps.get_model('universities', 'UniversityDepartment')
+    UniversityDivision = apps.get_model('universities', 'UniversityDivision')
+    DepartmentEffectiveInfo = apps.get_model('universities', 'DepartmentEffectiveInfo')
+
+    def standards_by_owner(through, owner_field):
+        result = defaultdict(list)
+        rows = through.objects.order_by('standarddepartment_id').values_list(owner_field, 'standarddepartment_id', 'standarddepartment__name')
+        for owner_id, std_id, std_name in rows:
+            result[owner_id].append((std_id, std_name))
+        return result
+
+    own = standards_by_owner(UniversityDepartment.eligible_standard_departments.through, 'universitydepartment_id')
+    division_own = standards_by_owner(UniversityDivision.eligible_standard_departments.through, 'universitydivision_id')
+
+    def pick(value, default):
+        return value if value is not None else default
+
+    records = []
+    for dept in UniversityDepartment.objects.select_related('division'):
+        div = dept.division
+        standards = own.get(dept.id) or division_own.get(dept.division_id, [])
+        records.append(DepartmentEffectiveInfo(
+            department_id=dept.id,
+            recruitment_group=dept.recruitment_group,
+            korean_score=pick(dept.korean_score, div.korean_score),
+            math_score=pick(dept.math_score, div.math_score),
+            inquiry_score=pick(dept.inquiry_score, div.inquiry_score),
+            english_method=dept.english_method or div.english_method,
+            english_grade_points=pick(dept.english_grade_points, div.english_grade_points),
+            naesin_reflection_score=pick(dept.naesin_reflection_score, div.naesin_reflection_score),
+            standard_ids=[std_id for std_id, _ in standards],
+            standard_names=[name for _, name in standards],
+        ))
+    DepartmentEffectiveInfo.objects.bulk_create(records, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universities', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentEffectiveInfo',
+            fields=[
+                ('department', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='effective_info', serialize=False, to='universities.universitydepartment', verbose_name='학과')),
+                ('recruitment_group', models.CharField(max_length=10, verbose_name='모집군')),
+                ('korean_score', models.FloatField(verbose_name='국어 반영 점수')),
+                ('math_score', models.FloatField(verbose_name='수학 반영 점수')),
+                ('inquiry_score', models.FloatField(verbose_name='탐구 반영 점수')),
+                ('english_method', models.CharField(max_length=10, verbose_name='영어 반영방식')),
+                ('english_grade_points', models.JSONField(blank=True, null=True, verbose_name='영어 등급별 점수표')),
+                ('naesin_reflection_score', models.FloatField(verbose_name='내신 반영 점수')),
+                ('standard_ids', models.JSONField(default=list, verbose_name='지원 가능 기준학과 id')),
+                ('standard_names', models.JSONField(default=list, verbose_name='지원 가능 기준학과')),
+            ],
+            options={
+                'verbose_name': '학과 최종 모집 정보',
+                'verbose_name_plural': '학과 최종 모집 정보 목록',
+            },
+        ),
+        migrations.RunPython(backfill_effective_info, migrations.RunPython.noop),
+    ]
@@ -101,8 +101,15 @@ class UniversityDepartment(models.Model):
         return f"{self.division.university.name} {self.name} ({self.recruitment_group})"
 
     # [핵심] 최종 정보 판단 로직
+    # 저장된 DepartmentEffectiveInfo 를 우선 사용하고, 아직 없으면 즉석에서 계산합니다.
     @property
     def get_final_info(self):
+        try:
+            return self.effective_info.as_final_info()
+        except DepartmentEffectiveInfo.DoesNotExist:
+            return self.compute_final_info()
+
+    def compute_final_info(self):
         # 1. 수능 점수
         kor = self.korean_score if self.korean_score is not None else self.division.korean_score
         mat = self.math_score if self.math_score is not None else self.division.math_score
@@ -130,6 +137,46 @@ class UniversityDepartment(models.Model):
         }
 
 
+class DepartmentEffectiveInfo(models.Model):
+    """
+    학과별 최종 모집 정보 (계열 설정까지 반영된 값을 미리 저장)
+    - get_final_info 를 매번 계산하지 않도록 학과당 1행으로 비정규화합니다.
+    - universities/effective_info.py 에서만 갱신합니다. (학과/계열 저장 및 M2M 변경 시그널)
+    """
+    department = models.OneToOneField(UniversityDepartment, on_delete=models.CASCADE, primary_key=True, related_name='effective_info', verbose_name="학과")
+    recruitment_group = models.CharField(max_length=10, verbose_name="모집군")
+
+    korean_score = models.FloatField(verbose_name="국어 반영 점수")
+    math_score = models.FloatField(verbose_name="수학 반영 점수")
+    inquiry_score = models.FloatField(verbose_name="탐구 반영 점수")
+
+    english_method = models.CharField(max_length=10, verbose_name="영어 반영방식")
+    english_grade_points = models.JSONField(null=True, blank=True, verbose_name="영어 등급별 점수표")
+
+    naesin_reflection_score = models.FloatField(verbose_name="내신 반영 점수")
+
+    # 기준학과 (id 는 매칭 역색인용, 이름은 응답용)
+    standard_ids = models.JSONField(default=list, verbose_name="지원 가능 기준학과 id")
+    standard_names = models.JSONField(default=list, verbose_name="지원 가능 기준학과")
+
+    class Meta:
+        verbose_name = "학과 최종 모집 정보"
+        verbose_name_plural = "학과 최종 모집 정보 목록"
+
+    def __str__(self):
+        return f"{self.department_id} 최종 정보"
+
+    def as_final_info(self):
+        """UniversityDepartment.compute_final_info 와 같은 형식으로 반환합니다."""
+        return {
+            "group": self.recruitment_group,
+            "standards": list(self.standard_names),
+            "scores": {"korean": self.korean_score, "math": self.math_score, "inquiry": self.inquiry_score},
+            "english": {"method": self.english_method, "points": self.english_grade_points},
+            "naesin": self.naesin_reflection_score
+        }
+
+
 class AdmissionResult(models.Model):
     department = models.ForeignKey(UniversityDepartment, on_delete=models.CASCADE, related_name='admission_results', verbose_name="학과")
     year = models.IntegerField(verbose_name="학년도")
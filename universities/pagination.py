@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class UniversityCursorPagination(CursorPagination):
+    """
+    대학 목록 커서 페이지네이션 (선택)
+    예: /api/universities/?page_size=50  →  응답의 next 링크(cursor=...)로 다음 페이지 조회
+    page_size 나 cursor 를 보낸 요청만 {next, previous, results} 형식으로 나눠 보냅니다.
+    둘 다 없으면 기존 클라이언트를 위해 전체 목록을 배열 그대로 보냅니다.
+    """
+    ordering = 'id'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def is_requested(self, request):
+        return self.page_size_query_param in request.query_params or self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
@@ -0,0 +1,143 @@
+"""
+환산 점수 계산 엔진 (NumPy)
+
+모든 학과의 최종 반영 점수(DepartmentEffectiveInfo)를 배열로 한 번 묶어 두고,
+학생 성적이 들어오면 학과 수와 상관없이 배열 연산 몇 번으로 전체 학과 점수를 구합니다.
+
+환산 점수 = 국어 백분위 × 국어 반영 점수 / 100
+          + 수학 백분위 × 수학 반영 점수 / 100
+          + 탐구 백분위 × 탐구 반영 점수 / 100
+          ± 영어 등급별 점수표[영어 등급]      (ADD: 가산, SUB: 감점)
+          + 내신 반영 점수 × (9 - 내신 등급) / 8   (1등급 만점, 9등급 0점 / 내신 미입력 시 0)
+
+학과 정보가 바뀌면 signals.py 에서 invalidate() 를 호출해 다음 계산 때 다시 만듭니다.
+다른 프로세스에서 바뀐 경우는 데이터 버전(core/versioning.py)이 달라진 것을 보고 다시 만듭니다.
+"""
+import threading
+import numpy as np
+
+ENGLISH_GRADES = 9
+NAESIN_WORST_GRADE = 9
+
+_lock = threading.Lock()
+_table = None  # (만들 때의 데이터 버전, ScoreTable)
+
+
+class ScoreTable:
+    """
+    학과별 반영 정보 배열 (N = 학과 수)
+    - weights: (N, 3) 국어/수학/탐구 반영 점수
+    - english: (N, 10) 영어 등급별 점수 (0번 열은 사용하지 않음), 감점 방식은 음수로 저장
+    - naesin: (N,) 내신 반영 점수
+    """
+
+    def __init__(self, department_ids, weights, english, naesin, labels=None):
+        self.department_ids = department_ids
+        self.weights = weights
+        self.english = english
+        self.naesin = naesin
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.department_ids)
+
+    @classmethod
+    def build(cls):
+        # 모델은 여기서 임포트합니다. (배치 시뮬레이션 워커 프로세스는 Django 없이 이 모듈을 사용)
+        from .models import DepartmentEffectiveInfo
+
+        rows = list(DepartmentEffectiveInfo.objects.order_by('department_id').values_list(
+            'department_id', 'korean_score', 'math_score', 'inquiry_score',
+            'english_method', 'english_grade_points', 'naesin_reflection_score',
+            'department__name', 'recruitment_group',
+            'department__division__name', 'department__division__university__name',
+        ))
+        n = len(rows)
+        department_ids = np.empty(n, dtype=np.int64)
+        weights = np.zeros((n, 3), dtype=np.float64)
+        english = np.zeros((n, ENGLISH_GRADES + 1), dtype=np.float64)
+        naesin = np.zeros(n, dtype=np.float64)
+        labels = []
+
+        for i, (dept_id, kor, mat, inq, eng_m, eng_p, nae, name, group, division, university) in enumerate(rows):
+            department_ids[i] = dept_id
+            weights[i] = (kor, mat, inq)
+            sign = -1.0 if eng_m == 'SUB' else 1.0
+            for grade, points in (eng_p or {}).items():
+                try:
+                    grade = int(grade)
+                except (TypeError, ValueError):
+                    continue
+                if 1 <= grade <= ENGLISH_GRADES and points is not None:
+                    english[i, grade] = sign * float(points)
+            naesin[i] = nae
+            labels.append({
+                'id': dept_id,
+                'university': university,
+                'division': division,
+                'name': name,
+                'recruitment_group': group,
+            })
+
+        return cls(department_ids, weights, english, naesin, labels)
+
+    def arrays_only(self):
+        """학과 표시 정보(labels)를 뺀 사본 (워커 프로세스로 보낼 때 사용)"""
+        return ScoreTable(self.department_ids, self.weights, self.english, self.naesin)
+
+    def score_matrix(self, korean, math, inquiry, english_grade, naesin_grade=None):
+        """
+        학생 S명 × 학과 N개 환산 점수 행렬 (S, N)
+        - korean/math/inquiry: 백분위 (S,)
+        - english_grade: 영어 등급 1~9 (S,)
+        - naesin_grade: 내신 등급 1.0~9.0 (S,), NaN 이면 내신 미반영
+        """
+        percentiles = np.column_stack([korean, math, inquiry]).astype(np.float64)
+        english_grade = np.clip(np.asarray(english_grade, dtype=np.int64), 1, ENGLISH_GRADES)
+
+        scores = percentiles @ self.weights.T / 100.0
+        scores += self.english[:, english_grade].T
+
+        if naesin_grade is not None:
+            naesin_grade = np.asarray(naesin_grade, dtype=np.float64)
+            ratio = np.nan_to_num((NAESIN_WORST_GRADE - naesin_grade) / (NAESIN_WORST_GRADE - 1))
+            scores += np.outer(ratio, self.naesin)
+        return scores
+
+    def score(self, korean, math, inquiry, english_grade, naesin_grade=None):
+        """학생 1명 → 학과별 환산 점수 (N,)"""
+        naesin = None if naesin_grade is None else [naesin_grade]
+        return self.score_matrix([korean], [math], [inquiry], [english_grade], naesin)[0]
+
+    def ranked(self, scores, limit=None):
+        """점수 높은 순 (학과 정보 + 점수) 목록"""
+        return [{**self.labels[i], 'score': round(float(scores[i]), 2)} for i in top_indices(scores, limit)]
+
+
+def top_indices(scores, limit=None):
+    """점수 높은 순 인덱스 (limit 이 있으면 상위 limit 개만 부분 정렬)"""
+    if limit is not None and limit < len(scores):
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        return top[np.argsort(-scores[top], kind='stable')]
+    return np.argsort(-scores, kind='stable')
+
+
+def get_table():
+    global _table
+    from core import versioning
+
+    version = versioning.get_version(versioning.UNIVERSITIES)
+    cached = _table
+    if cached is None or cached[0] != version:
+        with _lock:
+            if _table is None or _table[0] != version:
+                _table = (version, ScoreTable.build())
+            cached = _table
+    return cached[1]
+
+
+def invalidate(**kwargs):
+    """점수 배열을 버립니다. (시그널 receiver 로도 그대로 사용)"""
+    global _table
+    with _lock:
+        _table = None
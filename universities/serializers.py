@@ -1,27 +1,57 @@
 from rest_framework import serializers
 from .models import University, UniversityDivision, UniversityDepartment, AdmissionResult
 
+
+class ExpandableFieldsMixin:
+    """
+    context['expand'] 에 없는 중첩 관계 필드를 응답에서 뺍니다.
+    - expandable_fields: {필드명: expand 경로}  (예: 'divisions.departments')
+    - context['expand'] 가 None 이면 전체를 그대로 보여줍니다. (기존 동작)
+    """
+    expandable_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expand = self.context.get('expand')
+        if expand is not None:
+            for name, path in self.expandable_fields.items():
+                if path not in expand:
+                    fields.pop(name, None)
+        return fields
+
+
 class AdmissionResultSerializer(serializers.ModelSerializer):
     average_percentile = serializers.FloatField(read_only=True)
     class Meta:
         model = AdmissionResult
         fields = ['year', 'recruit_count', 'average_percentile', 'korean_grade', 'korean_percentile', 'math_grade', 'math_percentile', 'english_grade', 'inquiry_grade', 'inquiry_percentile']
 
-class UniversityDepartmentSerializer(serializers.ModelSerializer):
+class UniversityDepartmentSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     admission_history = AdmissionResultSerializer(many=True, source='admission_results', read_only=True)
-    final_recruitment_info = serializers.ReadOnlyField(source='get_final_info')
+    final_recruitment_info = serializers.SerializerMethodField()
     class Meta:
         model = UniversityDepartment
         fields = ['id', 'name', 'recruitment_group', 'final_recruitment_info', 'admission_history']
 
-class UniversityDivisionSerializer(serializers.ModelSerializer):
+    expandable_fields = {'admission_history': 'divisions.departments.admission_history'}
+
+    def get_final_recruitment_info(self, obj):
+        # ViewSet 에서 effective_info.resolve_many 로 미리 해석한 값이 있으면 사용 (학과당 추가 쿼리 없음)
+        final_infos = self.context.get('final_infos')
+        if final_infos is not None and obj.id in final_infos:
+            return final_infos[obj.id]
+        return obj.get_final_info
+
+class UniversityDivisionSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     departments = UniversityDepartmentSerializer(many=True, read_only=True)
     eligible_standard_departments = serializers.StringRelatedField(many=True)
     class Meta:
         model = UniversityDivision
         fields = ['id', 'name', 'eligible_standard_departments', 'korean_score', 'math_score', 'inquiry_score', 'english_method', 'english_grade_points', 'naesin_reflection_score', 'departments']
 
-class UniversitySerializer(serializers.ModelSerializer):
+    expandable_fields = {'departments': 'divisions.departments'}
+
+class UniversitySerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     divisions = UniversityDivisionSerializer(many=True, read_only=True)
     
     # [신규] 로고 이미지 URL 처리
@@ -29,4 +59,40 @@ class UniversitySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = University
-        fields = ['id', 'name', 'logo_image', 'divisions']
\ No newline at end of file
+        fields = ['id', 'name', 'logo_image', 'divisions']
+
+    expandable_fields = {'divisions': 'divisions'}
+
+    def get_fields(self):
+        # ?fields=id,name 처럼 최상위(대학) 필드만 골라 받을 수 있습니다.
+        fields = super().get_fields()
+        only = self.context.get('fields')
+        if only is not None:
+            fields = {name: field for name, field in fields.items() if name in only}
+        return fields
+
+class EligibleDepartmentSerializer(serializers.ModelSerializer):
+    # [신규] 지원 가능 학과 매칭 결과용 (대학/계열명을 평탄화해서 반환)
+    university = serializers.CharField(source='division.university.name', read_only=True)
+    division = serializers.CharField(source='division.name', read_only=True)
+
+    class Meta:
+        model = UniversityDepartment
+        fields = ['id', 'university', 'division', 'name', 'recruitment_group']
+
+
+class ScoreRequestSerializer(serializers.Serializer):
+    # [신규] 환산 점수 계산 요청 (백분위 0~100, 영어 등급 1~9, 내신 등급 1.0~9.0)
+    korean = serializers.FloatField(min_value=0, max_value=100)
+    math = serializers.FloatField(min_value=0, max_value=100)
+    inquiry = serializers.FloatField(min_value=0, max_value=100)
+    english = serializers.IntegerField(min_value=1, max_value=9)
+    naesin = serializers.FloatField(min_value=1, max_value=9, required=False)
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+
+class SimulationRequestSerializer(serializers.Serializer):
+    # [신규] 배치 시뮬레이션 요청 (학생 명단 CSV 업로드)
+    roster = serializers.FileField()
+    top = serializers.IntegerField(min_value=1, required=False)
+    eligible_only = serializers.BooleanField(default=False)
@@ -0,0 +1,123 @@
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from highschools.models import StandardDepartment
+from core import changelog, versioning
+from .models import University, UniversityDivision, UniversityDepartment, DepartmentEffectiveInfo, AdmissionResult
+from . import effective_info, matching, scoring
+
+M2M_ACTIONS = ('post_add', 'post_remove', 'post_clear')
+
+
+# -----------------------------------------------------------
+# 1. 학과 최종 모집 정보(DepartmentEffectiveInfo) 재계산
+# -----------------------------------------------------------
+def department_saved(sender, instance, **kwargs):
+    effective_info.refresh_departments([instance.pk])
+
+
+def division_saved(sender, instance, **kwargs):
+    # 계열 수정은 소속 학과 전체로 한 번에 퍼집니다.
+    effective_info.refresh_divisions([instance.pk])
+
+
+def department_standards_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if not reverse:
+        effective_info.refresh_departments([instance.pk])
+    elif pk_set:
+        # 기준학과 쪽에서 학과를 추가/제거한 경우 (instance 는 StandardDepartment)
+        effective_info.refresh_departments(pk_set)
+    else:
+        effective_info.refresh_all()
+
+
+def division_standards_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if not reverse:
+        effective_info.refresh_divisions([instance.pk])
+    elif pk_set:
+        effective_info.refresh_divisions(pk_set)
+    else:
+        effective_info.refresh_all()
+
+
+def standard_saved(sender, instance, created, **kwargs):
+    # 새 기준학과는 아직 아무 학과와도 연결되지 않았으므로 이름 변경일 때만 갱신
+    if not created:
+        effective_info.refresh_standard(instance.pk)
+
+
+def standard_deleting(sender, instance, **kwargs):
+    # 연결(through) 행이 m2m_changed 없이 함께 지워지므로, 지우기 전에 영향받는 학과를 기억해 둡니다.
+    instance._effective_info_department_ids = list(
+        effective_info.departments_using_standard(instance.pk).values_list('pk', flat=True)
+    )
+
+
+def standard_deleted(sender, instance, **kwargs):
+    department_ids = getattr(instance, '_effective_info_department_ids', None)
+    if department_ids is None:
+        effective_info.refresh_all()  # pre_delete 를 거치지 않은 경우
+    elif department_ids:
+        effective_info.refresh_departments(department_ids)
+
+
+post_save.connect(department_saved, sender=UniversityDepartment, dispatch_uid='effective_info_department_saved')
+post_save.connect(division_saved, sender=UniversityDivision, dispatch_uid='effective_info_division_saved')
+m2m_changed.connect(
+    department_standards_changed,
+    sender=UniversityDepartment.eligible_standard_departments.through,
+    dispatch_uid='effective_info_department_standards',
+)
+m2m_changed.connect(
+    division_standards_changed,
+    sender=UniversityDivision.eligible_standard_departments.through,
+    dispatch_uid='effective_info_division_standards',
+)
+post_save.connect(standard_saved, sender=StandardDepartment, dispatch_uid='effective_info_standard_saved')
+pre_delete.connect(standard_deleting, sender=StandardDepartment, dispatch_uid='effective_info_standard_deleting')
+post_delete.connect(standard_deleted, sender=StandardDepartment, dispatch_uid='effective_info_standard_deleted')
+
+
+# -----------------------------------------------------------
+# 2. 지원 가능 학과 역색인 무효화 (최종 정보가 바뀌거나 학과가 삭제될 때)
+# -----------------------------------------------------------
+effective_info.effective_info_changed.connect(matching.invalidate, dispatch_uid='matching_effective_info_changed')
+post_delete.connect(matching.invalidate, sender=UniversityDepartment, dispatch_uid='matching_department_deleted')
+
+
+# -----------------------------------------------------------
+# 3. 환산 점수 배열 무효화 (점수표에 대학/학과명도 들어 있으므로 대학 수정 시에도)
+# -----------------------------------------------------------
+effective_info.effective_info_changed.connect(scoring.invalidate, dispatch_uid='scoring_effective_info_changed')
+post_delete.connect(scoring.invalidate, sender=UniversityDepartment, dispatch_uid='scoring_department_deleted')
+post_save.connect(scoring.invalidate, sender=University, dispatch_uid='scoring_university_saved')
+
+
+# -----------------------------------------------------------
+# 4. 데이터 버전 (ETag) 올리기
+# -----------------------------------------------------------
+versioning.connect(versioning.UNIVERSITIES, University, UniversityDivision, UniversityDepartment, AdmissionResult)
+
+
+def effective_info_refreshed(**kwargs):
+    # refresh_effective_info 명령처럼 시그널 없이 다시 계산한 경우도 응답이 바뀌므로 버전을 올립니다.
+    versioning.bump(versioning.UNIVERSITIES)
+
+
+effective_info.effective_info_changed.connect(effective_info_refreshed, dispatch_uid='data_version_effective_info')
+
+
+# -----------------------------------------------------------
+# 5. 델타 동기화용 변경 기록 (core/changelog.py)
+# -----------------------------------------------------------
+changelog.connect(University, UniversityDivision, UniversityDepartment, DepartmentEffectiveInfo, AdmissionResult)
+
+
+def effective_info_logged(department_ids, **kwargs):
+    # 최종 정보는 bulk upsert 로 저장되므로(시그널 없음) 갱신된 학과를 직접 기록합니다.
+    changelog.record_many(DepartmentEffectiveInfo, department_ids)
+
+
+effective_info.effective_info_changed.connect(effective_info_logged, dispatch_uid='changelog_effective_info')
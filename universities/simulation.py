@@ -0,0 +1,211 @@
+"""
+배치 지원 시뮬레이션 (학생 명단 CSV × 전체 학과)
+
+학급 명단 CSV 를 받아 학생마다 전체 학과의 환산 점수(scoring.py)를 계산하고,
+작년 입결(AdmissionResult) 평균 백분위와 비교한 결과를 학생별 순위 CSV 로 내보냅니다.
+- 학생 × 학과 점수 행렬은 학생 묶음(shard) 단위로 프로세스 풀에서 나눠 계산합니다.
+- 결과는 shard 순서대로 바로 흘려보내므로(스트리밍) 전체 결과를 메모리에 쌓지 않습니다.
+
+입력 CSV 컬럼
+    student_id, korean, math, inquiry, english  (필수: 백분위 3개 + 영어 등급)
+    naesin                 (선택: 내신 등급)
+    highschool_department  (선택: 고교 학과 id, 있으면 지원 가능 여부를 함께 표시)
+"""
+import csv
+import io
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from .scoring import top_indices
+
+REQUIRED_COLUMNS = ['student_id', 'korean', 'math', 'inquiry', 'english']
+OUTPUT_COLUMNS = [
+    'student_id', 'rank', 'department_id', 'university', 'division', 'department', 'recruitment_group',
+    'score', 'student_percentile', 'last_year_percentile', 'margin', 'eligible',
+]
+SHARD_SIZE = 32
+
+
+class RosterError(ValueError):
+    """명단 CSV 형식 오류"""
+
+
+def read_roster(lines):
+    """CSV 텍스트 줄 → 학생 목록"""
+    reader = csv.DictReader(lines)
+    fieldnames = [name.strip() for name in (reader.fieldnames or [])]
+    reader.fieldnames = fieldnames
+    missing = [c for c in REQUIRED_COLUMNS if c not in fieldnames]
+    if missing:
+        raise RosterError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    students = []
+    for line_no, row in enumerate(reader, start=2):
+        try:
+            naesin = (row.get('naesin') or '').strip()
+            hs_dept = (row.get('highschool_department') or '').strip()
+            students.append({
+                'student_id': row['student_id'].strip(),
+                'korean': float(row['korean']),
+                'math': float(row['math']),
+                'inquiry': float(row['inquiry']),
+                'english': int(row['english']),
+                'naesin': float(naesin) if naesin else math.nan,
+                'highschool_department': int(hs_dept) if hs_dept else None,
+            })
+        except (AttributeError, TypeError, ValueError) as e:
+            raise RosterError(f"{line_no}행 값 오류: {e}")
+    return students
+
+
+def read_roster_file(uploaded):
+    """업로드 파일/바이너리 파일 → 학생 목록 (UTF-8, BOM 허용)"""
+    return read_roster(io.TextIOWrapper(uploaded, encoding='utf-8-sig', newline=''))
+
+
+# -----------------------------------------------------------
+# Django 쪽 준비 (메인 프로세스에서만 실행)
+# -----------------------------------------------------------
+def last_year_percentiles(department_ids):
+    """학과별 가장 최근 학년도 입결 평균 백분위 (department_ids 순서, 없으면 NaN)"""
+    from django.db.models import OuterRef, Subquery
+    from .models import AdmissionResult
+
+    latest_year = AdmissionResult.objects.filter(department=OuterRef('department')).order_by('-year').values('year')[:1]
+    rows = AdmissionResult.objects.filter(year=Subquery(latest_year)).values_list(
+        'department_id', 'korean_percentile', 'math_percentile', 'inquiry_percentile'
+    )
+    position = {dept_id: i for i, dept_id in enumerate(department_ids.tolist())}
+    cutoffs = np.full(len(department_ids), np.nan)
+    for dept_id, *percentiles in rows:
+        valid = [p for p in percentiles if p is not None]
+        if valid and dept_id in position:
+            cutoffs[position[dept_id]] = sum(valid) / len(valid)
+    return cutoffs
+
+
+def eligible_positions(students, department_ids):
+    """고교 학과 id → 지원 가능한 학과의 (점수 배열) 위치"""
+    from highschools.models import HighSchoolDepartment
+    from . import matching
+
+    hs_ids = {s['highschool_department'] for s in students if s['highschool_department'] is not None}
+    standards = defaultdict(list)
+    through = HighSchoolDepartment.standard_departments.through
+    for hs_id, std_id in through.objects.filter(highschooldepartment_id__in=hs_ids).values_list(
+        'highschooldepartment_id', 'standarddepartment_id'
+    ):
+        standards[hs_id].append(std_id)
+
+    positions = {}
+    for hs_id in hs_ids:
+        dept_ids = np.fromiter(matching.eligible_department_ids(standards[hs_id]), dtype=np.int64)
+        positions[hs_id] = np.flatnonzero(np.isin(department_ids, dept_ids))
+    return positions
+
+
+# -----------------------------------------------------------
+# 점수 계산 (워커 프로세스, Django 사용 안 함)
+# -----------------------------------------------------------
+_worker_table = None
+_worker_cutoffs = None
+
+
+def _init_worker(table, cutoffs):
+    global _worker_table, _worker_cutoffs
+    _worker_table = table
+    _worker_cutoffs = cutoffs
+
+
+def _score_shard(shard, top, eligible_only):
+    """
+    shard: (백분위 (S, 3), 영어 등급 (S,), 내신 등급 (S,), 학생별 지원 가능 위치 목록)
+    반환: 학생별 (학과 위치, 점수, 작년 백분위, 지원 가능 여부)
+    """
+    percentiles, english, naesin, eligible = shard
+    scores = _worker_table.score_matrix(percentiles[:, 0], percentiles[:, 1], percentiles[:, 2], english, naesin)
+
+    results = []
+    for row, positions in zip(scores, eligible):
+        if eligible_only and positions is not None:
+            picked = positions[top_indices(row[positions], top)]
+        else:
+            picked = top_indices(row, top)
+        flags = np.isin(picked, positions) if positions is not None else None
+        results.append((picked, row[picked], _worker_cutoffs[picked], flags))
+    return results
+
+
+def _format_number(value):
+    return '' if value is None or math.isnan(value) else f'{value:.2f}'
+
+
+def simulate(students, top=None, eligible_only=False, workers=None, shard_size=SHARD_SIZE):
+    """
+    결과 CSV 를 조각(str) 단위로 생성합니다. (StreamingHttpResponse / 파일 쓰기에 그대로 사용)
+    - top: 학생별 상위 몇 개 학과까지 쓸지 (None 이면 전체)
+    - eligible_only: 고교 학과가 있는 학생은 지원 가능한 학과만
+    - workers: 프로세스 수 (1 이면 프로세스 풀 없이 현재 프로세스에서 계산)
+    """
+    from django.conf import settings
+    from . import scoring
+
+    table = scoring.get_table()
+    cutoffs = last_year_percentiles(table.department_ids)
+    positions = eligible_positions(students, table.department_ids)
+
+    shards = []
+    for start in range(0, len(students), shard_size):
+        chunk = students[start:start + shard_size]
+        shards.append((
+            np.array([[s['korean'], s['math'], s['inquiry']] for s in chunk], dtype=np.float64).reshape(-1, 3),
+            np.array([s['english'] for s in chunk], dtype=np.int64),
+            np.array([s['naesin'] for s in chunk], dtype=np.float64),
+            [positions.get(s['highschool_department']) for s in chunk],
+        ))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(OUTPUT_COLUMNS)
+    yield flush()
+
+    workers = workers or getattr(settings, 'SIMULATION_WORKERS', None) or os.cpu_count() or 1
+    workers = min(workers, len(shards)) or 1
+    if workers == 1:
+        _init_worker(table.arrays_only(), cutoffs)
+        shard_results = map(_score_shard, shards, repeat(top), repeat(eligible_only))
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(table.arrays_only(), cutoffs))
+        shard_results = pool.map(_score_shard, shards, repeat(top), repeat(eligible_only))
+
+    try:
+        offset = 0
+        for results in shard_results:
+            for student, (picked, scores, last_year, flags) in zip(students[offset:], results):
+                student_pct = (student['korean'] + student['math'] + student['inquiry']) / 3
+                for rank, (pos, score, cutoff) in enumerate(zip(picked.tolist(), scores.tolist(), last_year.tolist()), start=1):
+                    label = table.labels[pos]
+                    writer.writerow([
+                        student['student_id'], rank, label['id'], label['university'], label['division'],
+                        label['name'], label['recruitment_group'], _format_number(score),
+                        _format_number(student_pct), _format_number(cutoff), _format_number(student_pct - cutoff),
+                        '' if flags is None else ('Y' if flags[rank - 1] else 'N'),
+                    ])
+                yield flush()
+            offset += len(results)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
@@ -1,3 +1,310 @@
+import json
+from unittest import mock
+
 from django.test import TestCase
+from core import binary_formats
+from highschools.models import HighSchool, HighSchoolDepartment, StandardDepartment
+from .models import University, UniversityDivision, UniversityDepartment, DepartmentEffectiveInfo, AdmissionResult
+from . import effective_info, matching, scoring
+from .simulation import read_roster, simulate
+
+
+class EligibilityMatchingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.std_it = StandardDepartment.objects.create(name='정보컴퓨터과')
+        cls.std_biz = StandardDepartment.objects.create(name='경영·사무과')
+
+        univ = University.objects.create(name='경희대학교')
+        cls.division = UniversityDivision.objects.create(university=univ, name='사회계열')
+        cls.division.eligible_standard_departments.add(cls.std_biz)
+
+        # 계열 설정을 그대로 따르는 학과
+        cls.dept_default = UniversityDepartment.objects.create(division=cls.division, name='행정학과')
+        # 기준학과 예외 설정이 있는 학과
+        cls.dept_override = UniversityDepartment.objects.create(division=cls.division, name='빅데이터응용학과')
+        cls.dept_override.eligible_standard_departments.add(cls.std_it)
+
+        school = HighSchool.objects.create(region='서울특별시교육청', name='선린인터넷고등학교')
+        cls.hs_dept = HighSchoolDepartment.objects.create(school=school, name='소프트웨어과')
+        cls.hs_dept.standard_departments.add(cls.std_it)
+
+    def setUp(self):
+        matching.invalidate()
+
+    def test_division_fallback(self):
+        self.assertEqual(matching.eligible_department_ids([self.std_biz.id]), {self.dept_default.id})
+        self.assertEqual(matching.eligible_department_ids([self.std_it.id]), {self.dept_override.id})
+
+    def test_index_rebuilt_after_m2m_change(self):
+        matching.get_index()
+        self.division.eligible_standard_departments.add(self.std_it)
+        self.assertEqual(
+            matching.eligible_department_ids([self.std_it.id]),
+            {self.dept_default.id, self.dept_override.id},
+        )
+
+    def test_eligible_endpoint(self):
+        response = self.client.get(f'/api/highschools/departments/{self.hs_dept.id}/eligible/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([d['name'] for d in response.json()], ['빅데이터응용학과'])
+        self.assertEqual(response.json()[0]['university'], '경희대학교')
+
+
+class EffectiveInfoTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.std = StandardDepartment.objects.create(name='회계세무과')
+        univ = University.objects.create(name='동국대학교')
+        cls.division = UniversityDivision.objects.create(
+            university=univ, name='인문계열', korean_score=35, math_score=25, inquiry_score=25,
+            english_grade_points={'1': 200, '2': 199},
+        )
+        cls.division.eligible_standard_departments.add(cls.std)
+        cls.dept = UniversityDepartment.objects.create(division=cls.division, name='경영학과', math_score=40)
+
+    def test_record_matches_computed_info(self):
+        dept = UniversityDepartment.objects.get(pk=self.dept.pk)
+        self.assertEqual(dept.effective_info.as_final_info(), dept.compute_final_info())
+        self.assertEqual(dept.get_final_info['scores'], {'korean': 35, 'math': 40, 'inquiry': 25})
+        self.assertEqual(dept.get_final_info['standards'], ['회계세무과'])
+
+    def test_division_edit_fans_out(self):
+        self.division.korean_score = 50
+        self.division.save()
+        self.std.name = '회계·세무과'
+        self.std.save()
+        info = DepartmentEffectiveInfo.objects.get(department=self.dept)
+        self.assertEqual(info.korean_score, 50)
+        self.assertEqual(info.math_score, 40)
+        self.assertEqual(info.standard_names, ['회계·세무과'])
+
+    def test_standard_delete_refreshes_referencing_departments_only(self):
+        other_std = StandardDepartment.objects.create(name='관광·레저과')
+        other = UniversityDepartment.objects.create(
+            division=UniversityDivision.objects.create(university=self.division.university, name='자연계열'),
+            name='관광학과',
+        )
+        other.eligible_standard_departments.add(other_std)
+
+        with mock.patch('universities.effective_info.refresh_all') as refresh_all, \
+                mock.patch('universities.effective_info.refresh', wraps=effective_info.refresh) as refresh:
+            self.std.delete()
+        refresh_all.assert_not_called()
+        refreshed = list(refresh.call_args.args[0].values_list('pk', flat=True))
+        self.assertEqual(refreshed, [self.dept.pk])
+        self.assertEqual(DepartmentEffectiveInfo.objects.get(department=self.dept).standard_names, [])
+        self.assertEqual(DepartmentEffectiveInfo.objects.get(department=other).standard_names, ['관광·레저과'])
+
+
+class UniversityCatalogQueryCountTests(TestCase):
+    """/api/universities/ 쿼리 수가 카탈로그 크기와 무관하게 일정한지 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.std = StandardDepartment.objects.create(name='정보컴퓨터과')
+
+    def make_catalog(self, n_universities, start=0):
+        for u in range(start, start + n_universities):
+            univ = University.objects.create(name=f'대학{u}')
+            for v in range(2):
+                division = UniversityDivision.objects.create(university=univ, name=f'계열{v}')
+                division.eligible_standard_departments.add(self.std)
+                for d in range(3):
+                    dept = UniversityDepartment.objects.create(division=division, name=f'학과{d}')
+                    AdmissionResult.objects.create(department=dept, year=2025, korean_percentile=90)
+
+    def assert_constant_queries(self, expected):
+        self.make_catalog(1)
+        with self.assertNumQueries(expected):
+            self.client.get('/api/universities/')
+        self.make_catalog(5, start=1)
+        with self.assertNumQueries(expected):
+            response = self.client.get('/api/universities/')
+        self.assertEqual(len(response.json()), 6)
+        return response
+
+    def test_query_count_is_constant(self):
+        # 대학, 계열, 계열 기준학과, 학과+최종정보, 입결
+        response = self.assert_constant_queries(5)
+        dept = response.json()[0]['divisions'][0]['departments'][0]
+        self.assertEqual(dept['final_recruitment_info']['standards'], ['정보컴퓨터과'])
+
+    def test_missing_records_resolved_in_batch(self):
+        # 최종 정보 레코드가 없는 학과도 through 테이블 2번 조회로 한꺼번에 계산합니다.
+        self.make_catalog(1)
+        DepartmentEffectiveInfo.objects.all().delete()
+        with self.assertNumQueries(7):
+            self.client.get('/api/universities/')
+        self.make_catalog(5, start=1)
+        DepartmentEffectiveInfo.objects.all().delete()
+        with self.assertNumQueries(7):
+            response = self.client.get('/api/universities/')
+        dept = response.json()[-1]['divisions'][0]['departments'][0]
+        self.assertEqual(dept['final_recruitment_info']['standards'], ['정보컴퓨터과'])
+
+    def test_sparse_fields_and_expand(self):
+        self.make_catalog(3)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/universities/?fields=id,name')
+        self.assertEqual(set(response.json()[0]), {'id', 'name'})
+
+        # 입결(admission_history) 제외 → 입결 prefetch 도 하지 않습니다.
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/universities/?expand=divisions.departments')
+        dept = response.json()[0]['divisions'][0]['departments'][0]
+        self.assertNotIn('admission_history', dept)
+        self.assertIn('final_recruitment_info', dept)
+
+    def test_cursor_pagination(self):
+        self.make_catalog(3)
+        response = self.client.get('/api/universities/?fields=name&page_size=2')
+        self.assertEqual([u['name'] for u in response.json()['results']], ['대학0', '대학1'])
+        response = self.client.get(response.json()['next'])
+        self.assertEqual([u['name'] for u in response.json()['results']], ['대학2'])
+        # page_size/cursor 가 없으면 기존과 같은 배열 응답
+        self.assertEqual([u['name'] for u in self.client.get('/api/universities/?fields=name').json()], ['대학0', '대학1', '대학2'])
+
+    @mock.patch('core.streaming.CHUNK_SIZE', 2)
+    def test_streaming_list(self):
+        self.make_catalog(3)
+        expected = self.client.get('/api/universities/').json()
+        response = self.client.get('/api/universities/?stream=1')
+        self.assertTrue(response.streaming)
+        # 대학 목록 1번 + 묶음(2곳)마다 계열, 계열 기준학과, 학과+최종정보, 입결 4번
+        with self.assertNumQueries(9):
+            body = b''.join(response.streaming_content)
+        self.assertEqual(json.loads(body), expected)
+
+    def decode_dictionary_layout(self, payload):
+        strings, tables = payload['strings'], payload['tables']
+        string_fields, table_fields = set(payload['string_fields']), set(payload['table_fields'])
+
+        def decode(node):
+            if isinstance(node, list):
+                return [decode(item) for item in node]
+            if not isinstance(node, dict):
+                return node
+            return {
+                key: None if value is None
+                else tables[value] if key in table_fields and isinstance(value, int)
+                else ([strings[i] for i in value] if isinstance(value, list) else strings[value]) if key in string_fields
+                else decode(value)
+                for key, value in node.items()
+            }
+        return decode(payload['data'])
+
+    def test_dictionary_layout(self):
+        self.make_catalog(3)
+        UniversityDivision.objects.update(english_grade_points={'1': 100, '2': 95})
+        expected = self.client.get('/api/universities/').json()
+        for kwargs in ({'data': {'layout': 'dict'}}, {'HTTP_ACCEPT': 'application/json; layout=dict'}):
+            payload = self.client.get('/api/universities/', **kwargs).json()
+            # 기준학과명, 계열명, 점수표는 사전에 한 번씩만 들어갑니다.
+            self.assertEqual(payload['strings'].count('정보컴퓨터과'), 1)
+            self.assertEqual(payload['tables'], [{'1': 100, '2': 95}])
+            self.assertIn('recruitment_group', payload['string_fields'])
+            self.assertEqual(self.decode_dictionary_layout(payload), expected)
+
+    def test_binary_formats(self):
+        self.make_catalog(2)
+        UniversityDivision.objects.update(english_grade_points={'1': 100, '2': 95.5})
+        expected = self.client.get('/api/universities/').json()
+        for media_type, loads in (
+            ('application/msgpack', binary_formats.msgpack_loads),
+            ('application/cbor', binary_formats.cbor_loads),
+        ):
+            response = self.client.get('/api/universities/', {'format': media_type.split('/')[1]})
+            self.assertEqual(response['Content-Type'], media_type)
+            self.assertEqual(loads(response.content), expected)
+            response = self.client.get('/api/universities/', HTTP_ACCEPT=f'{media_type}; layout=dict')
+            self.assertEqual(self.decode_dictionary_layout(loads(response.content)), expected)
+
+    def test_binary_encoders_round_trip(self):
+        value = {
+            'ints': [0, 127, 128, -1, -32, -33, 255, 65536, -2**31, 2**63 - 1, -2**63],
+            'floats': [0.5, -1e300], 'flags': [True, False, None],
+            'text': ['', '정보컴퓨터과', 'x' * 300], 'map': {str(i): i for i in range(20)}, 'list': list(range(20)),
+        }
+        self.assertEqual(binary_formats.msgpack_loads(binary_formats.msgpack_dumps(value)), value)
+        self.assertEqual(binary_formats.cbor_loads(binary_formats.cbor_dumps(value)), value)
+        # 표준 예시 (MessagePack 명세, RFC 8949 Appendix A)
+        self.assertEqual(binary_formats.msgpack_dumps({'compact': True, 'schema': 0}).hex(), '82a7636f6d70616374c3a6736368656d6100')
+        self.assertEqual(binary_formats.cbor_dumps([1, [2, 3], {'a': -1000}]).hex(), '8301820203a161613903e7')
+
+
+class ScoringTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        univ = University.objects.create(name='세종대학교')
+        division = UniversityDivision.objects.create(
+            university=univ, name='인문계열', korean_score=30, math_score=30, inquiry_score=20,
+            english_grade_points={'1': 200, '2': 195, '3': 190}, naesin_reflection_score=40,
+        )
+        cls.add = UniversityDepartment.objects.create(division=division, name='경영학부')
+        cls.sub = UniversityDepartment.objects.create(
+            division=division, name='호텔관광외식경영학부', english_method='SUB',
+            english_grade_points={'1': 0, '2': 5, '3': 10},
+        )
+
+    def setUp(self):
+        scoring.invalidate()
+
+    def test_converted_scores(self):
+        table = scoring.get_table()
+        scores = dict(zip(table.department_ids.tolist(), table.score(90, 80, 70, 2, naesin_grade=3).tolist()))
+        # 27 + 24 + 14 = 65 (수능) / 내신 40 × (9 - 3) / 8 = 30
+        self.assertAlmostEqual(scores[self.add.id], 65 + 195 + 30)
+        self.assertAlmostEqual(scores[self.sub.id], 65 - 5 + 30)
+
+    def test_scores_endpoint(self):
+        response = self.client.get('/api/universities/scores/', {'korean': 90, 'math': 80, 'inquiry': 70, 'english': 2})
+        self.assertEqual([d['name'] for d in response.json()], ['경영학부', '호텔관광외식경영학부'])
+        self.assertEqual(response.json()[0]['score'], 260.0)
+
+
+class SimulationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        std = StandardDepartment.objects.create(name='정보컴퓨터과')
+        univ = University.objects.create(name='서강대학교')
+        division = UniversityDivision.objects.create(
+            university=univ, name='자연계열', korean_score=40, math_score=40, inquiry_score=20,
+        )
+        cls.cs = UniversityDepartment.objects.create(division=division, name='컴퓨터공학과')
+        cls.cs.eligible_standard_departments.add(std)
+        cls.math = UniversityDepartment.objects.create(division=division, name='수학과', math_score=60)
+        AdmissionResult.objects.create(department=cls.cs, year=2024, korean_percentile=70, math_percentile=70, inquiry_percentile=70)
+        AdmissionResult.objects.create(department=cls.cs, year=2025, korean_percentile=90, math_percentile=80, inquiry_percentile=85)
+
+        school = HighSchool.objects.create(region='서울특별시교육청', name='선린인터넷고등학교')
+        cls.hs_dept = HighSchoolDepartment.objects.create(school=school, name='소프트웨어과')
+        cls.hs_dept.standard_departments.add(std)
+
+    def setUp(self):
+        matching.invalidate()
+        scoring.invalidate()
+
+    def run_simulation(self, **kwargs):
+        students = read_roster([
+            'student_id,korean,math,inquiry,english,highschool_department',
+            f'A,90,90,90,1,{self.hs_dept.id}',
+            'B,80,80,80,1,',
+        ])
+        lines = ''.join(simulate(students, **kwargs)).splitlines()
+        return [line.split(',') for line in lines[1:]]
+
+    def test_ranked_rows_with_last_year_comparison(self):
+        rows = self.run_simulation(workers=1)
+        self.assertEqual([(r[0], r[1], r[5]) for r in rows], [
+            ('A', '1', '수학과'), ('A', '2', '컴퓨터공학과'),
+            ('B', '1', '수학과'), ('B', '2', '컴퓨터공학과'),
+        ])
+        a_cs = rows[1]
+        self.assertEqual(a_cs[9:], ['85.00', '5.00', 'Y'])  # 2025학년도 평균 백분위와 비교
+        self.assertEqual(rows[0][11], 'N')
+        self.assertEqual(rows[2][11], '')  # 고교 학과 미입력
 
-# Create your tests here.
+    def test_process_pool_and_eligible_only(self):
+        rows = self.run_simulation(workers=2, shard_size=1, eligible_only=True)
+        self.assertEqual([(r[0], r[5]) for r in rows], [('A', '컴퓨터공학과'), ('B', '수학과'), ('B', '컴퓨터공학과')])
@@ -1,22 +1,181 @@
 from rest_framework import viewsets
-from .models import University
-from .serializers import UniversitySerializer
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from django.db.models import Prefetch
+from django.utils.decorators import method_decorator
+from .models import University, UniversityDepartment
+from .serializers import UniversitySerializer, ScoreRequestSerializer, SimulationRequestSerializer
+from .pagination import UniversityCursorPagination
+from .effective_info import resolve_many
+from . import scoring
+from .simulation import RosterError, read_roster_file, simulate
+from core import renderers, response_cache, streaming, versioning
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
+# expand 파라미터로 고를 수 있는 중첩 관계 (바깥쪽부터 순서대로)
+EXPAND_PATHS = ['divisions', 'divisions.departments', 'divisions.departments.admission_history']
+
+
+def _parse_csv_param(request, name):
+    """'a,b,c' 형식 쿼리 파라미터 → set (파라미터가 없으면 None)"""
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+# -----------------------------------------------------------
+# 대학 카탈로그 직렬화 (UniversityViewSet 과 비동기 API core/async_views.py 가 같이 사용)
+# -----------------------------------------------------------
+def catalog_expand(request):
+    """요청된 fields/expand 를 합쳐 실제로 펼칠 경로 집합을 구합니다."""
+    fields = _parse_csv_param(request, 'fields')
+    expand = _parse_csv_param(request, 'expand')
+    if expand is None:
+        expand = set(EXPAND_PATHS)
+    else:
+        # 'divisions.departments' 를 요청하면 상위 'divisions' 도 함께 펼칩니다.
+        expand = {path for path in EXPAND_PATHS if any(req == path or req.startswith(path + '.') for req in expand)}
+    if fields is not None and 'divisions' not in fields:
+        expand = set()
+    return expand
+
+
+def catalog_prefetches(expand):
+    """
+    요청된(expand) 관계만 prefetch 합니다.
+    대학 -> 계열(divisions) -> 학과(departments) -> 입결(admission_results) 순서로 접근
+    """
+    prefetches = []
+    if 'divisions' in expand:
+        prefetches.append('divisions__eligible_standard_departments')
+    if 'divisions.departments' in expand:
+        # 학과 최종 정보는 DepartmentEffectiveInfo 에 저장된 값을 함께 가져옵니다. (학과당 추가 쿼리 없음)
+        prefetches.append(Prefetch(
+            'divisions__departments',
+            queryset=UniversityDepartment.objects.select_related('effective_info'),
+        ))
+    if 'divisions.departments.admission_history' in expand:
+        prefetches.append('divisions__departments__admission_results')
+    return prefetches
+
+
+def catalog_final_infos(universities):
+    """prefetch 된 대학들의 학과 최종 정보를 resolve_many 로 한 번에 해석합니다. → {학과 id: 최종 정보}"""
+    departments = [
+        dept
+        for university in universities
+        for division in university.divisions.all()
+        for dept in division.departments.all()
+    ]
+    return resolve_many(departments)
+
+
+# 기준학과 이름이 함께 나가므로 특성화고 쪽 버전도 ETag 에 포함합니다.
+@method_decorator(versioning.conditional(versioning.UNIVERSITIES, versioning.HIGHSCHOOLS), name='dispatch')
+@method_decorator(response_cache.cache_response(versioning.UNIVERSITIES, versioning.HIGHSCHOOLS), name='dispatch')
 class UniversityViewSet(viewsets.ReadOnlyModelViewSet):
     """
     대학 입시 정보 전체 조회 API
     GET /api/universities/
+
+    - 커서 페이지네이션(선택): ?page_size=50 을 보내면 {next, previous, results} 형식, 다음 페이지는 next 링크 사용
+      page_size/cursor 가 없으면 전체 대학을 배열로 반환합니다. (페이지네이션 추가 전과 같은 형식)
+    - ?fields=id,name : 대학 필드만 골라서 받기 (divisions 를 빼면 중첩 데이터 없음)
+    - ?expand=divisions.departments : 펼칠 중첩 관계 지정 (예: 입결(admission_history) 제외)
+      expand 를 생략하면 전체 트리를 반환합니다.
+    - ?stream=1 : 페이지 없이 전체 목록을 대학 한 곳씩 스트리밍합니다. (core/streaming.py, 대량 조회용)
+      fields/expand 는 그대로 적용됩니다.
+    - 데이터 버전 ETag/Last-Modified 를 붙이고, If-None-Match 가 같으면 쿼리 없이 304 를 반환합니다. (core/versioning.py)
+    - 같은 조회는 응답 캐시에서 돌려줍니다. (core/response_cache.py, 데이터가 바뀌면 자동으로 새로 만듦)
     """
-    # [수정됨] 데이터베이스 쿼리 최적화 경로 수정
-    # 대학 -> 계열(divisions) -> 학과(departments) -> 입결(admission_results) 순서로 접근
-    queryset = University.objects.all().prefetch_related(
-        'divisions__departments__admission_results'
-    )
-    
+    queryset = University.objects.all()
     serializer_class = UniversitySerializer
+    pagination_class = UniversityCursorPagination
+    renderer_classes = renderers.catalog_renderer_classes()
+
+    def get_expand(self):
+        return catalog_expand(self.request)
+
+    def get_queryset(self):
+        # [수정됨] 데이터베이스 쿼리 최적화 경로 수정 (catalog_prefetches)
+        return super().get_queryset().prefetch_related(*catalog_prefetches(self.get_expand()))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = _parse_csv_param(self.request, 'fields')
+        context['expand'] = self.get_expand()
+        return context
+
+    def get_serializer(self, *args, **kwargs):
+        """
+        직렬화할 대학들의 학과 최종 정보를 resolve_many 로 한 번에 해석해서 context 로 넘깁니다.
+        (목록 크기와 상관없이 쿼리 수가 일정하게 유지됩니다.)
+        """
+        context = self.get_serializer_context()
+        if args and args[0] is not None and 'divisions.departments' in context['expand']:
+            many = kwargs.get('many', False)
+            universities = list(args[0]) if many else [args[0]]
+            context['final_infos'] = catalog_final_infos(universities)
+            args = (universities if many else args[0],) + args[1:]
+        kwargs['context'] = context
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if streaming.is_streaming(request):
+            return streaming.json_stream_response(self.iter_representations(), encoder_class=JSONEncoder)
+        return super().list(request, *args, **kwargs)
+
+    def iter_representations(self):
+        """
+        전체 대학을 CHUNK_SIZE 개씩 (prefetch 포함) 읽어 한 곳씩 직렬화합니다.
+        학과 최종 정보도 묶음마다 resolve_many 로 한 번에 해석하므로 쿼리 수는 묶음 수에만 비례합니다.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by('id')
+        for batch in streaming.iter_batches(queryset.iterator(chunk_size=streaming.CHUNK_SIZE)):
+            serializer = self.get_serializer(batch, many=True)
+            for university in batch:
+                yield serializer.child.to_representation(university)
+
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def scores(self, request):
+        """
+        학생 성적으로 전체 학과의 환산 점수를 계산해 높은 순으로 반환합니다. (universities/scoring.py)
+        URL: /api/universities/scores/?korean=92&math=85&inquiry=88&english=2&naesin=3.5&limit=100
+        """
+        params = ScoreRequestSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        table = scoring.get_table()
+        scores = table.score(data['korean'], data['math'], data['inquiry'], data['english'], data.get('naesin'))
+        return Response(table.ranked(scores, limit=data.get('limit')))
+
+    @action(detail=False, methods=['post'], pagination_class=None, parser_classes=[MultiPartParser])
+    def simulate(self, request):
+        """
+        학생 명단 CSV(roster) × 전체 학과 시뮬레이션 결과를 학생별 순위 CSV 로 스트리밍합니다. (universities/simulation.py)
+        URL: POST /api/universities/simulate/  (multipart: roster=<CSV 파일>, top=20, eligible_only=true)
+        """
+        params = SimulationRequestSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        try:
+            students = read_roster_file(data['roster'])
+        except RosterError as e:
+            raise ValidationError({'roster': [str(e)]})
+
+        response = StreamingHttpResponse(
+            simulate(students, top=data.get('top'), eligible_only=data['eligible_only']),
+            content_type='text/csv; charset=utf-8',
+        )
+        response['Content-Disposition'] = 'attachment; filename="simulation.csv"'
+        return response
 
 def university_info_view(request):
     """대학 정보를 보여주는 페이지를 렌더링합니다."""
-    return HttpResponse("<h1>대학 정보 페이지입니다.</h1>")
\ No newline at end of file
+    return HttpResponse("<h1>대학 정보 페이지입니다.</h1>")